@@ -0,0 +1,26 @@
+"""Add columnar property import source type
+
+Revision ID: 2024_01_03_0000
+Revises: 2024_01_02_0000
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2024_01_03_0000'
+down_revision = '2024_01_02_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block on older PostgreSQL
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE sourcetype ADD VALUE IF NOT EXISTS 'columnar_property'")
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop a single enum value; remove runs that use it instead
+    op.execute("DELETE FROM ingestion_runs WHERE source_type = 'columnar_property'")
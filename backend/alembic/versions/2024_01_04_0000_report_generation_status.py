@@ -0,0 +1,33 @@
+"""Add report generation status and progress
+
+Revision ID: 2024_01_04_0000
+Revises: 2024_01_03_0000
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2024_01_04_0000'
+down_revision = '2024_01_03_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Reports created before background generation are already complete
+    op.add_column('intelligence_reports', sa.Column('status', sa.String(length=20), server_default='completed', nullable=False))
+    op.add_column('intelligence_reports', sa.Column('progress', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('intelligence_reports', sa.Column('started_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('intelligence_reports', sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('intelligence_reports', sa.Column('error_message', sa.Text(), nullable=True))
+    op.execute("UPDATE intelligence_reports SET progress = 100")
+
+
+def downgrade() -> None:
+    op.drop_column('intelligence_reports', 'error_message')
+    op.drop_column('intelligence_reports', 'finished_at')
+    op.drop_column('intelligence_reports', 'started_at')
+    op.drop_column('intelligence_reports', 'progress')
+    op.drop_column('intelligence_reports', 'status')
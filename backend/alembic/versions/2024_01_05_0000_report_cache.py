@@ -0,0 +1,44 @@
+"""Add report result cache
+
+Revision ID: 2024_01_05_0000
+Revises: 2024_01_04_0000
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '2024_01_05_0000'
+down_revision = '2024_01_04_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'report_cache_entries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('geography_id', sa.Integer(), nullable=False),
+        sa.Column('inputs_key', sa.String(length=64), nullable=False),
+        sa.Column('freshness_key', sa.String(length=64), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+        sa.ForeignKeyConstraint(['geography_id'], ['geographies.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('inputs_key')
+    )
+    op.create_index(op.f('ix_report_cache_entries_id'), 'report_cache_entries', ['id'], unique=False)
+    op.create_index(op.f('ix_report_cache_entries_client_id'), 'report_cache_entries', ['client_id'], unique=False)
+    op.create_index(op.f('ix_report_cache_entries_geography_id'), 'report_cache_entries', ['geography_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_cache_entries_geography_id'), table_name='report_cache_entries')
+    op.drop_index(op.f('ix_report_cache_entries_client_id'), table_name='report_cache_entries')
+    op.drop_index(op.f('ix_report_cache_entries_id'), table_name='report_cache_entries')
+    op.drop_table('report_cache_entries')
@@ -0,0 +1,51 @@
+"""Add ZIP demand rollups
+
+Revision ID: 2024_01_06_0000
+Revises: 2024_01_05_0000
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '2024_01_06_0000'
+down_revision = '2024_01_05_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rows are built by DemandRollupService; ZIPs without a row are scored
+    # from households until their first refresh
+    op.create_table(
+        'zip_demand_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('zip_code_id', sa.Integer(), nullable=False),
+        sa.Column('service_category', sa.String(length=50), nullable=False),
+        sa.Column('household_count', sa.Integer(), nullable=False),
+        sa.Column('avg_score', sa.Float(), nullable=False),
+        sa.Column('score_p25', sa.Float(), nullable=True),
+        sa.Column('score_p50', sa.Float(), nullable=True),
+        sa.Column('score_p75', sa.Float(), nullable=True),
+        sa.Column('score_p90', sa.Float(), nullable=True),
+        sa.Column('owner_ratio', sa.Float(), nullable=False),
+        sa.Column('large_lot_ratio', sa.Float(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ),
+        sa.ForeignKeyConstraint(['zip_code_id'], ['zip_codes.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('client_id', 'zip_code_id', 'service_category', name='uq_zip_demand_rollup')
+    )
+    op.create_index(op.f('ix_zip_demand_rollups_id'), 'zip_demand_rollups', ['id'], unique=False)
+    op.create_index(op.f('ix_zip_demand_rollups_client_id'), 'zip_demand_rollups', ['client_id'], unique=False)
+    op.create_index(op.f('ix_zip_demand_rollups_zip_code_id'), 'zip_demand_rollups', ['zip_code_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_zip_demand_rollups_zip_code_id'), table_name='zip_demand_rollups')
+    op.drop_index(op.f('ix_zip_demand_rollups_client_id'), table_name='zip_demand_rollups')
+    op.drop_index(op.f('ix_zip_demand_rollups_id'), table_name='zip_demand_rollups')
+    op.drop_table('zip_demand_rollups')
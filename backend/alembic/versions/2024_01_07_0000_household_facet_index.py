@@ -0,0 +1,32 @@
+"""Add covering household index for geography facet counts
+
+Revision ID: 2024_01_07_0000
+Revises: 2024_01_06_0000
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '2024_01_07_0000'
+down_revision = '2024_01_06_0000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # INCLUDE lets facet counts run as index-only scans per geography
+    op.create_index(
+        'ix_households_client_geography',
+        'households',
+        ['client_id', 'geography_id'],
+        unique=False,
+        postgresql_include=[
+            'zip_code_id', 'property_type', 'ownership_type',
+            'income_band_min', 'income_band_max', 'lot_size_sqft',
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_households_client_geography', table_name='households')
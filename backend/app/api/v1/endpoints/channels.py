@@ -4,16 +4,28 @@ Channel API Endpoints
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.core.pii_guard import assert_no_pii_keys
 from app.models.channel import Channel, ChannelType
+from app.models.geography import Geography
 from app.schemas.channel import ChannelCreate, ChannelResponse
+from datetime import datetime
 import uuid
 
 router = APIRouter()
 
 
+def _mark_channels_refreshed(db: Session, client_id: uuid.UUID, geography_ids: set) -> None:
+    """Channel writes change report channel recommendations, so stamp the geographies"""
+    geography_ids.discard(None)
+    if geography_ids:
+        db.query(Geography).filter(
+            Geography.id.in_(geography_ids),
+            Geography.client_id == client_id
+        ).update({Geography.channels_last_refreshed_at: datetime.utcnow()}, synchronize_session=False)
+
+
 @router.post("/", response_model=ChannelResponse, status_code=201)
 async def create_channel(
     channel: ChannelCreate,
@@ -29,6 +41,7 @@ async def create_channel(
         **channel_data
     )
     db.add(db_channel)
+    _mark_channels_refreshed(db, client_id, {db_channel.geography_id})
     db.commit()
     db.refresh(db_channel)
     return db_channel
@@ -40,7 +53,7 @@ async def list_channels(
     channel_type: Optional[str] = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List channels for current client"""
@@ -104,6 +117,8 @@ async def update_channel(
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
+    previous_geography_id = channel.geography_id
+    
     # Update fields
     update_data = channel_update.model_dump(exclude={"client_id"}, exclude_unset=True)
     # PII guard: validate no PII in input
@@ -111,6 +126,7 @@ async def update_channel(
     for field, value in update_data.items():
         setattr(channel, field, value)
     
+    _mark_channels_refreshed(db, client_id, {previous_geography_id, channel.geography_id})
     db.commit()
     db.refresh(channel)
     return channel
@@ -136,6 +152,7 @@ async def delete_channel(
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
+    _mark_channels_refreshed(db, client_id, {channel.geography_id})
     db.delete(channel)
     db.commit()
     return None
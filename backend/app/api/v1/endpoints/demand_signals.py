@@ -2,19 +2,33 @@
 Demand Signal API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_async_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.core.pii_guard import assert_no_pii_keys
 from app.models.demand_signal import DemandSignal, ServiceCategory, SignalType
+from app.models.geography import Geography
 from app.schemas.demand_signal import DemandSignalCreate, DemandSignalResponse
 import uuid
 
 router = APIRouter()
 
 
+def _mark_census_refreshed(db: Session, client_id: uuid.UUID, signals: List[DemandSignal]) -> None:
+    """Demographic signals change report scores (ZIP boosts), so stamp their geographies"""
+    geography_ids = {s.geography_id for s in signals if s.signal_type == SignalType.DEMOGRAPHIC}
+    geography_ids.discard(None)
+    if geography_ids:
+        db.query(Geography).filter(
+            Geography.id.in_(geography_ids),
+            Geography.client_id == client_id
+        ).update({Geography.census_last_refreshed_at: datetime.utcnow()}, synchronize_session=False)
+
+
 @router.post("/", response_model=DemandSignalResponse)
 async def create_demand_signal(
     signal: DemandSignalCreate,
@@ -28,6 +42,7 @@ async def create_demand_signal(
     signal_data["client_id"] = client_id
     db_signal = DemandSignal(**signal_data)
     db.add(db_signal)
+    _mark_census_refreshed(db, client_id, [db_signal])
     db.commit()
     db.refresh(db_signal)
     return db_signal
@@ -44,56 +59,58 @@ async def list_demand_signals(
     end_date: Optional[datetime] = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List demand signals with optional filters"""
-    query = db.query(DemandSignal).filter(DemandSignal.client_id == client_id)
+    query = select(DemandSignal).where(DemandSignal.client_id == client_id)
     
     if geography_id:
-        query = query.filter(DemandSignal.geography_id == geography_id)
+        query = query.where(DemandSignal.geography_id == geography_id)
     
     if zip_code_id:
-        query = query.filter(DemandSignal.zip_code_id == zip_code_id)
+        query = query.where(DemandSignal.zip_code_id == zip_code_id)
     
     if service_category:
         try:
             ServiceCategory(service_category)
-            query = query.filter(DemandSignal.service_category == service_category)
+            query = query.where(DemandSignal.service_category == service_category)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid service category")
     
     if signal_type:
         try:
             SignalType(signal_type)
-            query = query.filter(DemandSignal.signal_type == signal_type)
+            query = query.where(DemandSignal.signal_type == signal_type)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid signal type")
     
     if is_active is not None:
-        query = query.filter(DemandSignal.is_active == is_active)
+        query = query.where(DemandSignal.is_active == is_active)
     
     if start_date:
-        query = query.filter(DemandSignal.event_start_date >= start_date)
+        query = query.where(DemandSignal.event_start_date >= start_date)
     
     if end_date:
-        query = query.filter(DemandSignal.event_end_date <= end_date)
+        query = query.where(DemandSignal.event_end_date <= end_date)
     
-    signals = query.order_by(DemandSignal.event_start_date.desc()).offset(offset).limit(limit).all()
+    signals = (await db.scalars(
+        query.order_by(DemandSignal.event_start_date.desc()).offset(offset).limit(limit)
+    )).all()
     return signals
 
 
 @router.get("/{signal_id}", response_model=DemandSignalResponse)
 async def get_demand_signal(
     signal_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get a specific demand signal"""
-    signal = db.query(DemandSignal).filter(
+    signal = await db.scalar(select(DemandSignal).where(
         DemandSignal.id == signal_id,
         DemandSignal.client_id == client_id
-    ).first()
+    ))
     if not signal:
         raise HTTPException(status_code=404, detail="Demand signal not found")
     return signal
@@ -115,6 +132,7 @@ async def create_demand_signals_batch(
         db_signals.append(DemandSignal(**s_data))
     
     db.add_all(db_signals)
+    _mark_census_refreshed(db, client_id, db_signals)
     db.commit()
     
     for s in db_signals:
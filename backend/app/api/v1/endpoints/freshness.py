@@ -3,7 +3,7 @@ Data Freshness API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.models.geography import Geography
 import uuid
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/geography/{geography_id}/freshness")
 async def get_geography_freshness(
     geography_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get data freshness timestamps for a geography"""
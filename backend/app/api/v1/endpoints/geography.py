@@ -2,9 +2,11 @@
 Geography API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_async_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.core.pii_guard import assert_no_pii_keys
 from app.models.geography import Geography, ZIPCode, Neighborhood
@@ -43,33 +45,33 @@ async def list_geographies(
     geo_type: Optional[str] = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List geographies for current client"""
-    query = db.query(Geography).filter(Geography.client_id == client_id)
+    query = select(Geography).where(Geography.client_id == client_id)
     
     if state_code:
-        query = query.filter(Geography.state_code == state_code.upper())
+        query = query.where(Geography.state_code == state_code.upper())
     
     if geo_type:
-        query = query.filter(Geography.type == geo_type)
+        query = query.where(Geography.type == geo_type)
     
-    geographies = query.offset(offset).limit(limit).all()
+    geographies = (await db.scalars(query.offset(offset).limit(limit))).all()
     return geographies
 
 
 @router.get("/{geography_id}", response_model=GeographyResponse)
 async def get_geography(
     geography_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get a specific geography"""
-    geography = db.query(Geography).filter(
+    geography = await db.scalar(select(Geography).where(
         Geography.id == geography_id,
         Geography.client_id == client_id
-    ).first()
+    ))
     if not geography:
         raise HTTPException(status_code=404, detail="Geography not found")
     return geography
@@ -78,31 +80,33 @@ async def get_geography(
 @router.get("/{geography_id}/zip-codes", response_model=List[ZIPCodeResponse])
 async def get_geography_zip_codes(
     geography_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get all ZIP codes for a geography"""
-    geography = db.query(Geography).filter(
+    geography_id = await db.scalar(select(Geography.id).where(
         Geography.id == geography_id,
         Geography.client_id == client_id
-    ).first()
-    if not geography:
+    ))
+    if not geography_id:
         raise HTTPException(status_code=404, detail="Geography not found")
     
-    return geography.zip_codes
+    # Explicit query: lazy-loading geography.zip_codes is not allowed on async sessions
+    zip_codes = (await db.scalars(select(ZIPCode).where(ZIPCode.geography_id == geography_id))).all()
+    return zip_codes
 
 
 @router.get("/zip-codes/{zip_code}", response_model=ZIPCodeResponse)
 async def get_zip_code(
     zip_code: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get ZIP code by code string"""
-    zip_obj = db.query(ZIPCode).join(Geography).filter(
+    zip_obj = await db.scalar(select(ZIPCode).join(Geography).where(
         ZIPCode.zip_code == zip_code,
         Geography.client_id == client_id
-    ).first()
+    ))
     if not zip_obj:
         raise HTTPException(status_code=404, detail="ZIP code not found")
     return zip_obj
@@ -114,18 +118,17 @@ async def list_zip_codes(
     geography_id: Optional[int] = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List ZIP codes with optional filters"""
-    query = db.query(ZIPCode).join(Geography).filter(Geography.client_id == client_id)
+    query = select(ZIPCode).join(Geography).where(Geography.client_id == client_id)
     
     if geography_id:
-        query = query.filter(ZIPCode.geography_id == geography_id)
+        query = query.where(ZIPCode.geography_id == geography_id)
     elif state_code:
         # Filter by state
-        query = query.filter(Geography.state_code == state_code.upper())
+        query = query.where(Geography.state_code == state_code.upper())
     
-    zip_codes = query.offset(offset).limit(limit).all()
+    zip_codes = (await db.scalars(query.offset(offset).limit(limit))).all()
     return zip_codes
-
@@ -1,21 +1,40 @@
 """
 Household API Endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_async_read_db, get_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.core.pii_guard import assert_no_pii_keys
-from app.models.household import Household
-from app.schemas.household import HouseholdCreate, HouseholdResponse
+from app.models.geography import Geography
+from app.models.household import Household, OwnershipType, PropertyType
+from app.schemas.household import HouseholdCreate, HouseholdFacetsResponse, HouseholdResponse
+from app.services.household_facets import INCOME_BANDS, LOT_SIZE_BANDS, HouseholdFacets
 from app.services.intelligence_engine import IntelligenceEngine
+from app.services.report_cache import ReportCache, geography_freshness_key
+from app.tasks import refresh_zip_demand_rollups_task
 from app.models.demand_signal import ServiceCategory
+from datetime import datetime
+import hashlib
+import json
 import uuid
 
 router = APIRouter()
 
 
+def _mark_property_refreshed(db: Session, client_id: uuid.UUID, geography_ids: set) -> None:
+    """Household writes change property data, so stamp the geographies (invalidates cached reports)"""
+    geography_ids.discard(None)
+    if geography_ids:
+        db.query(Geography).filter(
+            Geography.id.in_(geography_ids),
+            Geography.client_id == client_id
+        ).update({Geography.property_last_refreshed_at: datetime.utcnow()}, synchronize_session=False)
+
+
 @router.post("/", response_model=HouseholdResponse)
 async def create_household(
     household: HouseholdCreate,
@@ -29,8 +48,11 @@ async def create_household(
     household_data["client_id"] = client_id
     db_household = Household(**household_data)
     db.add(db_household)
+    _mark_property_refreshed(db, client_id, {db_household.geography_id})
     db.commit()
     db.refresh(db_household)
+    if db_household.zip_code_id:
+        refresh_zip_demand_rollups_task.delay(str(client_id), [db_household.zip_code_id])
     return db_household
 
 
@@ -41,36 +63,36 @@ async def list_households(
     neighborhood_id: Optional[int] = Query(None),
     limit: int = Query(100, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List households with optional filters"""
-    query = db.query(Household).filter(Household.client_id == client_id)
+    query = select(Household).where(Household.client_id == client_id)
     
     if geography_id:
-        query = query.filter(Household.geography_id == geography_id)
+        query = query.where(Household.geography_id == geography_id)
     
     if zip_code_id:
-        query = query.filter(Household.zip_code_id == zip_code_id)
+        query = query.where(Household.zip_code_id == zip_code_id)
     
     if neighborhood_id:
-        query = query.filter(Household.neighborhood_id == neighborhood_id)
+        query = query.where(Household.neighborhood_id == neighborhood_id)
     
-    households = query.offset(offset).limit(limit).all()
+    households = (await db.scalars(query.offset(offset).limit(limit))).all()
     return households
 
 
 @router.get("/{household_id}", response_model=HouseholdResponse)
 async def get_household(
     household_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get a specific household"""
-    household = db.query(Household).filter(
+    household = await db.scalar(select(Household).where(
         Household.id == household_id,
         Household.client_id == client_id
-    ).first()
+    ))
     if not household:
         raise HTTPException(status_code=404, detail="Household not found")
     return household
@@ -92,11 +114,16 @@ async def create_households_batch(
         db_households.append(Household(**h_data))
     
     db.add_all(db_households)
+    _mark_property_refreshed(db, client_id, {h.geography_id for h in db_households})
     db.commit()
     
     for h in db_households:
         db.refresh(h)
     
+    zip_code_ids = sorted({h.zip_code_id for h in db_households if h.zip_code_id})
+    if zip_code_ids:
+        refresh_zip_demand_rollups_task.delay(str(client_id), zip_code_ids)
+    
     return db_households
 
 
@@ -107,7 +134,7 @@ async def get_household_demand_scores(
     min_score: float = Query(0.0, ge=0.0, le=100.0),
     limit: int = Query(100, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get households with demand scores for a geography"""
@@ -139,3 +166,68 @@ async def get_household_demand_scores(
         "offset": offset
     }
 
+
+@router.get("/geography/{geography_id}/facets", response_model=HouseholdFacetsResponse)
+def get_household_facets(
+    geography_id: int,
+    request: Request,
+    response: Response,
+    zip_code_id: Optional[int] = Query(None),
+    property_type: Optional[str] = Query(None),
+    ownership_type: Optional[str] = Query(None),
+    income_band: Optional[str] = Query(None),
+    lot_size_band: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    Household counts by property type, ownership type, income band and
+    lot-size band for the households matching the filter
+    Counted in one query and cached until the geography's next data refresh;
+    the ETag changes with the filter and the freshness stamps
+    Sync sessions throughout, so it runs in the threadpool
+    """
+    # Stamps (cache validity and ETag) are read with the counts so a lagging
+    # replica never serves old counts under newer freshness stamps
+    geography = read_db.query(Geography).filter(
+        Geography.id == geography_id,
+        Geography.client_id == client_id
+    ).first()
+    if not geography:
+        raise HTTPException(status_code=404, detail="Geography not found")
+    
+    allowed = {
+        "property_type": {t.value for t in PropertyType},
+        "ownership_type": {t.value for t in OwnershipType},
+        "income_band": set(INCOME_BANDS),
+        "lot_size_band": set(LOT_SIZE_BANDS),
+    }
+    filters = {
+        "zip_code_id": zip_code_id,
+        "property_type": property_type,
+        "ownership_type": ownership_type,
+        "income_band": income_band,
+        "lot_size_band": lot_size_band,
+    }
+    for facet, values in allowed.items():
+        if filters[facet] is not None and filters[facet] not in values:
+            raise HTTPException(status_code=400, detail=f"Invalid {facet}")
+    
+    cache_kind = "household_facets:" + json.dumps(filters, sort_keys=True)
+    etag = '"{}"'.format(hashlib.sha256(
+        f"{geography.id}|{cache_kind}|{geography_freshness_key(geography)}".encode("utf-8")
+    ).hexdigest()[:32])
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    
+    cache = ReportCache(db)
+    payload = cache.get(client_id, geography, "", "", kind=cache_kind)
+    if payload is None:
+        counts = HouseholdFacets(read_db, client_id, geography.id).counts(filters)
+        payload = HouseholdFacetsResponse(geography_id=geography.id, **counts).model_dump()
+        cache.put(client_id, geography, "", "", payload, kind=cache_kind)
+        db.commit()
+    return payload
@@ -3,16 +3,83 @@ CSV Import API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_client_id
-from app.core.file_storage import save_uploaded_file
+from app.core.file_storage import is_allowed_upload, save_upload_stream, delete_file, UploadSizeLimitRoute, UploadTooLargeError, COLUMNAR_EXTENSIONS
 from app.services.csv_import import CSVImportService
+from app.services.columnar_import import ColumnarImportService
 from app.models.ingestion import IngestionRun, SourceType, IngestionStatus
-from app.tasks import import_csv_property_task, import_csv_events_task, import_csv_channels_task
+from app.tasks import (
+    import_csv_property_task,
+    import_columnar_property_task,
+    import_csv_events_task,
+    import_csv_channels_task,
+)
 import uuid
 from datetime import datetime
+from typing import Optional, Callable
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
+
+
+async def _save_upload(file: UploadFile, default_filename: str) -> dict:
+    """Stream the upload to disk, mapping size-limit violations to 413"""
+    try:
+        return await save_upload_stream(file, file.filename or default_filename)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+
+
+def _find_previous_import(
+    db: Session,
+    client_id: uuid.UUID,
+    geography_id: int,
+    source_type: SourceType,
+    file_ref: str
+) -> Optional[IngestionRun]:
+    """
+    Find a successful earlier import of identical content
+    File refs are content hashes, so equal refs mean equal files
+    """
+    return db.query(IngestionRun).filter(
+        IngestionRun.client_id == client_id,
+        IngestionRun.geography_id == geography_id,
+        IngestionRun.source_type == source_type,
+        IngestionRun.status == IngestionStatus.SUCCESS,
+        IngestionRun.file_ref == file_ref
+    ).order_by(IngestionRun.finished_at.desc()).first()
+
+
+def _previous_import_response(previous_run: IngestionRun, file_ref: str, geography_id: int) -> dict:
+    """Release this upload's file reference and point the caller at the earlier run"""
+    delete_file(file_ref)
+    return {
+        "ingestion_run_id": str(previous_run.id),
+        "status": previous_run.status.value,
+        "geography_id": geography_id,
+        "duplicate": True
+    }
+
+
+async def _validate_upload(validate: Callable[[str], int], file_ref: str) -> None:
+    """
+    Validate a stored upload for PII, removing it if rejected
+    The scan reads the whole file, so it runs in the threadpool
+    """
+    try:
+        # This will raise ValueError if PII is detected
+        await run_in_threadpool(validate, file_ref)
+    except ValueError as e:
+        # PII detected - reject the import
+        delete_file(file_ref)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 @router.post("/property")
@@ -40,27 +107,23 @@ async def import_property_csv(
         )
     
     # Validate file type
-    if not file.filename or not file.filename.endswith(('.csv', '.txt')):
+    if not is_allowed_upload(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only CSV files are allowed"
+            detail="Only CSV files (optionally .gz or .zst compressed) are allowed"
         )
     
-    # Read and save file
-    content = await file.read()
-    file_ref = save_uploaded_file(content, file.filename or "property.csv")
+    # Stream file to disk
+    stored = await _save_upload(file, "property.csv")
+    file_ref = stored["file_ref"]
+    
+    # Identical file already imported for this geography: skip reprocessing
+    previous_run = _find_previous_import(db, client_id, geography_id, SourceType.CSV_PROPERTY, file_ref)
+    if previous_run:
+        return _previous_import_response(previous_run, file_ref, geography_id)
     
     # Validate CSV for PII before queuing
-    try:
-        import_service = CSVImportService(db, client_id)
-        # This will raise ValueError if PII is detected
-        rows = import_service.parse_csv_file(file_ref)
-    except ValueError as e:
-        # PII detected - reject the import
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    await _validate_upload(CSVImportService(db, client_id).validate_csv_file, file_ref)
     
     # Create ingestion run
     ingestion_run = IngestionRun(
@@ -85,6 +148,67 @@ async def import_property_csv(
     }
 
 
+@router.post("/property/columnar")
+async def import_property_columnar(
+    geography_id: int = Query(...),
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    Import property Parquet or Arrow IPC (Feather) file
+    Column names are validated for PII from the file schema before queuing
+    """
+    from app.models.geography import Geography
+    geography = db.query(Geography).filter(
+        Geography.id == geography_id,
+        Geography.client_id == client_id
+    ).first()
+    
+    if not geography:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Geography not found"
+        )
+    
+    # Validate file type
+    if not is_allowed_upload(file.filename, COLUMNAR_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only Parquet (.parquet) or Arrow (.arrow, .feather) files are allowed"
+        )
+    
+    # Stream file to disk
+    stored = await _save_upload(file, "property.parquet")
+    file_ref = stored["file_ref"]
+    
+    # Identical file already imported for this geography: skip reprocessing
+    previous_run = _find_previous_import(db, client_id, geography_id, SourceType.COLUMNAR_PROPERTY, file_ref)
+    if previous_run:
+        return _previous_import_response(previous_run, file_ref, geography_id)
+    
+    # Validate column names for PII before queuing
+    await _validate_upload(ColumnarImportService(db, client_id).validate_property_file, file_ref)
+    
+    ingestion_run = IngestionRun(
+        client_id=client_id,
+        geography_id=geography_id,
+        source_type=SourceType.COLUMNAR_PROPERTY,
+        status=IngestionStatus.QUEUED,
+        file_ref=file_ref
+    )
+    db.add(ingestion_run)
+    db.commit()
+    
+    import_columnar_property_task.delay(str(ingestion_run.id), file_ref, geography_id, str(client_id))
+    
+    return {
+        "ingestion_run_id": str(ingestion_run.id),
+        "status": "queued",
+        "geography_id": geography_id
+    }
+
+
 @router.post("/events")
 async def import_events_csv(
     geography_id: int = Query(...),
@@ -106,25 +230,23 @@ async def import_events_csv(
         )
     
     # Validate file type
-    if not file.filename or not file.filename.endswith(('.csv', '.txt')):
+    if not is_allowed_upload(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only CSV files are allowed"
+            detail="Only CSV files (optionally .gz or .zst compressed) are allowed"
         )
     
-    # Read and save file
-    content = await file.read()
-    file_ref = save_uploaded_file(content, file.filename or "events.csv")
+    # Stream file to disk
+    stored = await _save_upload(file, "events.csv")
+    file_ref = stored["file_ref"]
+    
+    # Identical file already imported for this geography: skip reprocessing
+    previous_run = _find_previous_import(db, client_id, geography_id, SourceType.CSV_EVENTS, file_ref)
+    if previous_run:
+        return _previous_import_response(previous_run, file_ref, geography_id)
     
     # Validate CSV for PII before queuing
-    try:
-        import_service = CSVImportService(db, client_id)
-        rows = import_service.parse_csv_file(file_ref)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    await _validate_upload(CSVImportService(db, client_id).validate_csv_file, file_ref)
     
     ingestion_run = IngestionRun(
         client_id=client_id,
@@ -167,25 +289,23 @@ async def import_channels_csv(
         )
     
     # Validate file type
-    if not file.filename or not file.filename.endswith(('.csv', '.txt')):
+    if not is_allowed_upload(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only CSV files are allowed"
+            detail="Only CSV files (optionally .gz or .zst compressed) are allowed"
         )
     
-    # Read and save file
-    content = await file.read()
-    file_ref = save_uploaded_file(content, file.filename or "channels.csv")
+    # Stream file to disk
+    stored = await _save_upload(file, "channels.csv")
+    file_ref = stored["file_ref"]
+    
+    # Identical file already imported for this geography: skip reprocessing
+    previous_run = _find_previous_import(db, client_id, geography_id, SourceType.CSV_CHANNELS, file_ref)
+    if previous_run:
+        return _previous_import_response(previous_run, file_ref, geography_id)
     
     # Validate CSV for PII before queuing
-    try:
-        import_service = CSVImportService(db, client_id)
-        rows = import_service.parse_csv_file(file_ref)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
+    await _validate_upload(CSVImportService(db, client_id).validate_csv_file, file_ref)
     
     ingestion_run = IngestionRun(
         client_id=client_id,
@@ -4,7 +4,7 @@ Ingestion Run API Endpoints
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.models.ingestion import IngestionRun, SourceType, IngestionStatus
 from app.schemas.ingestion import IngestionRunResponse
@@ -20,7 +20,7 @@ async def list_ingestion_runs(
     status: Optional[str] = Query(None),
     limit: int = Query(100, le=500),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List ingestion runs for current client"""
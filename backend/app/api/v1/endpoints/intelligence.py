@@ -2,17 +2,30 @@
 Intelligence Report API Endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from app.core.database import get_db
+from app.core.database import get_db, get_async_db, get_async_read_db, get_read_db
 from app.core.dependencies import get_current_active_client_id
 from app.services.intelligence_engine import IntelligenceEngine
-from app.models.intelligence_report import IntelligenceReport
+from app.services.report_cache import ReportCache, normalize_zip_codes
+from app.services.report_generator import ReportGenerator
+from app.services.scoring_rules import rule_for
+from app.tasks import generate_report_batch_task, generate_report_task
+from app.models.intelligence_report import IntelligenceReport, ReportStatus
 from app.models.geography import Geography, ZIPCode
 from app.schemas.intelligence_report import (
     IntelligenceReportCreate,
+    IntelligenceReportBatchCreate,
     IntelligenceReportResponse,
     BuyerProfileResponse,
+    ScenarioComparisonRequest,
+    ScenarioSummary,
+    ScoreDistributionResponse,
+    WeightSimulationRequest,
+    WeightSimulationResponse,
+    WeightSimulationResult,
 )
 from app.models.demand_signal import ServiceCategory
 import uuid
@@ -20,15 +33,19 @@ import uuid
 router = APIRouter()
 
 
-@router.post("/reports", response_model=IntelligenceReportResponse)
+@router.post("/reports", response_model=IntelligenceReportResponse, status_code=202)
 async def create_intelligence_report(
     report_data: IntelligenceReportCreate,
     db: Session = Depends(get_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
-    """Create a new intelligence report"""
-    engine = IntelligenceEngine(db)
-    
+    """
+    Create a new intelligence report
+    The report is returned in PENDING state and computed in the background;
+    poll GET /reports/{id} for status and progress. If the same inputs were
+    computed since the geography's last data refresh, the report is
+    returned already COMPLETED from the report cache.
+    """
     # Validate geography belongs to client
     geography = db.query(Geography).filter(
         Geography.id == report_data.geography_id,
@@ -37,56 +54,12 @@ async def create_intelligence_report(
     if not geography:
         raise HTTPException(status_code=404, detail="Geography not found")
     
-    # Parse ZIP codes
-    zip_code_list = [z.strip() for z in report_data.zip_codes.split(",")]
-    zip_codes = db.query(ZIPCode).filter(ZIPCode.zip_code.in_(zip_code_list)).all()
-    zip_code_ids = [zc.id for zc in zip_codes]
-    
     # Get service category
     try:
         service_category = ServiceCategory(report_data.service_category)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid service category")
     
-    # Get households
-    households = engine.get_households_by_geography(
-        client_id=client_id,
-        geography_id=report_data.geography_id,
-        zip_code_ids=zip_code_ids,
-        service_category=service_category
-    )
-    
-    # Generate buyer profile
-    buyer_profile = engine.generate_buyer_profile(households, service_category)
-    
-    # Calculate ZIP demand scores
-    zip_demand_scores = engine.calculate_zip_demand_scores(client_id, zip_code_ids, service_category)
-    
-    # Get top ZIP codes with rationale (per spec section 8)
-    top_zips = engine.get_top_zip_codes_with_rationale(
-        client_id, zip_code_ids, service_category, top_n=5
-    )
-    
-    # Calculate average demand score
-    if households:
-        total_score = sum(
-            engine.calculate_household_demand_score(h, service_category)
-            for h in households
-        )
-        avg_demand_score = total_score / len(households)
-    else:
-        avg_demand_score = 0.0
-    
-    # Generate channel recommendations
-    channel_recommendations = _generate_channel_recommendations(
-        buyer_profile, service_category, db, client_id, report_data.geography_id
-    )
-    
-    # Generate timing recommendations
-    timing_recommendations = _generate_timing_recommendations(
-        service_category, avg_demand_score
-    )
-    
     # Create report
     report = IntelligenceReport(
         client_id=client_id,
@@ -94,62 +67,116 @@ async def create_intelligence_report(
         zip_codes=report_data.zip_codes,
         service_category=report_data.service_category,
         report_name=report_data.report_name or f"{service_category.value} Report",
-        total_households=buyer_profile["total_households"],
-        target_households=buyer_profile["target_households"],
-        average_demand_score=avg_demand_score,
-        buyer_profile=buyer_profile,
-        zip_demand_scores=zip_demand_scores,
-        channel_recommendations=channel_recommendations,
-        timing_recommendations=timing_recommendations,
-        report_data={
-            "buyer_profile": buyer_profile,
-            "zip_demand_scores": zip_demand_scores,
-            "top_zip_codes": top_zips,  # Top ZIPs with rationale (per spec section 8)
-            "channel_recommendations": channel_recommendations,
-            "timing_recommendations": timing_recommendations,
-        }
+        status=ReportStatus.PENDING.value,
+        progress=0
     )
     
     db.add(report)
     db.commit()
     db.refresh(report)
     
+    # Serve repeat requests from the report cache
+    if ReportGenerator(db).generate_from_cache(report, geography):
+        return report
+    
+    # Enqueue Celery task
+    generate_report_task.delay(report.id, str(client_id))
+    
     return report
 
 
+@router.post("/reports/batch", response_model=List[IntelligenceReportResponse], status_code=202)
+async def create_intelligence_reports_batch(
+    batch_data: IntelligenceReportBatchCreate,
+    db: Session = Depends(get_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    Create one intelligence report per service category (or "all")
+    for the same geography and ZIP codes. Uncached reports are computed
+    together by one background task that loads and scores households once.
+    """
+    geography = db.query(Geography).filter(
+        Geography.id == batch_data.geography_id,
+        Geography.client_id == client_id
+    ).first()
+    if not geography:
+        raise HTTPException(status_code=404, detail="Geography not found")
+    
+    if batch_data.service_categories == "all":
+        service_categories = list(ServiceCategory)
+    else:
+        try:
+            service_categories = list(dict.fromkeys(ServiceCategory(c) for c in batch_data.service_categories))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid service category")
+    if not service_categories:
+        raise HTTPException(status_code=400, detail="At least one service category is required")
+    
+    reports = [
+        IntelligenceReport(
+            client_id=client_id,
+            geography_id=batch_data.geography_id,
+            zip_codes=batch_data.zip_codes,
+            service_category=category.value,
+            report_name=(
+                f"{batch_data.report_name} - {category.value}" if batch_data.report_name
+                else f"{category.value} Report"
+            ),
+            status=ReportStatus.PENDING.value,
+            progress=0
+        )
+        for category in service_categories
+    ]
+    db.add_all(reports)
+    db.commit()
+    for report in reports:
+        db.refresh(report)
+    
+    # Serve cached categories now; compute the rest in one pass
+    generator = ReportGenerator(db)
+    pending_ids = [r.id for r in reports if not generator.generate_from_cache(r, geography)]
+    if pending_ids:
+        generate_report_batch_task.delay(pending_ids, str(client_id))
+    
+    return reports
+
+
 @router.get("/reports", response_model=List[IntelligenceReportResponse])
 async def list_intelligence_reports(
     geography_id: Optional[int] = Query(None),
     service_category: Optional[str] = Query(None),
     limit: int = Query(50, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """List intelligence reports with optional filters"""
-    query = db.query(IntelligenceReport).filter(IntelligenceReport.client_id == client_id)
+    query = select(IntelligenceReport).where(IntelligenceReport.client_id == client_id)
     
     if geography_id:
-        query = query.filter(IntelligenceReport.geography_id == geography_id)
+        query = query.where(IntelligenceReport.geography_id == geography_id)
     
     if service_category:
-        query = query.filter(IntelligenceReport.service_category == service_category)
+        query = query.where(IntelligenceReport.service_category == service_category)
     
-    reports = query.order_by(IntelligenceReport.generated_at.desc()).offset(offset).limit(limit).all()
+    reports = (await db.scalars(
+        query.order_by(IntelligenceReport.generated_at.desc()).offset(offset).limit(limit)
+    )).all()
     return reports
 
 
 @router.get("/reports/{report_id}", response_model=IntelligenceReportResponse)
 async def get_intelligence_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Get a specific intelligence report"""
-    report = db.query(IntelligenceReport).filter(
+    report = await db.scalar(select(IntelligenceReport).where(
         IntelligenceReport.id == report_id,
         IntelligenceReport.client_id == client_id
-    ).first()
+    ))
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     return report
@@ -158,16 +185,16 @@ async def get_intelligence_report(
 @router.get("/reports/{report_id}/export/json")
 async def export_report_json(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Export intelligence report as JSON (per spec section D5)"""
     from fastapi.responses import JSONResponse
     
-    report = db.query(IntelligenceReport).filter(
+    report = await db.scalar(select(IntelligenceReport).where(
         IntelligenceReport.id == report_id,
         IntelligenceReport.client_id == client_id
-    ).first()
+    ))
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
@@ -197,7 +224,7 @@ async def export_report_json(
 @router.get("/reports/{report_id}/export/csv")
 async def export_report_csv(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Export intelligence report as CSV (per spec section D5)"""
@@ -205,10 +232,10 @@ async def export_report_csv(
     import io
     from fastapi.responses import StreamingResponse
     
-    report = db.query(IntelligenceReport).filter(
+    report = await db.scalar(select(IntelligenceReport).where(
         IntelligenceReport.id == report_id,
         IntelligenceReport.client_id == client_id
-    ).first()
+    ))
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
@@ -298,7 +325,7 @@ async def generate_buyer_profile(
     zip_codes: Optional[str] = Query(None),  # Comma-separated
     service_category: str = Query("general"),
     min_demand_score: float = Query(0.0, ge=0.0, le=100.0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
     """Generate buyer profile for given geography and service category"""
@@ -315,7 +342,13 @@ async def generate_buyer_profile(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid service category")
     
-    households = engine.get_households_by_geography(
+    # Without a score threshold every household is included, so the
+    # profile is aggregated in SQL rather than from loaded households
+    if min_demand_score <= 0:
+        profile = engine.aggregate_buyer_profile(client_id, geography_id, zip_code_ids)
+        return BuyerProfileResponse(**profile)
+    
+    households = engine.scan_households_by_geography(
         client_id=client_id,
         geography_id=geography_id,
         zip_code_ids=zip_code_ids,
@@ -327,120 +360,188 @@ async def generate_buyer_profile(
     return BuyerProfileResponse(**profile)
 
 
-def _generate_channel_recommendations(
-    buyer_profile: dict,
-    service_category: ServiceCategory,
-    db: Session,
-    client_id: uuid.UUID,
-    geography_id: int
-) -> List[dict]:
-    """Generate channel recommendations based on buyer profile and available channels"""
-    from app.models.channel import Channel
-    
-    recommendations = []
-    
-    # Get channels from database for this geography
-    channels = db.query(Channel).filter(
-        Channel.client_id == client_id,
-        Channel.geography_id == geography_id
-    ).all()
-    
-    # Add institutional channels from database
-    for channel in channels:
-        recommendations.append({
-            "channel_type": channel.channel_type.value,
-            "name": channel.name,
-            "rationale": f"Institutional channel: {channel.name}",
-            "estimated_reach": channel.estimated_reach or "Unknown",
-            "website": channel.website,
-            "source_url": channel.source_url
-        })
-    
-    # Add generic recommendations if no channels found
-    if not channels:
-        # Direct mail for homeowners
-        if buyer_profile.get("homeowner_percentage", 0) > 60:
-            recommendations.append({
-                "channel_type": "direct_mail",
-                "rationale": "High percentage of homeowners who respond well to direct mail",
-                "estimated_reach": buyer_profile.get("target_households", 0),
-                "estimated_cost_range": "$0.50-$1.00 per household"
-            })
-        
-        # Digital ads for higher income areas
-        income_dist = buyer_profile.get("income_distribution", {})
-        if income_dist.get("high", 0) > income_dist.get("low", 0):
-            recommendations.append({
-                "channel_type": "digital_ads",
-                "rationale": "Higher income demographic active online",
-                "estimated_reach": buyer_profile.get("target_households", 0) * 3,
-                "estimated_cost_range": "$2-$5 per 1000 impressions"
-            })
-        
-        # Door hangers for local services
-        if service_category in [ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY]:
-            recommendations.append({
-                "channel_type": "door_hangers",
-                "rationale": "Effective for local service providers in residential areas",
-                "estimated_reach": buyer_profile.get("target_households", 0),
-                "estimated_cost_range": "$0.15-$0.30 per household"
-            })
-    
-    return recommendations
+@router.post("/scenarios", response_model=List[ScenarioSummary])
+def compare_zip_scenarios(
+    request: ScenarioComparisonRequest,
+    db: Session = Depends(get_read_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    Compare candidate ZIP bundles within a geography
+    All bundles are summarized from one read of the per-ZIP demand rollups;
+    ZIPs without rollups are scored from households, so this runs in the threadpool
+    """
+    geography = db.query(Geography).filter(
+        Geography.id == request.geography_id,
+        Geography.client_id == client_id
+    ).first()
+    if not geography:
+        raise HTTPException(status_code=404, detail="Geography not found")
+    
+    try:
+        service_cat = ServiceCategory(request.service_category)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid service category")
+    
+    requested = {
+        scenario.name: list(dict.fromkeys(z.strip() for z in scenario.zip_codes.split(",") if z.strip()))
+        for scenario in request.scenarios
+    }
+    if len(requested) != len(request.scenarios):
+        raise HTTPException(status_code=400, detail="Scenario names must be unique")
+    
+    all_zip_codes = {z for zip_codes in requested.values() for z in zip_codes}
+    zip_by_code = {
+        z.zip_code: z for z in db.query(ZIPCode).filter(
+            ZIPCode.geography_id == geography.id,
+            ZIPCode.zip_code.in_(all_zip_codes)
+        ).all()
+    }
+    
+    engine = IntelligenceEngine(db)
+    summaries = engine.compare_zip_scenarios(
+        client_id,
+        {name: [zip_by_code[z] for z in zip_codes if z in zip_by_code] for name, zip_codes in requested.items()},
+        service_cat,
+        top_n=request.top_n
+    )
+    
+    return [
+        ScenarioSummary(
+            name=name,
+            zip_codes=zip_codes,
+            unknown_zip_codes=[z for z in zip_codes if z not in zip_by_code],
+            **summaries[name]
+        )
+        for name, zip_codes in requested.items()
+    ]
 
 
-def _generate_timing_recommendations(
-    service_category: ServiceCategory,
-    demand_score: float
-) -> List[dict]:
-    """Generate timing recommendations based on service category"""
-    recommendations = []
-    
-    if service_category == ServiceCategory.LAWN_CARE:
-        recommendations.extend([
-            {
-                "time_period": "Spring (March-May)",
-                "rationale": "Peak season for lawn care services as grass begins growing",
-                "demand_score": min(100.0, demand_score * 1.3),
-                "recommended_actions": [
-                    "Launch campaigns in early March",
-                    "Focus on fertilization and aeration services",
-                    "Target new homeowners"
-                ]
-            },
+@router.post("/weight-simulations", response_model=WeightSimulationResponse)
+def simulate_scoring_weights(
+    request: WeightSimulationRequest,
+    db: Session = Depends(get_read_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    What-if ZIP scores and ranks under alternate scoring rule weights
+    Every weight setting is evaluated over one cached household feature matrix
+    (plain def: the NumPy work runs in the threadpool, off the event loop)
+    """
+    geography = db.query(Geography).filter(
+        Geography.id == request.geography_id,
+        Geography.client_id == client_id
+    ).first()
+    if not geography:
+        raise HTTPException(status_code=404, detail="Geography not found")
+    
+    try:
+        service_cat = ServiceCategory(request.service_category)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid service category")
+    
+    features = [factor.feature for factor in rule_for(service_cat).factors] + ["base"]
+    unknown = sorted({f for setting in request.weight_settings for f in setting.weights} - set(features))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown weight features: {', '.join(unknown)} (valid: {', '.join(features)})"
+        )
+    weight_sets = {setting.name: setting.weights for setting in request.weight_settings}
+    if len(weight_sets) != len(request.weight_settings):
+        raise HTTPException(status_code=400, detail="Weight setting names must be unique")
+    
+    zip_query = db.query(ZIPCode).filter(ZIPCode.geography_id == geography.id)
+    if request.zip_codes:
+        zip_query = zip_query.filter(
+            ZIPCode.zip_code.in_([z.strip() for z in request.zip_codes.split(",") if z.strip()])
+        )
+    zip_codes = zip_query.all()
+    
+    engine = IntelligenceEngine(db)
+    results = engine.simulate_weights(client_id, geography, zip_codes, service_cat, weight_sets)
+    
+    return WeightSimulationResponse(
+        service_category=service_cat.value,
+        features=features,
+        results=[
+            WeightSimulationResult(name=name, weights=weight_sets[name], zip_codes=results[name])
+            for name in weight_sets
+        ]
+    )
+
+
+@router.get("/score-distribution", response_model=ScoreDistributionResponse)
+def get_score_distribution(
+    geography_id: int,
+    service_category: str,
+    zip_codes: Optional[str] = Query(None, description="Comma-separated; defaults to every ZIP of the geography"),
+    bucket_width: int = Query(10, ge=1, le=50),
+    thresholds: str = Query("60,80", description="Comma-separated multiples of bucket_width"),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+    client_id: uuid.UUID = Depends(get_current_active_client_id)
+):
+    """
+    Household demand-score histogram and percentiles per ZIP
+    Computed by one database query (PostgreSQL, else a scored household scan,
+    hence a threadpool handler) and cached until the geography's next data refresh
+    """
+    # Stamps are read with the data so a lagging replica never caches old
+    # counts under newer freshness stamps
+    geography = read_db.query(Geography).filter(
+        Geography.id == geography_id,
+        Geography.client_id == client_id
+    ).first()
+    if not geography:
+        raise HTTPException(status_code=404, detail="Geography not found")
+    
+    try:
+        service_cat = ServiceCategory(service_category)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid service category")
+    
+    if 100 % bucket_width:
+        raise HTTPException(status_code=400, detail="bucket_width must divide 100")
+    try:
+        threshold_values = sorted({int(t) for t in thresholds.split(",") if t.strip()})
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Thresholds must be integers")
+    if any(t % bucket_width or not 0 <= t < 100 for t in threshold_values):
+        raise HTTPException(status_code=400, detail="Thresholds must be multiples of bucket_width below 100")
+    
+    # Cached per inputs; household writes and imports bump the geography's stamps
+    cache = ReportCache(db)
+    cache_kind = f"score_distribution:{bucket_width}:{','.join(map(str, threshold_values))}"
+    requested = ",".join(normalize_zip_codes(zip_codes))
+    payload = cache.get(client_id, geography, requested, service_cat.value, kind=cache_kind)
+    if payload is not None:
+        return payload
+    
+    zip_query = read_db.query(ZIPCode).filter(ZIPCode.geography_id == geography.id)
+    if requested:
+        zip_query = zip_query.filter(ZIPCode.zip_code.in_(requested.split(",")))
+    zip_list = sorted(zip_query.all(), key=lambda z: z.zip_code)
+    
+    engine = IntelligenceEngine(read_db)
+    distributions = engine.score_distribution(client_id, [z.id for z in zip_list], service_cat, bucket_width)
+    
+    payload = ScoreDistributionResponse(
+        geography_id=geography.id,
+        service_category=service_cat.value,
+        bucket_width=bucket_width,
+        zip_codes=[
             {
-                "time_period": "Summer (June-August)",
-                "rationale": "Ongoing maintenance season with high demand",
-                "demand_score": demand_score,
-                "recommended_actions": [
-                    "Maintain consistent messaging",
-                    "Offer seasonal packages",
-                    "Target properties with larger lots"
-                ]
+                "zip_code": zip_code.zip_code,
+                **distributions[zip_code.id],
+                "at_or_above": {
+                    str(t): sum(b["count"] for b in distributions[zip_code.id]["buckets"] if b["lower"] >= t)
+                    for t in threshold_values
+                },
             }
-        ])
-    elif service_category == ServiceCategory.FIREWORKS:
-        recommendations.append({
-            "time_period": "Late June - Early July",
-            "rationale": "Fourth of July holiday peak demand",
-            "demand_score": min(100.0, demand_score * 1.5),
-            "recommended_actions": [
-                "Begin marketing 2-3 weeks before holiday",
-                "Focus on neighborhoods with larger lots",
-                "Highlight safety and compliance"
-            ]
-        })
-    else:
-        recommendations.append({
-            "time_period": "Year-round",
-            "rationale": "Consistent demand throughout the year",
-            "demand_score": demand_score,
-            "recommended_actions": [
-                "Maintain consistent presence",
-                "Adjust messaging seasonally",
-                "Focus on property turnover events"
-            ]
-        })
-    
-    return recommendations
-
+            for zip_code in zip_list
+        ]
+    ).model_dump()
+    cache.put(client_id, geography, requested, service_cat.value, payload, kind=cache_kind)
+    db.commit()
+    return payload
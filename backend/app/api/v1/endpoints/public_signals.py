@@ -8,6 +8,7 @@ The router is conditionally included in app.api.v1.api based on settings.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from typing import Optional
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_client_id
 from app.collectors.ics_calendar_collector import ICSCalendarCollector
@@ -23,6 +24,7 @@ router = APIRouter()
 async def ingest_ics_calendar(
     ics_url: str = Query(..., description="URL of ICS calendar feed"),
     geography_id: int = Query(..., description="Geography ID for the events"),
+    horizon_days: Optional[int] = Query(None, ge=1, le=730, description="Days ahead to expand recurring events"),
     db: Session = Depends(get_db),
     client_id: uuid.UUID = Depends(get_current_active_client_id)
 ):
@@ -52,7 +54,7 @@ async def ingest_ics_calendar(
     try:
         # Collect events from ICS calendar
         collector = ICSCalendarCollector(db, client_id)
-        events = collector.collect(ics_url, geography_id)
+        events = collector.collect(ics_url, geography_id, horizon_days=horizon_days)
         
         # Store events
         stored_count = collector.store(events, geography_id)
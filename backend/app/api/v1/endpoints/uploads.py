@@ -5,10 +5,10 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_client_id
-from app.core.file_storage import save_uploaded_file
+from app.core.file_storage import is_allowed_upload, save_upload_stream, UploadSizeLimitRoute, UploadTooLargeError
 import uuid
 
-router = APIRouter()
+router = APIRouter(route_class=UploadSizeLimitRoute)
 
 
 @router.post("/")
@@ -22,22 +22,26 @@ async def upload_file(
     Returns file reference for use in import endpoints
     """
     # Validate file type
-    if not file.filename.endswith(('.csv', '.txt')):
+    if not is_allowed_upload(file.filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Only CSV files are allowed"
+            detail="Only CSV files (optionally .gz or .zst compressed) are allowed"
         )
     
-    # Read file content
-    content = await file.read()
-    
-    # Save file
-    file_ref = save_uploaded_file(content, file.filename)
+    # Stream file to disk (never held in memory as a whole)
+    try:
+        stored = await save_upload_stream(file, file.filename)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
     
     return {
-        "file_ref": file_ref,
+        "file_ref": stored["file_ref"],
         "filename": file.filename,
-        "size": len(content)
+        "size": stored["size"],
+        "sha256": stored["sha256"]
     }
 
 
@@ -8,6 +8,7 @@ from datetime import datetime
 from app.collectors.base_collector import BaseCollector
 from app.models.demand_signal import DemandSignal, ServiceCategory, SignalType
 from app.models.geography import Geography
+from app.services.category_classifier import classify_categories
 import requests
 
 
@@ -70,24 +71,15 @@ class EventCollector(BaseCollector):
         return True
     
     def _map_event_to_service_category(self, event: Dict[str, Any]) -> List[ServiceCategory]:
-        """Map event characteristics to service categories"""
-        categories = []
-        title = event.get("event_title", "").lower()
-        description = event.get("event_description", "").lower()
-        
-        # Fireworks events
-        if any(word in title + description for word in ["firework", "4th", "july", "independence"]):
-            categories.append(ServiceCategory.FIREWORKS)
-        
-        # Lawn care (community events in parks)
-        if any(word in title + description for word in ["park", "festival", "outdoor"]):
-            categories.append(ServiceCategory.LAWN_CARE)
-        
-        # General services
-        if not categories:
-            categories.append(ServiceCategory.GENERAL)
-        
-        return categories
+        """
+        Map event characteristics to service categories
+        Uses the shared keyword table (category_classifier): fireworks terms,
+        park/festival/outdoor/lawn for lawn care and security/safety for
+        security; every matching category is returned, highest priority first
+        """
+        return classify_categories(
+            (event.get("event_title") or "") + " " + (event.get("event_description") or "")
+        )
     
     def store(self, data: List[Dict[str, Any]]) -> int:
         """Store events as demand signals"""
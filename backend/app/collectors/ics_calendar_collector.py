@@ -2,16 +2,20 @@
 ICS Calendar Collector (Option 3: Public Signals Ingestion)
 Parses ICS calendar feeds for event data
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, date, timedelta, timezone
+import itertools
 import requests
 import icalendar
+from dateutil.rrule import rruleset, rrulestr
 from io import BytesIO
 from app.collectors.base_collector import BaseCollector
-from app.core.pii_guard import assert_no_pii_keys
+from app.core.config import settings
+from app.core.pii_guard import assert_no_pii_keys, iter_pii_values, redact_pii_values
 from app.models.demand_signal import DemandSignal, ServiceCategory, SignalType
 from app.models.geography import Geography, ZIPCode
+from app.services.category_classifier import classify_primary_category
 import uuid
 import json
 
@@ -22,6 +26,12 @@ class ICSCalendarCollector(BaseCollector):
     Option 3: Public Signals Ingestion
     """
     
+    # Hard cap on instances generated from a single recurring VEVENT
+    MAX_OCCURRENCES_PER_EVENT = 1000
+    
+    # Event fields scanned for embedded PII values
+    FREE_TEXT_FIELDS = ("event_name", "event_description", "location_name")
+    
     def __init__(self, db: Session, client_id: uuid.UUID):
         super().__init__(db)
         self.client_id = client_id
@@ -30,35 +40,149 @@ class ICSCalendarCollector(BaseCollector):
         self,
         ics_url: str,
         geography_id: Optional[int] = None,
+        horizon_days: Optional[int] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """
         Collect events from an ICS calendar feed
+        Recurring events are expanded up to horizon_days from now
         """
-        data = []
-        
         try:
             # Fetch ICS file
             response = requests.get(ics_url, timeout=10)
             response.raise_for_status()
             
-            # Parse ICS file
-            calendar = icalendar.Calendar.from_ical(response.content)
-            
-            for component in calendar.walk():
-                if component.name == "VEVENT":
-                    event_data = self._parse_event(component, geography_id)
-                    if event_data:
-                        # Validate for PII
-                        assert_no_pii_keys(event_data)
-                        data.append(event_data)
+            return self.parse_calendar(response.content, geography_id, horizon_days)
         
         except Exception as e:
             print(f"Error fetching/parsing ICS calendar: {e}")
             return []
+    
+    def parse_calendar(
+        self,
+        ics_content: bytes,
+        geography_id: Optional[int] = None,
+        horizon_days: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse raw ICS content into event dicts (one per occurrence)
+        """
+        if horizon_days is None:
+            horizon_days = settings.ICS_RECURRENCE_HORIZON_DAYS
+        
+        window_start = datetime.now(timezone.utc)
+        window_end = window_start + timedelta(days=horizon_days)
+        
+        data = []
+        calendar = icalendar.Calendar.from_ical(ics_content)
+        
+        for component in calendar.walk():
+            if component.name == "VEVENT":
+                for event_data in self._expand_event(component, geography_id, window_start, window_end):
+                    # Validate for PII
+                    assert_no_pii_keys(event_data)
+                    data.append(event_data)
+        
+        # Public feeds often embed contact details in free text; scrub them
+        for field in self.FREE_TEXT_FIELDS:
+            for index, _kind in iter_pii_values([event.get(field) for event in data]):
+                data[index][field] = redact_pii_values(data[index][field])
         
         return data
     
+    def _expand_event(
+        self,
+        event_component,
+        geography_id: Optional[int],
+        window_start: datetime,
+        window_end: datetime
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one event dict per occurrence of a VEVENT
+        Non-recurring events, and events whose recurrence can't be expanded,
+        are yielded once, unchanged
+        """
+        event_data = self._parse_event(event_component, geography_id)
+        if not event_data:
+            return
+        
+        if not any(event_component.get(prop) for prop in ("RRULE", "RDATE")):
+            yield event_data
+            return
+        
+        try:
+            occurrences = list(self._iter_occurrences(event_component, window_start, window_end))
+        except (ValueError, TypeError) as e:
+            # e.g. a date-only UNTIL with a tz-aware DTSTART; keep the rest of the feed
+            print(f"Error expanding recurrence of {event_data['event_name']!r}: {e}")
+            yield event_data
+            return
+        
+        for start, end in occurrences:
+            occurrence = dict(event_data)
+            occurrence["event_start_date"] = start.isoformat()
+            if end is not None:
+                occurrence["event_end_date"] = end.isoformat()
+            else:
+                occurrence.pop("event_end_date", None)
+            occurrence["recurring"] = True
+            yield occurrence
+    
+    def _iter_occurrences(
+        self,
+        event_component,
+        window_start: datetime,
+        window_end: datetime
+    ) -> Iterator[Tuple[datetime, Optional[datetime]]]:
+        """
+        Lazily expand RRULE/RDATE/EXDATE into (start, end) pairs inside the window
+        dateutil generates instances on demand, so unbounded rules stay cheap
+        """
+        dtstart_prop = event_component.get("DTSTART")
+        if not dtstart_prop:
+            return
+        
+        dtstart = _to_datetime(dtstart_prop.dt)
+        duration = self._event_duration(event_component, dtstart)
+        
+        # Window bounds must match DTSTART's awareness for comparisons
+        if dtstart.tzinfo is None:
+            window_start = window_start.astimezone(timezone.utc).replace(tzinfo=None)
+            window_end = window_end.astimezone(timezone.utc).replace(tzinfo=None)
+        
+        rules = rruleset()
+        
+        for rrule_prop in _as_list(event_component.get("RRULE")):
+            rule_text = rrule_prop.to_ical().decode()
+            # dateutil rejects an aware UNTIL against a naive DTSTART (and vice versa)
+            if dtstart.tzinfo is None:
+                rule_text = _strip_until_zone(rule_text)
+            rules.rrule(rrulestr(rule_text, dtstart=dtstart, ignoretz=dtstart.tzinfo is None))
+        
+        for rdate_prop in _as_list(event_component.get("RDATE")):
+            for rdate in rdate_prop.dts:
+                rules.rdate(_match_awareness(_to_datetime(rdate.dt), dtstart))
+        
+        for exdate_prop in _as_list(event_component.get("EXDATE")):
+            for exdate in exdate_prop.dts:
+                rules.exdate(_match_awareness(_to_datetime(exdate.dt), dtstart))
+        
+        occurrences = rules.xafter(window_start, count=self.MAX_OCCURRENCES_PER_EVENT, inc=True)
+        for start in itertools.takewhile(lambda dt: dt <= window_end, occurrences):
+            yield start, (start + duration) if duration is not None else None
+    
+    def _event_duration(self, event_component, dtstart: datetime) -> Optional[timedelta]:
+        """Derive occurrence length from DTEND or DURATION"""
+        dtend_prop = event_component.get("DTEND")
+        if dtend_prop:
+            return _match_awareness(_to_datetime(dtend_prop.dt), dtstart) - dtstart
+        
+        duration_prop = event_component.get("DURATION")
+        if duration_prop:
+            return duration_prop.dt
+        
+        return None
+    
     def _parse_event(self, event_component, geography_id: Optional[int]) -> Optional[Dict[str, Any]]:
         """Parse a single VEVENT component"""
         try:
@@ -113,16 +237,7 @@ class ICSCalendarCollector(BaseCollector):
     
     def _map_to_service_category(self, title: str, description: str) -> str:
         """Map event to service category"""
-        text = (title + " " + description).lower()
-        
-        if any(word in text for word in ["firework", "4th", "july", "independence"]):
-            return ServiceCategory.FIREWORKS.value
-        elif any(word in text for word in ["park", "festival", "outdoor", "lawn"]):
-            return ServiceCategory.LAWN_CARE.value
-        elif any(word in text for word in ["security", "safety"]):
-            return ServiceCategory.SECURITY.value
-        else:
-            return ServiceCategory.GENERAL.value
+        return classify_primary_category(title + " " + description).value
     
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Validate event data"""
@@ -130,22 +245,27 @@ class ICSCalendarCollector(BaseCollector):
         return all(field in data for field in required_fields)
     
     def store(self, data: List[Dict[str, Any]], geography_id: Optional[int] = None) -> int:
-        """Store collected events as DemandSignals"""
-        stored = 0
+        """
+        Store collected events as DemandSignals
+        Deduplicates on (title, event_start_date) against existing EVENT signals
+        and within the batch, then inserts the new rows in one flush
+        """
+        events = [event for event in data if self.validate_data(event)]
+        if not events:
+            return 0
         
-        for event in data:
-            if not self.validate_data(event):
-                continue
-            
-            # Get ZIP code if provided
-            zip_code_id = None
-            if event.get("zip_code"):
-                zip_obj = self.db.query(ZIPCode).filter(
-                    ZIPCode.zip_code == event["zip_code"]
-                ).first()
-                if zip_obj:
-                    zip_code_id = zip_obj.id
-            
+        # Resolve all ZIP codes in one query
+        zip_strings = {event["zip_code"] for event in events if event.get("zip_code")}
+        zip_ids = {}
+        if zip_strings:
+            zip_ids = dict(
+                self.db.query(ZIPCode.zip_code, ZIPCode.id).filter(
+                    ZIPCode.zip_code.in_(zip_strings)
+                ).all()
+            )
+        
+        parsed = []
+        for event in events:
             # Parse dates
             start_date = None
             end_date = None
@@ -156,12 +276,35 @@ class ICSCalendarCollector(BaseCollector):
                     end_date = datetime.fromisoformat(event["event_end_date"].replace("Z", "+00:00"))
             except (ValueError, AttributeError):
                 pass
+            parsed.append((event, start_date, end_date))
+        
+        # Load dedup keys for existing events of this feed's geographies in one query
+        seen = set()
+        geography_ids = {geography_id or event.get("geography_id") for event in events}
+        titles = {event["event_name"] for event in events}
+        existing = self.db.query(
+            DemandSignal.title, DemandSignal.event_start_date
+        ).filter(
+            DemandSignal.client_id == self.client_id,
+            DemandSignal.geography_id.in_([g for g in geography_ids if g is not None]),
+            DemandSignal.signal_type == SignalType.EVENT,
+            DemandSignal.title.in_(titles)
+        ).all()
+        for title, start in existing:
+            seen.add(_dedup_key(title, start))
+        
+        signals = []
+        for event, start_date, end_date in parsed:
+            key = _dedup_key(event["event_name"], start_date)
+            if key in seen:
+                continue
+            seen.add(key)
             
             # Create demand signal
-            signal = DemandSignal(
+            signals.append(DemandSignal(
                 client_id=self.client_id,
                 geography_id=geography_id or event.get("geography_id"),
-                zip_code_id=zip_code_id,
+                zip_code_id=zip_ids.get(event.get("zip_code")),
                 signal_type=SignalType.EVENT,
                 service_category=ServiceCategory(event.get("service_category", "general")),
                 title=event["event_name"],
@@ -173,11 +316,52 @@ class ICSCalendarCollector(BaseCollector):
                 signal_metadata=json.dumps({
                     "source": "ics_calendar",
                     "location": event.get("location_name"),
+                    "recurring": event.get("recurring", False),
                 })
-            )
-            self.db.add(signal)
-            stored += 1
+            ))
         
+        self.db.add_all(signals)
         self.db.commit()
-        return stored
+        return len(signals)
+
+
+def _as_list(prop) -> list:
+    """icalendar returns a single property or a list when it repeats"""
+    if prop is None:
+        return []
+    return prop if isinstance(prop, list) else [prop]
+
+
+def _to_datetime(value) -> datetime:
+    """Promote all-day DATE values to midnight datetimes"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    raise ValueError(f"Unsupported ICS date value: {value!r}")
+
+
+def _match_awareness(value: datetime, reference: datetime) -> datetime:
+    """Coerce value to the same naive/aware flavour as reference"""
+    if reference.tzinfo is None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if reference.tzinfo is not None and value.tzinfo is None:
+        return value.replace(tzinfo=reference.tzinfo)
+    return value
+
+
+def _strip_until_zone(rule_text: str) -> str:
+    """Drop the trailing Z from UNTIL so it parses as a floating time"""
+    parts = []
+    for part in rule_text.split(";"):
+        if part.upper().startswith("UNTIL=") and part.endswith("Z"):
+            part = part[:-1]
+        parts.append(part)
+    return ";".join(parts)
+
 
+def _dedup_key(title: str, start: Optional[datetime]) -> Tuple[str, Optional[datetime]]:
+    """Normalize (title, start) so naive and UTC-aware datetimes compare equal"""
+    if start is not None and start.tzinfo is not None:
+        start = start.astimezone(timezone.utc).replace(tzinfo=None)
+    return title, start
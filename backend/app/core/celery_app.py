@@ -3,6 +3,7 @@ Celery Configuration for Background Tasks
 """
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 from app.core.config import settings
 
 celery_app = Celery(
@@ -29,7 +30,8 @@ celery_app.conf.update(
 )
 
 
-
-
-
-
+@worker_process_init.connect
+def _init_worker_db_pool(**kwargs):
+    """Give each worker process its own, smaller connection pool"""
+    from app.core.database import configure_worker_engine
+    configure_worker_engine()
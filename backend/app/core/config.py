@@ -2,7 +2,7 @@
 Application Configuration
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +15,16 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "sqlite+pysqlite:///:memory:"
+    DATABASE_READ_URL: Optional[str] = None  # Read replica for read-only endpoints; unset = use primary
+    DB_ECHO: bool = False  # Log every SQL statement (noisy; for local debugging only)
+    
+    # Database connection pools (per process; API async and sync engines each get one)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # Seconds; recycle before server/proxy idle timeouts
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_WORKER_POOL_SIZE: int = 2  # Celery worker processes run one task at a time
+    DB_WORKER_MAX_OVERFLOW: int = 2
     
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
@@ -37,6 +47,22 @@ class Settings(BaseSettings):
     # API Rate Limits
     API_RATE_LIMIT_PER_MINUTE: int = 60
     
+    # Uploads
+    MAX_UPLOAD_SIZE_MB: int = 5120  # Uploads are streamed to disk; this caps disk use per file
+    
+    # Columnar household cache (memory-mapped Arrow files shared by API and worker
+    # processes on a node); unset = households are always read from the database
+    HOUSEHOLD_CACHE_DIR: Optional[str] = None
+    
+    # Process-pool scoring: >1 scores large geographies in this many processes,
+    # partitioned by ZIP over the household cache files (needs HOUSEHOLD_CACHE_DIR).
+    # Workers are spawned through billiard, so Celery prefork children can use the pool.
+    SCORING_PROCESSES: int = 0
+    SCORING_PARALLEL_MIN_HOUSEHOLDS: int = 100000  # Smaller geographies are scored in-process
+    
+    # Public Signals (Option 3)
+    ICS_RECURRENCE_HORIZON_DAYS: int = 180  # How far ahead recurring ICS events are expanded
+    
     # Feature Flags - Module Gating (PHASE 2)
     # Future work modules can be enabled/disabled via environment variables
     FEATURE_LEAD_FUNNEL_ENABLED: bool = False  # Option 2
@@ -2,18 +2,137 @@
 Database Configuration and Session Management
 """
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.db_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+# Async drivers for each sync dialect used in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def async_database_url(url: str) -> str:
+    """
+    Rewrite a sync database URL to use the matching async driver
+    e.g. postgresql://... -> postgresql+asyncpg://...
+    """
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+def engine_options(
+    url: str,
+    pool_name: str,
+    pool_size: int,
+    max_overflow: int,
+    is_async: bool = False
+) -> dict:
+    """
+    Keyword arguments for create_engine/create_async_engine
+    SQLite picks its own pool class, so pool sizing only applies to server databases
+    """
+    options = {"pool_pre_ping": True, "echo": settings.DB_ECHO}
+    if make_url(url).get_backend_name() == "sqlite":
+        return options
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_logging_name=pool_name,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+    return options
+
 
 engine = create_engine(
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG,
+    **engine_options(settings.DATABASE_URL, "api", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for read endpoints so DB waits don't block the event loop
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    **engine_options(
+        settings.DATABASE_URL, "api_async", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW, is_async=True
+    )
+)
+
+# expire_on_commit=False: attributes stay loaded after commit (no implicit async IO)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Optional read replica: read-only endpoints and engine reads use it when
+# DATABASE_READ_URL is set, otherwise they share the primary engines
+if settings.DATABASE_READ_URL:
+    read_engine = create_engine(
+        settings.DATABASE_READ_URL,
+        **engine_options(settings.DATABASE_READ_URL, "api_read", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+    )
+    async_read_engine = create_async_engine(
+        async_database_url(settings.DATABASE_READ_URL),
+        **engine_options(
+            settings.DATABASE_READ_URL, "api_async_read", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW,
+            is_async=True
+        )
+    )
+else:
+    read_engine = engine
+    async_read_engine = async_engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    async_read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def configure_worker_engine() -> None:
+    """
+    Rebind SessionLocal (and ReadSessionLocal) to pools sized for a Celery worker process
+    Called from worker_process_init, so connections inherited from the
+    parent process are dropped rather than shared across the fork
+    """
+    global engine, read_engine
+    engine.dispose(close=False)
+    engine = create_engine(
+        settings.DATABASE_URL,
+        **engine_options(
+            settings.DATABASE_URL, "worker", settings.DB_WORKER_POOL_SIZE, settings.DB_WORKER_MAX_OVERFLOW
+        )
+    )
+    SessionLocal.configure(bind=engine)
+    
+    if settings.DATABASE_READ_URL:
+        read_engine.dispose(close=False)
+        read_engine = create_engine(
+            settings.DATABASE_READ_URL,
+            **engine_options(
+                settings.DATABASE_READ_URL, "worker_read", settings.DB_WORKER_POOL_SIZE, settings.DB_WORKER_MAX_OVERFLOW
+            )
+        )
+    else:
+        read_engine = engine
+    ReadSessionLocal.configure(bind=read_engine)
+
+
 Base = declarative_base()
 
 
@@ -26,7 +145,22 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """Dependency for getting an async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
 
 
+def get_read_db():
+    """Dependency for a read-only session (replica when DATABASE_READ_URL is set)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
 
 
+async def get_async_read_db():
+    """Dependency for a read-only async session (replica when DATABASE_READ_URL is set)"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -0,0 +1,80 @@
+"""
+Prometheus Metrics for Database Connection Pools
+
+Checkout wait time is recorded by the pool classes below; in-use and
+overflow counts are read from the pool when /metrics is scraped.
+"""
+import time
+from typing import Dict
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+try:
+    from prometheus_client import Gauge, Histogram
+    PROMETHEUS_ENABLED = True
+except ImportError:
+    PROMETHEUS_ENABLED = False
+
+
+if PROMETHEUS_ENABLED:
+    POOL_CHECKOUT_SECONDS = Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting to check a connection out of the pool",
+        ["pool"],
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+    POOL_IN_USE = Gauge(
+        "db_pool_connections_in_use",
+        "Connections currently checked out of the pool",
+        ["pool"],
+    )
+    POOL_OVERFLOW = Gauge(
+        "db_pool_overflow_connections",
+        "Connections open beyond pool_size",
+        ["pool"],
+    )
+    POOL_SIZE = Gauge(
+        "db_pool_size",
+        "Configured pool_size",
+        ["pool"],
+    )
+
+
+class _TimedCheckoutMixin:
+    """Observe how long each checkout waits for a free connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if PROMETHEUS_ENABLED:
+                POOL_CHECKOUT_SECONDS.labels(pool=self.logging_name or "default").observe(
+                    time.perf_counter() - start
+                )
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """QueuePool that records checkout wait time"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time"""
+
+
+def register_pool_gauges(engines: Dict[str, Engine]) -> None:
+    """
+    Export in-use, overflow and size gauges for each named engine's pool
+    Pools without queue semantics (e.g. SQLite) are skipped
+    """
+    if not PROMETHEUS_ENABLED:
+        return
+
+    for name, engine in engines.items():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        POOL_IN_USE.labels(pool=name).set_function(pool.checkedout)
+        # overflow() counts up from -pool_size; only report connections beyond it
+        POOL_OVERFLOW.labels(pool=name).set_function(lambda pool=pool: max(pool.overflow(), 0))
+        POOL_SIZE.labels(pool=name).set_function(pool.size)
@@ -1,81 +1,307 @@
 """
 File Storage Utilities for CSV Uploads
+
+Uploads are content-addressed: the file reference is the SHA-256 of the file
+contents, so identical uploads share one file on disk. Each save takes a
+reference on the file and each delete_file() releases one; the file is
+removed when the last reference goes away.
 """
 import os
+import io
+import gzip
+import zlib
+import hashlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any, Iterator, List, Tuple, TextIO
 import uuid
 from datetime import datetime
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from app.core.config import settings
+
+# File locking for reference counts (not available on Windows dev machines)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Optional zstd support for .csv.zst uploads
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 
 UPLOAD_DIR = Path("data/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Bytes read from the request body per iteration when streaming uploads
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Allowance for multipart boundaries and form fields around the file in Content-Length
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Plain and compressed extensions a stored CSV upload may carry
+PLAIN_EXTENSIONS = [".csv", ".txt"]
+COMPRESSION_EXTENSIONS = [".gz", ".zst"] if zstandard else [".gz"]
+CSV_UPLOAD_EXTENSIONS = PLAIN_EXTENSIONS + [
+    plain + compression
+    for compression in COMPRESSION_EXTENSIONS
+    for plain in PLAIN_EXTENSIONS
+]
+
+# Columnar uploads (Parquet, Arrow IPC/Feather) are read with pyarrow
+COLUMNAR_EXTENSIONS = [".parquet", ".arrow", ".feather"]
+
+UPLOAD_EXTENSIONS = CSV_UPLOAD_EXTENSIONS + COLUMNAR_EXTENSIONS
+
+# Raised while reading a corrupt or truncated compressed upload
+DECOMPRESSION_ERRORS = (gzip.BadGzipFile, zlib.error, EOFError) + (
+    (zstandard.ZstdError,) if zstandard else ()
+)
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds MAX_UPLOAD_SIZE_MB"""
+
+
+def max_upload_bytes() -> int:
+    """Upload size limit in bytes (settings.MAX_UPLOAD_SIZE_MB)"""
+    return settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    Route class for upload endpoints: rejects a request whose Content-Length
+    is over the upload limit with 413 before the body is read
+    FastAPI parses multipart forms (spooling UploadFile contents to temp
+    files) before the endpoint runs, so save_upload_stream's own check only
+    fires once the whole upload is on disk. Chunked requests without a
+    Content-Length still rely on that check.
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def size_limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            max_bytes = max_upload_bytes()
+            if content_length.isdigit() and int(content_length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Upload exceeds the maximum allowed size of {max_bytes // (1024 * 1024)} MB"
+                )
+            return await handler(request)
+
+        return size_limited_handler
+
+
+def upload_extension(filename: str, extensions: List[str] = UPLOAD_EXTENSIONS) -> Optional[str]:
+    """
+    Return the allowed extension of filename (e.g. ".csv" or ".csv.gz")
+    None if the file type is not among extensions
+    """
+    lowered = filename.lower()
+    # Longest first so ".csv.gz" wins over a bare compression suffix
+    for ext in sorted(extensions, key=len, reverse=True):
+        if lowered.endswith(ext):
+            return ext
+    return None
+
+
+def is_allowed_upload(filename: Optional[str], extensions: List[str] = CSV_UPLOAD_EXTENSIONS) -> bool:
+    """Check whether filename is an accepted upload (by default a possibly compressed CSV/TXT)"""
+    return bool(filename) and upload_extension(filename, extensions) is not None
+
+
+@contextmanager
+def _refs_lock() -> Iterator[None]:
+    """Serialize reference count updates across API workers and Celery processes"""
+    with open(UPLOAD_DIR / ".refs.lock", "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _refs_path(file_ref: str) -> Path:
+    return UPLOAD_DIR / f".{file_ref}.refs"
+
+
+def get_reference_count(file_ref: str) -> int:
+    """
+    Number of live references to a stored file
+    Legacy UUID-named uploads have no count and report 0
+    """
+    refs_path = _refs_path(file_ref)
+    if not refs_path.exists():
+        return 0
+    return int(refs_path.read_text() or 0)
+
+
+def _commit_blob(part_path: Path, sha256: str, ext: str) -> Tuple[str, bool]:
+    """
+    Move a fully written temp file to its content address and take a reference
+    Returns (file_ref, deduplicated) where deduplicated means an identical
+    file was already stored and the temp file was discarded
+    """
+    with _refs_lock():
+        existing = get_file_path(sha256)
+        if existing:
+            part_path.unlink(missing_ok=True)
+        else:
+            os.replace(part_path, UPLOAD_DIR / f"{sha256}{ext}")
+        _refs_path(sha256).write_text(str(get_reference_count(sha256) + 1))
+    return sha256, existing is not None
+
 
 def save_uploaded_file(file_content: bytes, filename: str) -> str:
     """
     Save uploaded file and return file reference
-    
+
     Args:
         file_content: File content as bytes
         filename: Original filename
-        
+
     Returns:
-        file_ref: Unique file reference (UUID-based)
+        file_ref: Content-addressed file reference (SHA-256 hex digest)
     """
-    # Generate unique file reference
-    file_ref = str(uuid.uuid4())
-    
     # Get file extension
-    ext = Path(filename).suffix or ".csv"
-    
-    # Create file path
-    file_path = UPLOAD_DIR / f"{file_ref}{ext}"
-    
+    ext = upload_extension(filename) or ".csv"
+
+    part_path = UPLOAD_DIR / f".{uuid.uuid4()}{ext}.part"
+
     # Save file
-    with open(file_path, "wb") as f:
+    with open(part_path, "wb") as f:
         f.write(file_content)
-    
+
+    file_ref, _ = _commit_blob(part_path, hashlib.sha256(file_content).hexdigest(), ext)
     return file_ref
 
 
+async def save_upload_stream(
+    upload,
+    filename: str,
+    max_bytes: Optional[int] = None,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Stream an upload to disk chunk by chunk, hashing and size-checking on the way
+    For a FastAPI UploadFile the body is already spooled by the time this
+    runs; routes use UploadSizeLimitRoute to reject oversized requests first
+
+    Args:
+        upload: Object with an async read(size) method (e.g. fastapi.UploadFile)
+        filename: Original filename
+        max_bytes: Size limit; defaults to settings.MAX_UPLOAD_SIZE_MB
+        chunk_size: Bytes per read
+
+    Returns:
+        Dict with file_ref, size (bytes), sha256 (hex digest) and deduplicated
+        (True if identical content was already stored)
+
+    Raises:
+        UploadTooLargeError: upload exceeded max_bytes (partial file is removed)
+    """
+    if max_bytes is None:
+        max_bytes = max_upload_bytes()
+
+    # Compressed uploads are stored as-is and decompressed when parsed
+    ext = upload_extension(filename) or ".csv"
+
+    # Write to a temp name; the content address is only known at the end
+    part_path = UPLOAD_DIR / f".{uuid.uuid4()}{ext}.part"
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(part_path, "wb") as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(
+                        f"Upload exceeds the maximum allowed size of {max_bytes // (1024 * 1024)} MB"
+                    )
+                digest.update(chunk)
+                await run_in_threadpool(f.write, chunk)
+        file_ref, deduplicated = _commit_blob(part_path, digest.hexdigest(), ext)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    return {
+        "file_ref": file_ref,
+        "size": size,
+        "sha256": file_ref,
+        "deduplicated": deduplicated,
+    }
+
+
 def get_file_path(file_ref: str) -> Optional[Path]:
     """
     Get file path from file reference
-    
+
     Args:
-        file_ref: File reference UUID
-        
+        file_ref: File reference (SHA-256 digest, or UUID for older uploads)
+
     Returns:
         Path to file if exists, None otherwise
     """
     # Try to find file with common extensions
-    for ext in [".csv", ".txt"]:
+    for ext in UPLOAD_EXTENSIONS:
         file_path = UPLOAD_DIR / f"{file_ref}{ext}"
         if file_path.exists():
             return file_path
-    
+
     return None
 
 
-def delete_file(file_ref: str) -> bool:
+def open_upload_text(file_path: Path) -> TextIO:
     """
-    Delete uploaded file
-    
-    Args:
-        file_ref: File reference UUID
-        
-    Returns:
-        True if deleted, False if not found
+    Open a stored upload for reading as UTF-8 text
+    Compressed files are decompressed as a stream, never fully in memory
     """
-    file_path = get_file_path(file_ref)
-    if file_path and file_path.exists():
-        file_path.unlink()
-        return True
-    return False
+    name = file_path.name.lower()
+    if name.endswith(".gz"):
+        return gzip.open(file_path, "rt", encoding="utf-8", newline="")
+    if name.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError("zstd-compressed uploads require the zstandard package")
+        raw = open(file_path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8", newline="")
+    return open(file_path, "r", encoding="utf-8", newline="")
 
 
+def delete_file(file_ref: str) -> bool:
+    """
+    Release one reference to an uploaded file
+    The file is removed from disk once no references remain
 
+    Args:
+        file_ref: File reference
 
+    Returns:
+        True if a reference was released, False if not found
+    """
+    with _refs_lock():
+        file_path = get_file_path(file_ref)
+        if not file_path:
+            return False
 
+        remaining = get_reference_count(file_ref) - 1
+        if remaining > 0:
+            _refs_path(file_ref).write_text(str(remaining))
+            return True
 
+        file_path.unlink()
+        _refs_path(file_ref).unlink(missing_ok=True)
+        return True
@@ -2,7 +2,9 @@
 PII Guard Module
 Enforces no PII (Personal Identifiable Information) in data collection and storage
 """
-from typing import Dict, List, Any, Union
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Any, Union, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
 import re
 
 
@@ -30,22 +32,30 @@ DISALLOWED_PII_KEYS = [
 ]
 
 
+_SEPARATORS_RE = re.compile(r'[_\s\-]')
+
+
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
     """
     Normalize a key for comparison (lowercase, replace spaces/underscores/dashes)
+    Cached: imports see the same few column names millions of times
     """
     normalized = key.lower()
-    normalized = re.sub(r'[_\s\-]', '', normalized)
+    normalized = _SEPARATORS_RE.sub('', normalized)
     return normalized
 
 
+# Pre-normalized once so check_key is a single set lookup
+DISALLOWED_PII_KEYS_NORMALIZED = frozenset(normalize_key(k) for k in DISALLOWED_PII_KEYS)
+
+
 def check_key(key: str) -> bool:
     """
     Check if a key is a disallowed PII key
     Returns True if disallowed, False if allowed
     """
-    normalized = normalize_key(key)
-    return normalized in [normalize_key(k) for k in DISALLOWED_PII_KEYS]
+    return normalize_key(key) in DISALLOWED_PII_KEYS_NORMALIZED
 
 
 def assert_no_pii_keys(obj: Union[Dict, List, Any], path: str = "") -> None:
@@ -59,10 +69,9 @@ def assert_no_pii_keys(obj: Union[Dict, List, Any], path: str = "") -> None:
     """
     if isinstance(obj, dict):
         for key, value in obj.items():
-            current_path = f"{path}.{key}" if path else key
-            
             # Check if key itself is disallowed
             if check_key(key):
+                current_path = f"{path}.{key}" if path else key
                 raise ValueError(
                     f"Disallowed PII key detected: '{key}' at path '{current_path}'. "
                     f"This field contains personal identifiable information and cannot be stored."
@@ -70,7 +79,7 @@ def assert_no_pii_keys(obj: Union[Dict, List, Any], path: str = "") -> None:
             
             # Recursively check nested objects
             if isinstance(value, (dict, list)):
-                assert_no_pii_keys(value, current_path)
+                assert_no_pii_keys(value, f"{path}.{key}" if path else key)
     
     elif isinstance(obj, list):
         for idx, item in enumerate(obj):
@@ -99,6 +108,125 @@ def validate_csv_headers(headers: List[str]) -> None:
         )
 
 
+class HeaderSchemaGuard:
+    """
+    Row-level PII key guard for flat tabular rows (e.g. csv.DictReader output)
+    
+    Headers are validated once up front. A row whose keys are all among the
+    validated headers skips per-key checks entirely; any other row falls
+    back to assert_no_pii_keys.
+    """
+    
+    def __init__(self, headers: Iterable[str]):
+        headers = list(headers)
+        validate_csv_headers(headers)
+        self.validated_keys = frozenset(headers)
+    
+    def check_row(self, row: Mapping[str, Any]) -> None:
+        """Raise ValueError if row carries a disallowed PII key"""
+        if self.validated_keys.issuperset(row.keys()):
+            return
+        assert_no_pii_keys(dict(row))
+
+
+# Value-level patterns for PII embedded in free text (notes, descriptions)
+# Separators exclude newlines so batch scans can't match across values
+PII_VALUE_PATTERNS: Dict[str, str] = {
+    "email": r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}",
+    "ssn": r"(?<!\d)\d{3}-\d{2}-\d{4}(?!\d)",
+    "phone": r"(?<!\d)(?:\+?1[-. ]?)?(?:\(\d{3}\) ?|\d{3}[-. ])\d{3}[-. ]\d{4}(?!\d)",
+}
+
+_PII_VALUE_RE = re.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in PII_VALUE_PATTERNS.items())
+)
+
+# Values joined per regex scan; bounds the size of the joined string
+PII_VALUE_SCAN_CHUNK_SIZE = 10000
+_VALUE_SEPARATOR = "\n"
+
+
+def find_pii_value(value: Any) -> Optional[str]:
+    """
+    Check a single value for embedded PII
+    Returns the PII kind ("email", "phone", "ssn") or None
+    """
+    if not isinstance(value, str):
+        return None
+    match = _PII_VALUE_RE.search(value)
+    return match.lastgroup if match else None
+
+
+def iter_pii_values(
+    values: Sequence[Any],
+    chunk_size: int = PII_VALUE_SCAN_CHUNK_SIZE
+) -> Iterator[Tuple[int, str]]:
+    """
+    Batch scan a column of values for embedded PII
+    Yields (index, kind) for each offending value, in order
+    
+    Each chunk of values is joined and scanned with one combined regex, so a
+    clean chunk costs a single search.
+    """
+    for chunk_start in range(0, len(values), chunk_size):
+        parts = [
+            value.replace(_VALUE_SEPARATOR, " ") if isinstance(value, str) else ""
+            for value in values[chunk_start:chunk_start + chunk_size]
+        ]
+        joined = _VALUE_SEPARATOR.join(parts)
+        
+        first = _PII_VALUE_RE.search(joined)
+        if first is None:
+            continue
+        
+        # Only build the offset table when the chunk has a hit
+        offsets = []
+        position = 0
+        for part in parts:
+            offsets.append(position)
+            position += len(part) + len(_VALUE_SEPARATOR)
+        
+        last_index = -1
+        for match in _PII_VALUE_RE.finditer(joined, first.start()):
+            index = bisect_right(offsets, match.start()) - 1
+            if index != last_index:
+                last_index = index
+                yield chunk_start + index, match.lastgroup
+
+
+def assert_no_pii_values(
+    rows: Sequence[Mapping[str, Any]],
+    columns: Optional[Iterable[str]] = None,
+    row_offset: int = 0
+) -> None:
+    """
+    Column-wise check of tabular rows for PII embedded in values
+    Raises ValueError on the first offending value (the value itself is not echoed)
+    
+    Args:
+        rows: Row dictionaries (e.g. parsed CSV rows)
+        columns: Columns to scan; defaults to every key seen in rows
+        row_offset: Rows preceding this batch (keeps error row numbers absolute)
+    """
+    if columns is None:
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+    
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        for index, kind in iter_pii_values(values):
+            raise ValueError(
+                f"Disallowed PII value detected: {kind} in column '{column}' (row {row_offset + index + 1}). "
+                f"Values containing personal identifiable information cannot be imported."
+            )
+
+
+def redact_pii_values(text: Optional[str]) -> Optional[str]:
+    """Replace embedded emails/phones/SSNs in free text with [REDACTED]"""
+    if not text:
+        return text
+    return _PII_VALUE_RE.sub("[REDACTED]", text)
+
+
 def sanitize_for_logging(data: Any) -> Any:
     """
     Sanitize data for logging (remove potential PII)
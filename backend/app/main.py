@@ -4,6 +4,8 @@ Local Buyer Intelligence Platform - Main FastAPI Application
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import engine, async_engine, read_engine, async_read_engine
+from app.core.db_metrics import register_pool_gauges
 from app.api.v1.api import api_router
 
 # Prometheus metrics instrumentation
@@ -53,6 +55,10 @@ async def health_check():
 # Initialize Prometheus metrics (exposes /metrics endpoint)
 if PROMETHEUS_ENABLED:
     Instrumentator().instrument(app).expose(app)
+    pools = {"api": engine, "api_async": async_engine.sync_engine}
+    if read_engine is not engine:
+        pools.update({"api_read": read_engine, "api_async_read": async_read_engine.sync_engine})
+    register_pool_gauges(pools)
 
 
 
@@ -4,7 +4,8 @@ Database Models
 from app.models.household import Household
 from app.models.geography import Geography, ZIPCode, Neighborhood
 from app.models.demand_signal import DemandSignal, ServiceCategory, SignalType
-from app.models.intelligence_report import IntelligenceReport
+from app.models.intelligence_report import IntelligenceReport, ReportStatus, ReportCacheEntry
+from app.models.zip_demand_rollup import ZIPDemandRollup
 from app.models.client import Client, User, UserRole
 from app.models.ingestion import IngestionRun, SourceType, IngestionStatus
 from app.models.channel import Channel, ChannelType
@@ -21,6 +22,9 @@ __all__ = [
     "ServiceCategory",
     "SignalType",
     "IntelligenceReport",
+    "ReportStatus",
+    "ReportCacheEntry",
+    "ZIPDemandRollup",
     "Client",
     "User",
     "UserRole",
@@ -1,7 +1,7 @@
 """
 Household Data Models (Non-PII)
 """
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Enum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
@@ -33,6 +33,18 @@ class Household(Base):
     Stores aggregated household characteristics without personal identifiers
     """
     __tablename__ = "households"
+    __table_args__ = (
+        # Covers household facet counts (index-only scans per geography)
+        Index(
+            "ix_households_client_geography",
+            "client_id",
+            "geography_id",
+            postgresql_include=[
+                "zip_code_id", "property_type", "ownership_type",
+                "income_band_min", "income_band_max", "lot_size_sqft",
+            ],
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False, index=True)
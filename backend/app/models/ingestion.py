@@ -16,6 +16,7 @@ class SourceType(str, enum.Enum):
     CSV_PROPERTY = "csv_property"
     CSV_EVENTS = "csv_events"
     CSV_CHANNELS = "csv_channels"
+    COLUMNAR_PROPERTY = "columnar_property"
 
 
 class IngestionStatus(str, enum.Enum):
@@ -5,10 +5,19 @@ from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Tex
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
+import enum
 from app.core.database import Base
 from app.models.demand_signal import ServiceCategory
 
 
+class ReportStatus(str, enum.Enum):
+    """Status of report generation"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class IntelligenceReport(Base):
     """
     Generated intelligence reports for clients
@@ -31,6 +40,13 @@ class IntelligenceReport(Base):
     generated_at = Column(DateTime(timezone=True), server_default=func.now())
     valid_until = Column(DateTime(timezone=True))
     
+    # Generation status (reports are computed by generate_report_task)
+    status = Column(String(20), nullable=False, default=ReportStatus.PENDING.value, server_default=ReportStatus.COMPLETED.value)  # ReportStatus enum value
+    progress = Column(Integer, nullable=False, default=0, server_default="0")  # Percent complete
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    error_message = Column(Text, nullable=True)
+    
     # Summary statistics
     total_households = Column(Integer)
     target_households = Column(Integer)
@@ -65,3 +81,26 @@ class IntelligenceReport(Base):
     def __repr__(self):
         return f"<IntelligenceReport {self.report_name} - {self.service_category}>"
 
+
+class ReportCacheEntry(Base):
+    """
+    Computed report contents keyed by report inputs
+    One row per (client, geography, ZIP set, category); freshness_key holds the
+    geography's data refresh stamps at compute time, so a refresh of any input
+    source turns the entry into a miss and the next computation overwrites it
+    """
+    __tablename__ = "report_cache_entries"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False, index=True)
+    geography_id = Column(Integer, ForeignKey("geographies.id"), nullable=False, index=True)
+    inputs_key = Column(String(64), nullable=False, unique=True)  # sha256 of client, geography, ZIPs, category
+    freshness_key = Column(String(64), nullable=False)  # sha256 of geography *_last_refreshed_at stamps
+    payload = Column(JSON, nullable=False)  # Computed IntelligenceReport fields
+    
+    # Metadata
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ReportCacheEntry {self.inputs_key[:12]} - geography {self.geography_id}>"
@@ -0,0 +1,42 @@
+"""
+ZIP Demand Rollup Models
+Precomputed household demand-score statistics per ZIP code and service category
+"""
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import UUID
+from app.core.database import Base
+
+
+class ZIPDemandRollup(Base):
+    """
+    Household demand-score summary for one (client, ZIP, category)
+    Maintained by DemandRollupService so ZIP scoring doesn't scan households
+    """
+    __tablename__ = "zip_demand_rollups"
+    __table_args__ = (
+        UniqueConstraint("client_id", "zip_code_id", "service_category", name="uq_zip_demand_rollup"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False, index=True)
+    zip_code_id = Column(Integer, ForeignKey("zip_codes.id"), nullable=False, index=True)
+    service_category = Column(String(50), nullable=False)  # ServiceCategory enum value
+    
+    # Household score distribution (scores are 0-100)
+    household_count = Column(Integer, nullable=False, default=0)
+    avg_score = Column(Float, nullable=False, default=0.0)
+    score_p25 = Column(Float)
+    score_p50 = Column(Float)
+    score_p75 = Column(Float)
+    score_p90 = Column(Float)
+    
+    # Household characteristics (fractions 0-1)
+    owner_ratio = Column(Float, nullable=False, default=0.0)
+    large_lot_ratio = Column(Float, nullable=False, default=0.0)  # lot_size_sqft > 5000
+    
+    # Metadata
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ZIPDemandRollup zip {self.zip_code_id} - {self.service_category}: {self.avg_score}>"
@@ -2,7 +2,7 @@
 Household Schemas
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 from app.models.household import PropertyType, OwnershipType
 import uuid
@@ -58,3 +58,9 @@ class HouseholdResponse(BaseModel):
         from_attributes = True
         use_enum_values = True
 
+
+class HouseholdFacetsResponse(BaseModel):
+    """Household counts per facet value for a geography and filter"""
+    geography_id: int
+    total: int
+    facets: Dict[str, Dict[str, int]]  # property_type, ownership_type, income_band, lot_size_band
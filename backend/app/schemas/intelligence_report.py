@@ -2,7 +2,7 @@
 Intelligence Report Schemas
 """
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Literal, Union
 from datetime import datetime
 from app.models.demand_signal import ServiceCategory
 import uuid
@@ -44,6 +44,14 @@ class IntelligenceReportCreate(BaseModel):
     report_name: Optional[str] = None
 
 
+class IntelligenceReportBatchCreate(BaseModel):
+    """Schema for creating one intelligence report per service category"""
+    geography_id: int
+    zip_codes: str  # Comma-separated
+    service_categories: Union[Literal["all"], List[str]] = Field(..., description='Category values, or "all"')
+    report_name: Optional[str] = None  # Prefix; the category is appended
+
+
 class ZIPDemandScore(BaseModel):
     """ZIP code demand score"""
     zip_code: str
@@ -71,6 +79,11 @@ class IntelligenceReportResponse(BaseModel):
     report_name: Optional[str]
     generated_at: datetime
     valid_until: Optional[datetime]
+    status: str
+    progress: int
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error_message: Optional[str] = None
     total_households: Optional[int]
     target_households: Optional[int]
     average_demand_score: Optional[float]
@@ -87,3 +100,93 @@ class IntelligenceReportResponse(BaseModel):
         from_attributes = True
         use_enum_values = True
 
+
+
+class ZIPScenario(BaseModel):
+    """A candidate ZIP bundle to compare"""
+    name: str
+    zip_codes: str  # Comma-separated
+
+
+class ScenarioComparisonRequest(BaseModel):
+    """Schema for comparing ZIP bundles within one geography"""
+    geography_id: int
+    service_category: str
+    scenarios: List[ZIPScenario] = Field(..., min_length=1, max_length=500)
+    top_n: int = Field(5, ge=1, le=50)
+
+
+class ScenarioSummary(BaseModel):
+    """Summary metrics for one ZIP bundle"""
+    name: str
+    zip_codes: List[str]
+    unknown_zip_codes: List[str]  # Not ZIP codes of the geography
+    total_households: int
+    average_demand_score: float
+    homeowner_percentage: float
+    top_zip_codes: List[Dict[str, Any]]
+
+
+class WeightSetting(BaseModel):
+    """Alternate multipliers for the features of a category's scoring rule"""
+    name: str
+    weights: Dict[str, float]  # Feature -> multiplier (omitted = 1.0); "base" scales the base score
+
+
+class WeightSimulationRequest(BaseModel):
+    """Schema for simulating alternate scoring weights over a geography"""
+    geography_id: int
+    service_category: str
+    zip_codes: Optional[str] = None  # Comma-separated; defaults to every ZIP of the geography
+    weight_settings: List[WeightSetting] = Field(..., min_length=1, max_length=100)
+
+
+class ZIPWeightImpact(BaseModel):
+    """Score and rank of one ZIP under current and alternate weights"""
+    zip_code: str
+    household_count: int
+    baseline_score: float
+    score: float
+    delta: float
+    baseline_rank: int
+    rank: int
+    rank_change: int  # Positive = moved up
+
+
+class WeightSimulationResult(BaseModel):
+    """ZIP impacts of one weight setting, ordered by new rank"""
+    name: str
+    weights: Dict[str, float]
+    zip_codes: List[ZIPWeightImpact]
+
+
+class WeightSimulationResponse(BaseModel):
+    """Weight simulation results for a geography"""
+    service_category: str
+    features: List[str]  # Weightable features of the category's rule (plus "base")
+    results: List[WeightSimulationResult]
+
+
+class ScoreBucket(BaseModel):
+    """Households scoring in [lower, upper) (the last bucket includes 100)"""
+    lower: int
+    upper: int
+    count: int
+
+
+class ZIPScoreDistribution(BaseModel):
+    """Household demand-score distribution of one ZIP"""
+    zip_code: str
+    household_count: int
+    average_score: float
+    percentiles: Dict[str, Optional[float]]  # p25, p50, p75, p90
+    buckets: List[ScoreBucket]
+    at_or_above: Dict[str, int]  # Threshold -> households scoring >= threshold
+
+
+class ScoreDistributionResponse(BaseModel):
+    """Household demand-score distributions by ZIP for a geography"""
+    geography_id: int
+    service_category: str
+    bucket_width: int
+    zip_codes: List[ZIPScoreDistribution]
@@ -0,0 +1,121 @@
+"""
+Service Category Classifier
+Maps free-text event titles/descriptions/categories to ServiceCategory values
+"""
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import re
+from app.models.demand_signal import ServiceCategory
+
+
+# Keyword table in priority order: the first matching category is the
+# primary one. Matching is case-insensitive substring matching, so
+# "firework" also matches "Fireworks" and "park" matches "Parkway".
+CATEGORY_KEYWORDS: Dict[ServiceCategory, Tuple[str, ...]] = {
+    ServiceCategory.FIREWORKS: ("firework", "4th", "july", "independence"),
+    ServiceCategory.LAWN_CARE: ("park", "festival", "outdoor", "lawn"),
+    ServiceCategory.SECURITY: ("security", "safety"),
+}
+
+# Joins batch texts; never part of a keyword, so matches can't span two texts
+_BATCH_SEPARATOR = "\n"
+
+
+class CategoryClassifier:
+    """
+    Keyword classifier compiled into a single alternation regex
+    One scan over the text finds every matching category
+    """
+
+    def __init__(
+        self,
+        keywords: Optional[Dict[ServiceCategory, Sequence[str]]] = None,
+        default: ServiceCategory = ServiceCategory.GENERAL
+    ):
+        keywords = CATEGORY_KEYWORDS if keywords is None else keywords
+        self.default = default
+        self._priority = {category: rank for rank, category in enumerate(keywords)}
+
+        all_keywords = {kw.lower() for kws in keywords.values() for kw in kws}
+
+        # The regex reports only one alternative per position, so a keyword
+        # also carries the categories of any keyword it contains
+        self._keyword_categories: Dict[str, frozenset] = {}
+        for keyword in all_keywords:
+            self._keyword_categories[keyword] = frozenset(
+                category
+                for category, kws in keywords.items()
+                for kw in kws
+                if kw.lower() in keyword
+            )
+
+        # Longest first so the most specific keyword wins at a position
+        alternation = "|".join(
+            re.escape(kw) for kw in sorted(all_keywords, key=len, reverse=True)
+        )
+        self._pattern = re.compile(alternation) if alternation else None
+
+    def _ordered(self, categories: Iterable[ServiceCategory]) -> List[ServiceCategory]:
+        found = sorted(set(categories), key=self._priority.__getitem__)
+        return found or [self.default]
+
+    def classify(self, text: Optional[str]) -> List[ServiceCategory]:
+        """
+        Return every matching category in priority order
+        Falls back to [default] when nothing matches
+        """
+        if not text or self._pattern is None:
+            return [self.default]
+
+        categories = set()
+        for match in self._pattern.finditer(text.lower()):
+            categories.update(self._keyword_categories[match.group(0)])
+        return self._ordered(categories)
+
+    def classify_primary(self, text: Optional[str]) -> ServiceCategory:
+        """Return the highest-priority matching category"""
+        return self.classify(text)[0]
+
+    def classify_many(self, texts: Sequence[Optional[str]]) -> List[List[ServiceCategory]]:
+        """
+        Classify many texts with one regex scan over their concatenation
+        Returns one category list per input text, in input order
+        """
+        if not texts:
+            return []
+        if self._pattern is None:
+            return [[self.default] for _ in texts]
+
+        parts = [(text or "").lower().replace(_BATCH_SEPARATOR, " ") for text in texts]
+
+        # Start offset of each text inside the joined string
+        offsets = []
+        position = 0
+        for part in parts:
+            offsets.append(position)
+            position += len(part) + len(_BATCH_SEPARATOR)
+
+        matched: List[set] = [set() for _ in parts]
+        for match in self._pattern.finditer(_BATCH_SEPARATOR.join(parts)):
+            index = bisect_right(offsets, match.start()) - 1
+            matched[index].update(self._keyword_categories[match.group(0)])
+
+        return [self._ordered(categories) for categories in matched]
+
+    def classify_many_primary(self, texts: Sequence[Optional[str]]) -> List[ServiceCategory]:
+        """Batch variant of classify_primary"""
+        return [categories[0] for categories in self.classify_many(texts)]
+
+
+# Shared instance compiled once at import time
+default_classifier = CategoryClassifier()
+
+
+def classify_categories(text: Optional[str]) -> List[ServiceCategory]:
+    """Return all matching service categories for text"""
+    return default_classifier.classify(text)
+
+
+def classify_primary_category(text: Optional[str]) -> ServiceCategory:
+    """Return the primary service category for text"""
+    return default_classifier.classify_primary(text)
@@ -0,0 +1,225 @@
+"""
+Columnar Import Service
+Imports property data from Parquet or Arrow IPC (Feather) files
+
+Files are read column-wise against a declared schema and aggregated with
+vectorized group-bys, avoiding the per-row string parsing of CSV imports.
+Column names are PII-checked before any data is read.
+"""
+from datetime import datetime
+from typing import List, Dict, Any
+from pathlib import Path
+import uuid
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy.orm import Session
+from app.core.pii_guard import validate_csv_headers
+from app.core.file_storage import get_file_path
+from app.models.household import PropertyType, OwnershipType
+from app.services.csv_import import CSVImportService
+
+
+# Declared schema for property files; only zip_code is required
+PROPERTY_SCHEMA = pa.schema([
+    pa.field("zip_code", pa.string()),
+    pa.field("property_type", pa.string()),
+    pa.field("ownership_type", pa.string()),
+    pa.field("lot_size_sqft", pa.int64()),
+    pa.field("year_built", pa.int64()),
+])
+
+REQUIRED_PROPERTY_COLUMNS = ("zip_code",)
+
+GROUP_KEYS = ["zip_code", "property_type", "ownership_type"]
+
+
+def _read_schema(file_path: Path) -> pa.Schema:
+    """Read a file's schema without loading any column data"""
+    if file_path.suffix == ".parquet":
+        return pq.read_schema(file_path)
+    with pa.memory_map(str(file_path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def _read_columns(file_path: Path, columns: List[str]) -> pa.Table:
+    """Read only the given columns of a Parquet or Arrow IPC file"""
+    if file_path.suffix == ".parquet":
+        return pq.read_table(file_path, columns=columns, memory_map=True)
+    # The map stays open for as long as the returned (zero-copy) table needs it
+    source = pa.memory_map(str(file_path))
+    return pa.ipc.open_file(source).read_all().select(columns)
+
+
+def _normalize_enum(values: pa.ChunkedArray, enum_cls) -> pa.ChunkedArray:
+    """
+    Map upper-cased enum names to enum values
+    Blank values become null and unrecognized values become "unknown"
+    """
+    names = pa.array([member.name for member in enum_cls])
+    enum_values = pa.array([member.value for member in enum_cls])
+
+    blank = pc.fill_null(pc.equal(values, ""), True)
+    indices = pc.index_in(values, value_set=names)
+    mapped = pc.take(enum_values, indices)
+    fallback = pc.if_else(blank, pa.scalar(None, pa.string()), enum_cls.UNKNOWN.value)
+    return pc.if_else(pc.is_valid(indices), mapped, fallback)
+
+
+def normalize_property_table(table: pa.Table) -> pa.Table:
+    """
+    Clean a property table the same way CSV property imports clean rows
+    Rows without a ZIP code are dropped; year_built becomes property_age
+    """
+    zip_codes = pc.utf8_trim_whitespace(table["zip_code"])
+    has_zip = pc.fill_null(pc.not_equal(zip_codes, ""), False)
+
+    property_types = _normalize_enum(
+        pc.utf8_upper(pc.utf8_trim_whitespace(table["property_type"])), PropertyType
+    )
+
+    ownership = pc.utf8_upper(pc.utf8_trim_whitespace(table["ownership_type"]))
+    # Handle OWNER_OCCUPIED -> OWNER before falling back to name lookup
+    ownership_types = pc.if_else(
+        pc.fill_null(pc.match_substring(ownership, "OWNER"), False),
+        OwnershipType.OWNER.value,
+        pc.if_else(
+            pc.fill_null(pc.match_substring(ownership, "RENTER"), False),
+            OwnershipType.RENTER.value,
+            _normalize_enum(ownership, OwnershipType)
+        )
+    )
+
+    property_age = pc.subtract(datetime.now().year, table["year_built"])
+
+    normalized = pa.table({
+        "zip_code": zip_codes,
+        "property_type": property_types,
+        "ownership_type": ownership_types,
+        "lot_size_sqft": table["lot_size_sqft"],
+        "property_age": property_age,
+    })
+    return normalized.filter(has_zip)
+
+
+def aggregate_property_table(table: pa.Table) -> List[Dict[str, Any]]:
+    """
+    Group a normalized property table by (zip_code, property_type, ownership_type)
+    Returns one dict per group with count and average lot size / property age
+    """
+    grouped = table.group_by(GROUP_KEYS).aggregate([
+        ([], "count_all"),
+        ("lot_size_sqft", "mean"),
+        ("property_age", "mean"),
+    ])
+
+    return [
+        {
+            "zip_code": row["zip_code"],
+            "property_type": PropertyType(row["property_type"]) if row["property_type"] else None,
+            "ownership_type": OwnershipType(row["ownership_type"]) if row["ownership_type"] else None,
+            "count": row["count_all"],
+            "avg_lot_size_sqft": row["lot_size_sqft_mean"],
+            "avg_property_age_years": row["property_age_mean"],
+        }
+        for row in grouped.to_pylist()
+    ]
+
+
+class ColumnarImportService:
+    """Service for importing Parquet/Arrow property data"""
+
+    def __init__(self, db: Session, client_id: uuid.UUID):
+        self.db = db
+        self.client_id = client_id
+
+    def _file_path(self, file_ref: str) -> Path:
+        file_path = get_file_path(file_ref)
+        if not file_path or not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_ref}")
+        return file_path
+
+    def _checked_schema(self, file_path: Path) -> pa.Schema:
+        """Read the file schema and reject PII or missing required columns"""
+        try:
+            schema = _read_schema(file_path)
+        except (pa.ArrowInvalid, OSError) as e:
+            raise ValueError(f"Could not read columnar file: {e}")
+
+        validate_csv_headers(schema.names)
+
+        missing = [name for name in REQUIRED_PROPERTY_COLUMNS if name not in schema.names]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        return schema
+
+    def validate_property_file(self, file_ref: str) -> int:
+        """
+        Validate column names (PII and required columns) from the file schema
+        Returns the number of rows
+
+        Raises:
+            ValueError: PII column, missing required column or unreadable file
+        """
+        file_path = self._file_path(file_ref)
+        self._checked_schema(file_path)
+
+        if file_path.suffix == ".parquet":
+            return pq.ParquetFile(file_path).metadata.num_rows
+        with pa.memory_map(str(file_path)) as source:
+            reader = pa.ipc.open_file(source)
+            return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    def read_property_table(self, file_ref: str) -> pa.Table:
+        """
+        Read the declared property columns, cast to the declared schema
+        Declared columns absent from the file are filled with nulls
+        """
+        file_path = self._file_path(file_ref)
+        schema = self._checked_schema(file_path)
+
+        present = [name for name in PROPERTY_SCHEMA.names if name in schema.names]
+        table = _read_columns(file_path, present)
+
+        columns = []
+        for field in PROPERTY_SCHEMA:
+            if field.name in present:
+                try:
+                    columns.append(table[field.name].cast(field.type))
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                    raise ValueError(f"Column '{field.name}' does not match declared type {field.type}: {e}")
+            else:
+                columns.append(pa.nulls(table.num_rows, field.type))
+
+        return pa.table(columns, schema=PROPERTY_SCHEMA)
+
+    def import_property_file(self, file_ref: str, geography_id: int) -> int:
+        """
+        Import a Parquet/Arrow property file as aggregated signals
+        Returns the number of aggregates stored
+        """
+        from app.models.geography import ZIPCode
+
+        aggregates = aggregate_property_table(normalize_property_table(self.read_property_table(file_ref)))
+
+        # Resolve all ZIP codes in one query, creating missing ones for the geography
+        zip_codes = {agg["zip_code"] for agg in aggregates}
+        zip_objs = {
+            zip_obj.zip_code: zip_obj
+            for zip_obj in self.db.query(ZIPCode).filter(ZIPCode.zip_code.in_(zip_codes)).all()
+        } if zip_codes else {}
+        for zip_code in sorted(zip_codes - zip_objs.keys()):
+            zip_obj = ZIPCode(zip_code=zip_code, geography_id=geography_id)
+            self.db.add(zip_obj)
+            zip_objs[zip_code] = zip_obj
+        self.db.flush()
+
+        for agg in aggregates:
+            agg["zip_obj"] = zip_objs[agg["zip_code"]]
+
+        return CSVImportService(self.db, self.client_id).store_property_aggregates(
+            aggregates,
+            geography_id,
+            source="columnar_import",
+            source_name="columnar_property_import"
+        )
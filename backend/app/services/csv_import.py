@@ -4,11 +4,12 @@ Handles parsing and validation of CSV imports
 """
 import csv
 import io
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Iterable
 from pathlib import Path
 from sqlalchemy.orm import Session
-from app.core.pii_guard import assert_no_pii_keys, validate_csv_headers
-from app.core.file_storage import get_file_path
+from app.core.pii_guard import HeaderSchemaGuard, assert_no_pii_values, PII_VALUE_SCAN_CHUNK_SIZE
+from app.core.file_storage import get_file_path, open_upload_text, DECOMPRESSION_ERRORS
+from app.services.category_classifier import default_classifier
 from app.models.household import PropertyType, OwnershipType
 from app.models.channel import ChannelType
 from app.models.demand_signal import SignalType, ServiceCategory
@@ -24,33 +25,65 @@ class CSVImportService:
         self.db = db
         self.client_id = client_id
     
-    def parse_csv_file(self, file_ref: str) -> List[Dict[str, Any]]:
+    def iter_csv_chunks(
+        self,
+        file_ref: str,
+        chunk_size: int = PII_VALUE_SCAN_CHUNK_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Parse CSV file and return list of dictionaries
+        Stream a CSV file as PII-validated chunks of row dictionaries
+        Only one chunk is held in memory at a time
         """
         file_path = get_file_path(file_ref)
         if not file_path or not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_ref}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open_upload_text(file_path) as f:
             reader = csv.DictReader(f)
             headers = reader.fieldnames or []
             
-            # Validate headers for PII
-            validate_csv_headers(headers)
+            # Validate headers for PII (rows matching the header schema skip per-key checks)
+            pii_guard = HeaderSchemaGuard(headers)
             
-            # Read all rows
-            rows = []
+            rows_seen = 0
+            chunk = []
             for row in reader:
                 # Clean row (remove None values from CSV parsing)
                 clean_row = {k: v for k, v in row.items() if v and v.strip()}
                 
                 # Validate row for PII
-                assert_no_pii_keys(clean_row)
+                pii_guard.check_row(clean_row)
                 
-                rows.append(clean_row)
+                chunk.append(clean_row)
+                if len(chunk) >= chunk_size:
+                    # Validate values for embedded PII (emails/phones/SSNs in notes etc.)
+                    assert_no_pii_values(chunk, headers, row_offset=rows_seen)
+                    rows_seen += len(chunk)
+                    yield chunk
+                    chunk = []
             
-            return rows
+            if chunk:
+                assert_no_pii_values(chunk, headers, row_offset=rows_seen)
+                yield chunk
+    
+    def parse_csv_file(self, file_ref: str) -> List[Dict[str, Any]]:
+        """
+        Parse CSV file and return list of dictionaries
+        """
+        rows = []
+        for chunk in self.iter_csv_chunks(file_ref):
+            rows.extend(chunk)
+        return rows
+    
+    def validate_csv_file(self, file_ref: str) -> int:
+        """
+        Validate a CSV file for PII without keeping its rows
+        Returns the number of data rows
+        """
+        try:
+            return sum(len(chunk) for chunk in self.iter_csv_chunks(file_ref))
+        except DECOMPRESSION_ERRORS as e:
+            raise ValueError(f"Could not decompress upload: {e}")
     
     def import_property_csv(
         self,
@@ -61,11 +94,7 @@ class CSVImportService:
         Import property CSV data as Household records or aggregated signals
         Uses aggregation strategy: store as signals grouped by ZIP/property type
         """
-        from app.models.household import Household
-        from app.models.geography import ZIPCode, Geography
-        from app.models.demand_signal import DemandSignal
-        
-        imported = 0
+        from app.models.geography import ZIPCode
         
         # Group by zip_code, property_type, ownership_type for aggregation
         aggregates = {}
@@ -148,20 +177,41 @@ class CSVImportService:
                 except (ValueError, TypeError):
                     pass
         
+        # Calculate averages
+        for agg_data in aggregates.values():
+            agg_data["avg_lot_size_sqft"] = sum(agg_data["lot_sizes"]) / len(agg_data["lot_sizes"]) if agg_data["lot_sizes"] else None
+            agg_data["avg_property_age_years"] = sum(agg_data["years_built"]) / len(agg_data["years_built"]) if agg_data["years_built"] else None
+        
+        return self.store_property_aggregates(aggregates.values(), geography_id)
+    
+    def store_property_aggregates(
+        self,
+        aggregates: Iterable[Dict[str, Any]],
+        geography_id: int,
+        source: str = "csv_import",
+        source_name: str = "csv_property_import"
+    ) -> int:
+        """
+        Store property aggregates as signals and mark the geography refreshed
+        
+        Each aggregate carries zip_code, zip_obj, property_type, ownership_type,
+        count, avg_lot_size_sqft and avg_property_age_years.
+        """
+        from app.models.geography import Geography
+        from app.models.demand_signal import DemandSignal
+        
+        imported = 0
+        
         # Create aggregated signals
-        for agg_key, agg_data in aggregates.items():
-            # Calculate averages
-            avg_lot_size = sum(agg_data["lot_sizes"]) / len(agg_data["lot_sizes"]) if agg_data["lot_sizes"] else None
-            avg_age = sum(agg_data["years_built"]) / len(agg_data["years_built"]) if agg_data["years_built"] else None
-            
+        for agg_data in aggregates:
             # Create signal with aggregated data
             metadata = {
-                "source": "csv_import",
+                "source": source,
                 "property_type": agg_data["property_type"].value if agg_data["property_type"] else None,
                 "ownership_type": agg_data["ownership_type"].value if agg_data["ownership_type"] else None,
                 "count": agg_data["count"],
-                "avg_lot_size_sqft": avg_lot_size,
-                "avg_property_age_years": avg_age,
+                "avg_lot_size_sqft": agg_data["avg_lot_size_sqft"],
+                "avg_property_age_years": agg_data["avg_property_age_years"],
             }
             
             signal = DemandSignal(
@@ -172,7 +222,7 @@ class CSVImportService:
                 service_category=ServiceCategory.GENERAL,
                 title=f"Property Aggregate: {agg_data['zip_code']}",
                 value=float(agg_data["count"]),
-                source_name="csv_property_import",
+                source_name=source_name,
                 signal_metadata=json.dumps(metadata)
             )
             self.db.add(signal)
@@ -198,7 +248,12 @@ class CSVImportService:
         
         imported = 0
         
-        for row in rows:
+        # Classify every row's event category in one scan
+        service_categories = default_classifier.classify_many_primary(
+            [row.get("category", "") for row in rows]
+        )
+        
+        for row, service_cat in zip(rows, service_categories):
             event_name = row.get("event_name", "").strip()
             if not event_name:
                 continue
@@ -251,14 +306,6 @@ class CSVImportService:
                 if zip_obj:
                     zip_code_id = zip_obj.id
             
-            # Determine service category from event category
-            category = row.get("category", "").lower()
-            service_cat = ServiceCategory.GENERAL
-            if "firework" in category or "4th" in category or "july" in category:
-                service_cat = ServiceCategory.FIREWORKS
-            elif "outdoor" in category or "park" in category:
-                service_cat = ServiceCategory.LAWN_CARE
-            
             # Create demand signal
             signal = DemandSignal(
                 client_id=self.client_id,
@@ -0,0 +1,83 @@
+"""
+ZIP Demand Rollup Service
+Maintains zip_demand_rollups, the per (client, ZIP, category) household
+score summaries that ZIP scoring and top-ZIP ranking read
+
+Refreshes are incremental: household writes refresh only the ZIP codes they
+touched. Property imports store geography aggregates, not households, so
+they leave the rollups alone.
+"""
+from typing import Iterable, List
+from sqlalchemy.orm import Session
+from app.models.demand_signal import ServiceCategory
+from app.models.geography import ZIPCode
+from app.models.household import Household
+from app.models.zip_demand_rollup import ZIPDemandRollup
+from app.services.intelligence_engine import IntelligenceEngine
+import uuid
+
+
+class DemandRollupService:
+    """Rebuilds ZIP demand rollups from households"""
+
+    def __init__(self, db: Session, client_id: uuid.UUID):
+        self.db = db
+        self.client_id = client_id
+        self.engine = IntelligenceEngine(db)
+
+    def refresh_zip_codes(self, zip_code_ids: Iterable[int]) -> int:
+        """
+        Recompute the rollups of the given ZIP codes for every service category
+        Returns the number of rollup rows written
+        """
+        zip_code_ids = sorted({zip_id for zip_id in zip_code_ids if zip_id is not None})
+        if not zip_code_ids:
+            return 0
+
+        # One streamed pass scores every category; only per-ZIP scores are kept
+        categories = list(ServiceCategory)
+        scored = self.engine.score_households(
+            self.engine.scan_households(self.client_id, zip_code_ids=zip_code_ids),
+            zip_code_ids,
+            categories
+        )
+
+        existing = {
+            (row.zip_code_id, row.service_category): row
+            for row in self.db.query(ZIPDemandRollup).filter(
+                ZIPDemandRollup.client_id == self.client_id,
+                ZIPDemandRollup.zip_code_id.in_(zip_code_ids)
+            ).all()
+        }
+
+        written = 0
+        for zip_id in zip_code_ids:
+            for category in categories:
+                summary = scored["rollups"][category][zip_id]
+                row = existing.get((zip_id, category.value))
+                if row is None:
+                    row = ZIPDemandRollup(
+                        client_id=self.client_id,
+                        zip_code_id=zip_id,
+                        service_category=category.value,
+                    )
+                    self.db.add(row)
+                for field, value in summary.items():
+                    setattr(row, field, value)
+                written += 1
+
+        self.db.commit()
+        return written
+
+    def refresh_geography(self, geography_id: int) -> int:
+        """Recompute the rollups of every ZIP code in a geography"""
+        zip_code_ids: List[int] = [
+            zip_id for (zip_id,) in self.db.query(ZIPCode.id).filter(ZIPCode.geography_id == geography_id)
+        ]
+        zip_code_ids += [
+            zip_id for (zip_id,) in self.db.query(Household.zip_code_id).filter(
+                Household.client_id == self.client_id,
+                Household.geography_id == geography_id
+            ).distinct()
+        ]
+        return self.refresh_zip_codes(zip_code_ids)
@@ -0,0 +1,214 @@
+"""
+Columnar Household Cache
+Per (client, geography) household scoring columns stored as Arrow IPC files
+
+Files live under HOUSEHOLD_CACHE_DIR and are opened with memory maps, so
+every API and Celery process on a node shares one copy through the page
+cache and reads columns without copying them. Each file name carries a
+fingerprint of the geography's property_last_refreshed_at stamp and its
+household count / max id / max updated_at, so imports and household writes
+make the next read rebuild the file instead of serving stale rows.
+
+Scoring reads the mapped columns as NumPy arrays (table_columns); records
+are built only for rows a caller actually returns.
+"""
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.geography import Geography
+from app.models.household import Household, OwnershipType, PropertyType
+from app.services.intelligence_engine import HOUSEHOLD_SCORING_COLUMNS, SCAN_BATCH_SIZE, IntelligenceEngine
+from app.services.scoring_rules import ENUM_CODES, MISSING_CODE, NUMERIC_COLUMNS, with_avg_income
+
+# Arrow schema for HOUSEHOLD_SCORING_COLUMNS (enums stored by value)
+HOUSEHOLD_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("zip_code_id", pa.int64()),
+    ("property_type", pa.string()),
+    ("ownership_type", pa.string()),
+    ("property_sqft_min", pa.int64()),
+    ("lot_size_sqft", pa.int64()),
+    ("income_band_min", pa.int64()),
+    ("income_band_max", pa.int64()),
+    ("property_age_years", pa.int64()),
+])
+
+ENUM_COLUMNS = {"property_type": PropertyType, "ownership_type": OwnershipType}
+
+# Superseded files are removed only after this long untouched (seconds)
+STALE_FILE_GRACE_SECONDS = 300
+
+
+def household_fingerprint(db: Session, client_id: uuid.UUID, geography: Geography) -> str:
+    """Changes whenever the geography's property data or households change"""
+    count, max_id, max_updated_at = db.query(
+        func.count(Household.id),
+        func.max(Household.id),
+        func.max(Household.updated_at)
+    ).filter(
+        Household.client_id == client_id,
+        Household.geography_id == geography.id
+    ).one()
+    parts = [geography.property_last_refreshed_at, count, max_id, max_updated_at]
+    return hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:16]
+
+
+class HouseholdRecord:
+    """Scoring columns of one household (same attributes as a scan row)"""
+    __slots__ = tuple(column.key for column in HOUSEHOLD_SCORING_COLUMNS)
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+
+class HouseholdCache:
+    """Builds and memory-maps per-geography household column files"""
+
+    def __init__(self, db: Session, cache_dir: Optional[str] = None):
+        self.db = db
+        self.cache_dir = Path(cache_dir or settings.HOUSEHOLD_CACHE_DIR)
+
+    def fingerprint(self, client_id: uuid.UUID, geography: Geography) -> str:
+        return household_fingerprint(self.db, client_id, geography)
+
+    def path(self, client_id: uuid.UUID, geography: Geography) -> Path:
+        return self.cache_dir / str(client_id) / f"{geography.id}-{self.fingerprint(client_id, geography)}.arrow"
+
+    def _build(self, client_id: uuid.UUID, geography: Geography, path: Path) -> None:
+        """Write the file via a temp name so readers never see a partial file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex}")
+        names = HOUSEHOLD_SCHEMA.names
+
+        def write_batch(writer, rows):
+            columns = list(zip(*rows)) if rows else [[] for _ in names]
+            arrays = [
+                [v.value if v is not None else None for v in column] if name in ENUM_COLUMNS else column
+                for name, column in zip(names, columns)
+            ]
+            writer.write_batch(pa.record_batch(
+                [pa.array(values, type=field.type) for values, field in zip(arrays, HOUSEHOLD_SCHEMA)],
+                schema=HOUSEHOLD_SCHEMA
+            ))
+
+        try:
+            with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, HOUSEHOLD_SCHEMA) as writer:
+                rows = []
+                scan = IntelligenceEngine(self.db).scan_households(client_id, geography.id)
+                for row in scan:
+                    rows.append(tuple(row))
+                    if len(rows) >= SCAN_BATCH_SIZE:
+                        write_batch(writer, rows)
+                        rows = []
+                if rows:
+                    write_batch(writer, rows)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        # Drop files for older fingerprints (processes that mapped them keep their
+        # view). Only files untouched for STALE_FILE_GRACE_SECONDS go: a builder
+        # whose fingerprint predates a concurrent write must not delete the
+        # newer file another process just found.
+        cutoff = time.time() - STALE_FILE_GRACE_SECONDS
+        for old in path.parent.glob(f"{geography.id}-*.arrow"):
+            try:
+                if old != path and old.stat().st_mtime < cutoff:
+                    old.unlink(missing_ok=True)
+            except FileNotFoundError:
+                pass
+
+    def ensure_file(self, client_id: uuid.UUID, geography: Geography) -> Path:
+        """Path of the geography's current household file, built on first use"""
+        path = self.path(client_id, geography)
+        if not path.exists():
+            self._build(client_id, geography, path)
+        return path
+
+    def load_table(self, client_id: uuid.UUID, geography: Geography) -> pa.Table:
+        """Memory-mapped household columns for the geography, built on first use"""
+        return self.load_file(client_id, geography)[1]
+
+    def load_file(self, client_id: uuid.UUID, geography: Geography) -> Tuple[Path, pa.Table]:
+        """load_table plus the path of the mapped file"""
+        path = self.ensure_file(client_id, geography)
+        try:
+            return path, read_table(path)
+        except FileNotFoundError:
+            # Removed by another process's cleanup between ensure_file and the
+            # map; once mapped, later removal is harmless
+            path = self.ensure_file(client_id, geography)
+            return path, read_table(path)
+
+    def records(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        zip_code_ids: Optional[List[int]] = None
+    ) -> List[HouseholdRecord]:
+        """Cached households as scoring records, optionally limited to ZIP codes"""
+        table = self.load_table(client_id, geography)
+        if zip_code_ids:
+            table = filter_zip_codes(table, zip_code_ids)
+        return table_records(table)
+
+
+def read_table(path: Path) -> pa.Table:
+    """Memory-map a household file; column buffers point into the shared mapping"""
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def filter_zip_codes(table: pa.Table, zip_code_ids: List[int]) -> pa.Table:
+    """Rows of a household table in the given ZIP codes (0 matches households without a ZIP)"""
+    zip_column = pc.fill_null(table.column("zip_code_id"), 0)
+    return table.filter(pc.is_in(zip_column, value_set=pa.array(zip_code_ids, pa.int64())))
+
+
+def table_records(table: pa.Table) -> List[HouseholdRecord]:
+    """Household table rows as scoring records"""
+    columns = []
+    for name in HOUSEHOLD_SCHEMA.names:
+        values = table.column(name).to_pylist()
+        if name in ENUM_COLUMNS:
+            enum_type = ENUM_COLUMNS[name]
+            values = [enum_type(v) if v is not None else None for v in values]
+        columns.append(values)
+    return [HouseholdRecord(*values) for values in zip(*columns)]
+
+
+def _enum_codes(column: pa.ChunkedArray, feature: str) -> np.ndarray:
+    """ENUM_CODES of a string enum column, looked up once per distinct value"""
+    enum_type = ENUM_COLUMNS[feature]
+    parts = []
+    for chunk in column.chunks:
+        encoded = chunk.dictionary_encode()
+        # Last slot is for nulls
+        lookup = np.array(
+            [ENUM_CODES[feature][enum_type(v)] for v in encoded.dictionary.to_pylist()] + [MISSING_CODE],
+            dtype=np.int16
+        )
+        indices = pc.fill_null(encoded.indices, len(encoded.dictionary)).to_numpy()
+        parts.append(lookup[indices])
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int16)
+
+
+def table_columns(table: Union[pa.Table, pa.RecordBatch]) -> Dict[str, np.ndarray]:
+    """household_columns() arrays read straight from a household table (no per-row objects)"""
+    if isinstance(table, pa.RecordBatch):
+        table = pa.Table.from_batches([table])
+    columns = {name: _enum_codes(table.column(name), name) for name in ENUM_COLUMNS}
+    for name in NUMERIC_COLUMNS:
+        columns[name] = pc.fill_null(table.column(name), 0).to_numpy().astype(float)
+    columns["zip_code_id"] = pc.fill_null(table.column("zip_code_id"), 0).to_numpy()
+    return with_avg_income(columns)
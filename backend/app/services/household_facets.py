@@ -0,0 +1,185 @@
+"""
+Household Facet Counts
+Counts of a geography's households by property type, ownership type,
+income band and lot-size band, for the filter panel
+
+PostgreSQL computes every facet in one GROUPING SETS query; other databases
+(SQLite) fetch the facet columns once and count them in a single Python
+pass. Filters are applied to the raw columns (band filters become range
+predicates), so the (client_id, geography_id) covering index serves both.
+"""
+from typing import Any, Dict, Optional
+import uuid
+from sqlalchemy import and_, case, func, literal_column, or_
+from sqlalchemy.orm import Session
+from app.models.household import Household, OwnershipType, PropertyType
+from app.services.scoring_rules import (
+    HIGH_INCOME, LARGE_LOT_SQFT, MIDDLE_INCOME, SMALL_LOT_SQFT, VERY_LARGE_LOT_SQFT,
+)
+
+FACETS = ("property_type", "ownership_type", "income_band", "lot_size_band")
+
+# Bands by average income (same cut points as the buyer profile's income distribution)
+INCOME_BANDS = ("low", "medium", "high", "unknown")
+
+# Bands by lot size: <= 2500, <= 5000, <= 10000, > 10000 sq ft
+LOT_SIZE_BANDS = ("small", "medium", "large", "very_large", "unknown")
+
+UNKNOWN = "unknown"
+
+
+def income_band(income_band_min: Optional[int], income_band_max: Optional[int]) -> str:
+    if not (income_band_min and income_band_max):
+        return UNKNOWN
+    avg = (income_band_min + income_band_max) / 2
+    if avg > HIGH_INCOME:
+        return "high"
+    if avg > MIDDLE_INCOME:
+        return "medium"
+    return "low"
+
+
+def lot_size_band(lot_size_sqft: Optional[int]) -> str:
+    if not lot_size_sqft:
+        return UNKNOWN
+    if lot_size_sqft > VERY_LARGE_LOT_SQFT:
+        return "very_large"
+    if lot_size_sqft > LARGE_LOT_SQFT:
+        return "large"
+    if lot_size_sqft > SMALL_LOT_SQFT:
+        return "medium"
+    return "small"
+
+
+# SQL equivalents of income_band / lot_size_band (avg > X <=> min + max > 2X)
+_has_income = and_(Household.income_band_min != 0, Household.income_band_max != 0)
+_income_sum = Household.income_band_min + Household.income_band_max
+_INCOME_BAND_CONDITIONS = {
+    "high": and_(_has_income, _income_sum > 2 * HIGH_INCOME),
+    "medium": and_(_has_income, _income_sum > 2 * MIDDLE_INCOME, _income_sum <= 2 * HIGH_INCOME),
+    "low": and_(_has_income, _income_sum <= 2 * MIDDLE_INCOME),
+}
+_INCOME_BAND_CONDITIONS[UNKNOWN] = or_(
+    Household.income_band_min.is_(None), Household.income_band_max.is_(None),
+    Household.income_band_min == 0, Household.income_band_max == 0,
+)
+_LOT_SIZE_BAND_CONDITIONS = {
+    "very_large": Household.lot_size_sqft > VERY_LARGE_LOT_SQFT,
+    "large": and_(Household.lot_size_sqft > LARGE_LOT_SQFT, Household.lot_size_sqft <= VERY_LARGE_LOT_SQFT),
+    "medium": and_(Household.lot_size_sqft > SMALL_LOT_SQFT, Household.lot_size_sqft <= LARGE_LOT_SQFT),
+    "small": and_(Household.lot_size_sqft > 0, Household.lot_size_sqft <= SMALL_LOT_SQFT),
+    UNKNOWN: or_(Household.lot_size_sqft.is_(None), Household.lot_size_sqft == 0),
+}
+
+
+def _band_case(conditions: Dict[str, Any]):
+    # Literal labels keep the expression free of bind parameters
+    return case(
+        *[(condition, literal_column(f"'{band}'")) for band, condition in conditions.items() if band != UNKNOWN],
+        else_=literal_column(f"'{UNKNOWN}'")
+    )
+
+
+class HouseholdFacets:
+    """Facet counts of a geography's households under the current filter"""
+
+    def __init__(self, db: Session, client_id: uuid.UUID, geography_id: int):
+        self.db = db
+        self.client_id = client_id
+        self.geography_id = geography_id
+
+    def _query(self, columns, filters: Dict[str, Optional[str]]):
+        """
+        Households of the geography matching the filters
+        filters: zip_code_id plus any FACETS value (values already validated)
+        """
+        query = self.db.query(*columns).filter(
+            Household.client_id == self.client_id,
+            Household.geography_id == self.geography_id
+        )
+        if filters.get("zip_code_id") is not None:
+            query = query.filter(Household.zip_code_id == filters["zip_code_id"])
+        for facet, enum_type in (("property_type", PropertyType), ("ownership_type", OwnershipType)):
+            value = filters.get(facet)
+            if value == UNKNOWN:
+                column = getattr(Household, facet)
+                query = query.filter(or_(column.is_(None), column == enum_type.UNKNOWN))
+            elif value:
+                query = query.filter(getattr(Household, facet) == enum_type(value))
+        if filters.get("income_band"):
+            query = query.filter(_INCOME_BAND_CONDITIONS[filters["income_band"]])
+        if filters.get("lot_size_band"):
+            query = query.filter(_LOT_SIZE_BAND_CONDITIONS[filters["lot_size_band"]])
+        return query
+
+    def counts(self, filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """{"total": n, "facets": {facet: {value: count}}}; every band is listed, zero or not"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._grouping_sets_counts(filters)
+        return self.python_counts(filters)
+
+    def _grouping_sets_counts(self, filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        banded = self._query(
+            [
+                Household.property_type.label("property_type"),
+                Household.ownership_type.label("ownership_type"),
+                _band_case(_INCOME_BAND_CONDITIONS).label("income_band"),
+                _band_case(_LOT_SIZE_BAND_CONDITIONS).label("lot_size_band"),
+            ],
+            filters
+        ).subquery()
+        columns = [banded.c[facet] for facet in FACETS]
+        rows = self.db.query(
+            *columns,
+            *[func.grouping(column) for column in columns],
+            func.count()
+        ).group_by(func.grouping_sets(*columns)).all()
+
+        result = _empty_counts()
+        for row in rows:
+            values, grouped, count = row[:4], row[4:8], row[8]
+            # grouping() is 0 for the column this row's set groups by
+            facet_index = list(grouped).index(0)
+            _add(result, FACETS[facet_index], values[facet_index], count)
+        result["total"] = sum(result["facets"]["property_type"].values())
+        return result
+
+    def python_counts(self, filters: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """Same result as the GROUPING SETS query from one pass over the facet columns"""
+        rows = self._query(
+            [
+                Household.property_type,
+                Household.ownership_type,
+                Household.income_band_min,
+                Household.income_band_max,
+                Household.lot_size_sqft,
+            ],
+            filters
+        )
+        result = _empty_counts()
+        for property_type, ownership_type, income_min, income_max, lot_size in rows:
+            result["total"] += 1
+            _add(result, "property_type", property_type, 1)
+            _add(result, "ownership_type", ownership_type, 1)
+            _add(result, "income_band", income_band(income_min, income_max), 1)
+            _add(result, "lot_size_band", lot_size_band(lot_size), 1)
+        return result
+
+
+def _empty_counts() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "facets": {
+            "property_type": {},
+            "ownership_type": {},
+            "income_band": {band: 0 for band in INCOME_BANDS},
+            "lot_size_band": {band: 0 for band in LOT_SIZE_BANDS},
+        },
+    }
+
+
+def _add(result: Dict[str, Any], facet: str, value: Any, count: int) -> None:
+    # NULL and the UNKNOWN enum member both count as "unknown"
+    key = value.value if hasattr(value, "value") else (value or UNKNOWN)
+    counts = result["facets"][facet]
+    counts[key] = counts.get(key, 0) + count
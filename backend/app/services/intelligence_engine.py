@@ -2,20 +2,123 @@
 Intelligence Engine Service
 Calculates demand scores and generates buyer profiles
 """
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any, Optional
-from app.models.household import Household, PropertyType, OwnershipType
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+from app.models.household import Household, OwnershipType
 from app.models.demand_signal import ServiceCategory
-from app.models.geography import ZIPCode
-from sqlalchemy import func, and_
+from app.models.geography import Geography, ZIPCode
+from app.models.zip_demand_rollup import ZIPDemandRollup
+from app.core.config import settings
+from sqlalchemy import func, and_, case
+from app.services.scoring_rules import (
+    ENUM_CODES, ENUM_TYPES, HIGH_INCOME, LARGE_LOT_SQFT, MIDDLE_INCOME, NUMPY_SCORERS, SQL_SCORES,
+    factor_points_matrix, household_columns, rule_for, score_household,
+)
+from collections import OrderedDict
+import numpy as np
 import uuid
 
+# Household columns read by demand scoring, ZIP grouping and buyer profiles
+HOUSEHOLD_SCORING_COLUMNS = (
+    Household.id,
+    Household.zip_code_id,
+    Household.property_type,
+    Household.ownership_type,
+    Household.property_sqft_min,
+    Household.lot_size_sqft,
+    Household.income_band_min,
+    Household.income_band_max,
+    Household.property_age_years,
+)
+
+# Rows fetched per round trip when streaming household scans
+SCAN_BATCH_SIZE = 5000
+
+# Factor point matrices kept for weight simulations, by
+# (client, geography, category, household fingerprint); least recent evicted
+FEATURE_MATRIX_CACHE_SIZE = 8
+_feature_matrices: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Upper bound on households x weight settings scored at once (memory)
+SIMULATION_CHUNK_CELLS = 4_000_000
+
+
+def _batches(items: Iterable, size: int) -> Iterator[list]:
+    """Consecutive lists of up to size items"""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _ScoredHouseholds:
+    """
+    Running score_households result over household_columns() batches:
+    per-ZIP score arrays and owner / large-lot counts, buyer profile counts
+    """
+    
+    def __init__(self, engine: "IntelligenceEngine", zip_code_ids: List[int], service_categories: List[ServiceCategory]):
+        self.engine = engine
+        self.service_categories = service_categories
+        # zip_id -> [score arrays (rows x categories), owners, large lots]
+        self.per_zip = {zip_id: [[], 0, 0] for zip_id in zip_code_ids}
+        self.profile_partials = []
+        self.score_sums = np.zeros(len(service_categories), dtype=float)
+        self.count = 0
+    
+    def add(self, columns: Dict[str, np.ndarray]) -> None:
+        zip_ids = columns["zip_code_id"]
+        if not len(zip_ids):
+            return
+        self.count += len(zip_ids)
+        self.profile_partials.append(self.engine.buyer_profile_counts_from_columns(columns))
+        scores = self.engine.score_column_matrix(columns, self.service_categories)
+        self.score_sums += scores.sum(axis=0)
+        
+        owners = columns["ownership_type"] == ENUM_CODES["ownership_type"][OwnershipType.OWNER]
+        large_lots = columns["lot_size_sqft"] > LARGE_LOT_SQFT
+        for zip_id in self.per_zip.keys() & set(np.unique(zip_ids).tolist()):
+            members = zip_ids == zip_id
+            entry = self.per_zip[zip_id]
+            entry[0].append(scores[members])
+            entry[1] += int(owners[members].sum())
+            entry[2] += int(large_lots[members].sum())
+    
+    def result(self) -> Dict[str, Any]:
+        rollups = {category: {} for category in self.service_categories}
+        for zip_id, (score_parts, owners, large_lots) in self.per_zip.items():
+            zip_scores = np.concatenate(score_parts) if score_parts else np.empty((0, len(self.service_categories)))
+            for column, category in enumerate(self.service_categories):
+                rollups[category][zip_id] = self.engine.zip_summary(zip_scores[:, column], owners, large_lots)
+        
+        return {
+            "count": self.count,
+            "profile_counts": self.engine.merge_buyer_profile_counts(self.profile_partials),
+            "score_sums": {
+                category: float(self.score_sums[column])
+                for column, category in enumerate(self.service_categories)
+            },
+            "rollups": rollups,
+        }
+
 
 class IntelligenceEngine:
     """Service for generating intelligence reports and demand scores"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, processes: Optional[int] = None):
+        """
+        Args:
+            db: Session for reads
+            processes: Worker processes for scoring large geographies
+                (defaults to SCORING_PROCESSES; <= 1 scores in-process)
+        """
         self.db = db
+        self.processes = settings.SCORING_PROCESSES if processes is None else processes
     
     def calculate_household_demand_score(
         self,
@@ -24,143 +127,216 @@ class IntelligenceEngine:
     ) -> float:
         """
         Calculate demand score for a household based on service category
-        Returns score from 0-100
-        """
-        score = 0.0
-        
-        if service_category == ServiceCategory.LAWN_CARE:
-            score = self._calculate_lawn_care_score(household)
-        elif service_category == ServiceCategory.SECURITY:
-            score = self._calculate_security_score(household)
-        elif service_category == ServiceCategory.IT_SERVICES:
-            score = self._calculate_it_services_score(household)
-        elif service_category == ServiceCategory.FIREWORKS:
-            score = self._calculate_fireworks_score(household)
-        else:
-            score = self._calculate_general_service_score(household)
-        
-        return min(100.0, max(0.0, score))
-    
-    def _calculate_lawn_care_score(self, household: Household) -> float:
-        """Calculate lawn care demand score"""
-        score = 0.0
-        
-        # Ownership (owners more likely to use lawn care)
-        if household.ownership_type == OwnershipType.OWNER:
-            score += 40.0
-        elif household.ownership_type == OwnershipType.RENTER:
-            score += 10.0
-        
-        # Lot size (larger lots need more care)
-        if household.lot_size_sqft:
-            if household.lot_size_sqft > 10000:
-                score += 30.0
-            elif household.lot_size_sqft > 5000:
-                score += 20.0
-            elif household.lot_size_sqft > 2500:
-                score += 10.0
-        
-        # Property type
-        if household.property_type == PropertyType.SINGLE_FAMILY:
-            score += 20.0
-        elif household.property_type == PropertyType.MULTI_FAMILY:
-            score += 10.0
-        
-        # Income (higher income more likely to outsource)
-        if household.income_band_min and household.income_band_max:
-            avg_income = (household.income_band_min + household.income_band_max) / 2
-            if avg_income > 75000:
-                score += 10.0
-            elif avg_income > 50000:
-                score += 5.0
-        
-        return score
-    
-    def _calculate_security_score(self, household: Household) -> float:
-        """Calculate security services demand score"""
-        score = 0.0
-        
-        # Ownership (owners invest in security)
-        if household.ownership_type == OwnershipType.OWNER:
-            score += 50.0
-        elif household.ownership_type == OwnershipType.RENTER:
-            score += 5.0
-        
-        # Property value proxy (income band)
-        if household.income_band_min and household.income_band_max:
-            avg_income = (household.income_band_min + household.income_band_max) / 2
-            if avg_income > 100000:
-                score += 30.0
-            elif avg_income > 50000:
-                score += 15.0
-        
-        # Property type
-        if household.property_type == PropertyType.SINGLE_FAMILY:
-            score += 20.0
-        
-        return score
-    
-    def _calculate_it_services_score(self, household: Household) -> float:
-        """Calculate IT services demand score"""
-        score = 0.0
-        
-        # Income (higher income = more tech)
-        if household.income_band_min and household.income_band_max:
-            avg_income = (household.income_band_min + household.income_band_max) / 2
-            if avg_income > 75000:
-                score += 50.0
-            elif avg_income > 50000:
-                score += 30.0
-            else:
-                score += 10.0
-        
-        # Property type (home offices)
-        if household.property_type == PropertyType.SINGLE_FAMILY:
-            score += 30.0
-        
-        # Property size (larger = more likely home office)
-        if household.property_sqft_min and household.property_sqft_min > 2000:
-            score += 20.0
-        
-        return score
+        Returns score from 0-100 (see scoring_rules.SCORING_RULES)
+        """
+        return score_household(rule_for(service_category), household)
     
-    def _calculate_fireworks_score(self, household: Household) -> float:
-        """Calculate fireworks demand score"""
-        score = 0.0
-        
-        # Ownership (owners host events)
-        if household.ownership_type == OwnershipType.OWNER:
-            score += 40.0
+    def score_household_matrix(
+        self,
+        households: list,
+        service_categories: List[ServiceCategory]
+    ) -> np.ndarray:
+        """Vectorized calculate_household_demand_score: households x categories scores"""
+        return self.score_column_matrix(household_columns(households), service_categories)
+    
+    def score_column_matrix(
+        self,
+        columns: Dict[str, np.ndarray],
+        service_categories: List[ServiceCategory]
+    ) -> np.ndarray:
+        """score_household_matrix over household_columns() arrays"""
+        scores = np.empty((len(columns["zip_code_id"]), len(service_categories)), dtype=float)
+        for column, category in enumerate(service_categories):
+            scores[:, column] = NUMPY_SCORERS[category](columns)
+        return scores
+    
+    def demand_score_expression(self, service_category: ServiceCategory):
+        """calculate_household_demand_score as a SQL expression over Household columns"""
+        return SQL_SCORES[service_category]
+    
+    @staticmethod
+    def income_signal_boost(signal) -> float:
+        """Score boost from a demographic median-income signal (0 for other signals)"""
+        metadata_str = signal.signal_metadata or ""
+        if "income" in metadata_str.lower() and signal.value:
+            if signal.value > HIGH_INCOME:
+                return 5.0
+            elif signal.value > MIDDLE_INCOME:
+                return 2.0
+        return 0.0
+    
+    def scan_households(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int] = None,
+        zip_code_ids: Optional[List[int]] = None,
+        batch_size: int = SCAN_BATCH_SIZE
+    ) -> Iterator[Row]:
+        """
+        Stream HOUSEHOLD_SCORING_COLUMNS of matching households as lightweight rows
+        Rows support attribute access, so they can be scored and profiled like
+        Household objects. yield_per streams from a server-side cursor on
+        PostgreSQL, so the scan itself holds batch_size rows at a time; callers
+        that consume it incrementally (score_households, rollup refreshes) keep
+        per-ZIP scores rather than rows.
+        """
+        query = self.db.query(*HOUSEHOLD_SCORING_COLUMNS).filter(Household.client_id == client_id)
         
-        # Lot size (larger lots for events)
-        if household.lot_size_sqft and household.lot_size_sqft > 5000:
-            score += 30.0
+        if geography_id:
+            query = query.filter(Household.geography_id == geography_id)
         
-        # Income (discretionary spending)
-        if household.income_band_min and household.income_band_max:
-            avg_income = (household.income_band_min + household.income_band_max) / 2
-            if avg_income > 50000:
-                score += 30.0
+        if zip_code_ids:
+            query = query.filter(Household.zip_code_id.in_(zip_code_ids))
         
-        return score
+        yield from query.yield_per(batch_size)
     
-    def _calculate_general_service_score(self, household: Household) -> float:
-        """Calculate general service demand score"""
-        score = 50.0  # Base score
-        
-        # Ownership
-        if household.ownership_type == OwnershipType.OWNER:
-            score += 20.0
+    def _cached_household_file(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int],
+        zip_code_ids: Optional[List[int]] = None
+    ):
+        """
+        (path, memory-mapped household table limited to ZIPs) of the geography,
+        or None unless HOUSEHOLD_CACHE_DIR is set and the geography exists
+        """
+        if not (settings.HOUSEHOLD_CACHE_DIR and geography_id):
+            return None
+        from app.services.household_cache import HouseholdCache, filter_zip_codes
+        geography = self.db.query(Geography).filter(Geography.id == geography_id).first()
+        if not geography:
+            return None
+        path, table = HouseholdCache(self.db).load_file(client_id, geography)
+        return path, filter_zip_codes(table, zip_code_ids) if zip_code_ids else table
+    
+    def _cached_household_table(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int],
+        zip_code_ids: Optional[List[int]] = None
+    ):
+        """Table of _cached_household_file, or None"""
+        cached = self._cached_household_file(client_id, geography_id, zip_code_ids)
+        return cached[1] if cached else None
+    
+    def load_households(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int] = None,
+        zip_code_ids: Optional[List[int]] = None
+    ) -> list:
+        """
+        Scoring-column records of matching households, as a list
+        Served from the columnar household cache when HOUSEHOLD_CACHE_DIR is
+        set and a geography is given, otherwise from a scan. Scoring paths use
+        load_household_columns or scan_households instead.
+        """
+        table = self._cached_household_table(client_id, geography_id, zip_code_ids)
+        if table is not None:
+            from app.services.household_cache import table_records
+            return table_records(table)
+        return list(self.scan_households(client_id, geography_id, zip_code_ids))
+    
+    def load_household_columns(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int] = None,
+        zip_code_ids: Optional[List[int]] = None
+    ) -> Dict[str, np.ndarray]:
+        """household_columns() of matching households, read straight from the cache's Arrow columns when enabled"""
+        table = self._cached_household_table(client_id, geography_id, zip_code_ids)
+        if table is not None:
+            from app.services.household_cache import table_columns
+            return table_columns(table)
+        return household_columns(self.scan_households(client_id, geography_id, zip_code_ids))
+    
+    def score_households(
+        self,
+        households: Iterable,
+        zip_code_ids: List[int],
+        service_categories: List[ServiceCategory]
+    ) -> Dict[str, Any]:
+        """
+        Score households for several categories in one pass
+        Returns count, profile_counts (buyer_profile_counts), score_sums and
+        rollups ({category: {zip_code_id: summarize_zip_households}} for zip_code_ids)
+        households may be a scan: it is consumed in SCAN_BATCH_SIZE batches and
+        only per-ZIP scores and counters are kept, not the rows
+        """
+        scored = _ScoredHouseholds(self, zip_code_ids, service_categories)
+        for batch in _batches(households, SCAN_BATCH_SIZE):
+            scored.add(household_columns(batch))
+        return scored.result()
+    
+    def score_table(
+        self,
+        table,
+        zip_code_ids: List[int],
+        service_categories: List[ServiceCategory]
+    ) -> Dict[str, Any]:
+        """score_households over a household cache table, scored from its columns in SCAN_BATCH_SIZE slices"""
+        from app.services.household_cache import table_columns
+        scored = _ScoredHouseholds(self, zip_code_ids, service_categories)
+        for batch in table.to_batches(max_chunksize=SCAN_BATCH_SIZE):
+            scored.add(table_columns(batch))
+        return scored.result()
+    
+    @classmethod
+    def merge_scored_households(
+        cls,
+        partials: List[Dict[str, Any]],
+        service_categories: List[ServiceCategory],
+        zip_code_ids: List[int]
+    ) -> Dict[str, Any]:
+        """Combine score_households results for disjoint ZIP partitions"""
+        rollups = {category: {} for category in service_categories}
+        for partial in partials:
+            for category in service_categories:
+                rollups[category].update(partial["rollups"][category])
         
-        # Income
-        if household.income_band_min and household.income_band_max:
-            avg_income = (household.income_band_min + household.income_band_max) / 2
-            if avg_income > 75000:
-                score += 20.0
-            elif avg_income > 50000:
-                score += 10.0
+        # ZIPs without households aren't in any partition
+        for category in service_categories:
+            for zip_id in zip_code_ids:
+                if zip_id not in rollups[category]:
+                    rollups[category][zip_id] = cls.zip_summary(np.empty(0), 0, 0)
         
-        return score
+        return {
+            "count": sum(p["count"] for p in partials),
+            "profile_counts": cls.merge_buyer_profile_counts(p["profile_counts"] for p in partials),
+            "score_sums": {
+                category: sum(p["score_sums"][category] for p in partials)
+                for category in service_categories
+            },
+            "rollups": rollups,
+        }
+    
+    def score_geography(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int],
+        zip_code_ids: List[int],
+        service_categories: List[ServiceCategory]
+    ) -> Dict[str, Any]:
+        """
+        score_households over a geography's households (optionally limited to ZIPs)
+        Geographies with at least SCORING_PARALLEL_MIN_HOUSEHOLDS households are
+        scored in a process pool when processes > 1 and the household cache is
+        on (otherwise in-process)
+        """
+        cached = self._cached_household_file(client_id, geography_id, zip_code_ids)
+        if cached is None:
+            return self.score_households(
+                self.scan_households(client_id, geography_id, zip_code_ids), zip_code_ids, service_categories
+            )
+        path, table = cached
+        if self.processes > 1 and table.num_rows >= settings.SCORING_PARALLEL_MIN_HOUSEHOLDS:
+            from app.services.parallel_scoring import score_table_in_processes
+            try:
+                return score_table_in_processes(path, table, zip_code_ids, service_categories, self.processes)
+            except FileNotFoundError:
+                # Rebuilt and removed before the workers opened it; this mapping still reads
+                pass
+        return self.score_table(table, zip_code_ids, service_categories)
     
     def get_households_by_geography(
         self,
@@ -179,10 +355,50 @@ class IntelligenceEngine:
         if zip_code_ids:
             query = query.filter(Household.zip_code_id.in_(zip_code_ids))
         
-        households = query.all()
+        # Score in the database; demographic boosts are constant per ZIP
+        if min_demand_score > 0:
+            boosts = self._zip_score_boosts(client_id, geography_id)
+            score = self.demand_score_expression(service_category)
+            if boosts:
+                score = score + case(
+                    *[(Household.zip_code_id == zip_id, boost) for zip_id, boost in boosts.items()],
+                    else_=0.0
+                )
+            query = query.filter(score >= min_demand_score)
+        
+        return query.all()
+    
+    def scan_households_by_geography(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int] = None,
+        zip_code_ids: Optional[List[int]] = None,
+        service_category: ServiceCategory = ServiceCategory.GENERAL,
+        min_demand_score: float = 0.0
+    ) -> List[Row]:
+        """
+        get_households_by_geography over scoring-column records (see load_households)
+        From the household cache, rows are scored from the Arrow columns and
+        records are built only for the households that pass
+        """
+        table = self._cached_household_table(client_id, geography_id, zip_code_ids)
+        if table is None:
+            return self._filter_by_demand_score(
+                self.scan_households(client_id, geography_id, zip_code_ids),
+                client_id, geography_id, service_category, min_demand_score
+            )
         
-        # Also consider DemandSignal data for scoring
-        # Get demographic signals that might affect scoring
+        from app.services.household_cache import table_columns, table_records
+        columns = table_columns(table)
+        boosts = self._zip_score_boosts(client_id, geography_id)
+        scores = self.score_column_matrix(columns, [service_category])[:, 0]
+        if boosts:
+            zip_ids, rows = np.unique(columns["zip_code_id"], return_inverse=True)
+            scores += np.array([boosts.get(zip_id, 0.0) for zip_id in zip_ids.tolist()], dtype=float)[rows]
+        return table_records(table.filter(scores >= min_demand_score))
+    
+    def _zip_score_boosts(self, client_id: uuid.UUID, geography_id: Optional[int]) -> Dict[int, float]:
+        """Household score boosts by ZIP code ID from the geography's demographic signals"""
         from app.models.demand_signal import DemandSignal, SignalType
         signals = self.db.query(DemandSignal).filter(
             DemandSignal.client_id == client_id,
@@ -190,26 +406,27 @@ class IntelligenceEngine:
             DemandSignal.signal_type == SignalType.DEMOGRAPHIC
         ).all()
         
-        # Filter by demand score
-        filtered = []
-        for household in households:
-            score = self.calculate_household_demand_score(household, service_category)
-            
-            # Boost score based on demographic signals (income, population density)
-            for signal in signals:
-                if signal.zip_code_id == household.zip_code_id:
-                    # If median income signal, boost score for higher income areas
-                    metadata_str = signal.signal_metadata or ""
-                    if "income" in metadata_str.lower() and signal.value:
-                        if signal.value > 75000:
-                            score += 5.0
-                        elif signal.value > 50000:
-                            score += 2.0
-            
-            if score >= min_demand_score:
-                filtered.append(household)
-        
-        return filtered
+        # Boost score based on demographic signals (income, population density)
+        boosts = {}
+        for signal in signals:
+            boost = self.income_signal_boost(signal)
+            if boost:
+                boosts[signal.zip_code_id] = boosts.get(signal.zip_code_id, 0.0) + boost
+        return boosts
+    
+    def _filter_by_demand_score(
+        self,
+        households: Iterable[Union[Household, Row]],
+        client_id: uuid.UUID,
+        geography_id: Optional[int],
+        service_category: ServiceCategory,
+        min_demand_score: float
+    ) -> list:
+        households = list(households)
+        boosts = self._zip_score_boosts(client_id, geography_id)
+        scores = self.score_household_matrix(households, [service_category])[:, 0]
+        scores += np.array([boosts.get(h.zip_code_id, 0.0) for h in households], dtype=float)
+        return [h for h, keep in zip(households, scores >= min_demand_score) if keep]
     
     def generate_buyer_profile(
         self,
@@ -217,7 +434,116 @@ class IntelligenceEngine:
         service_category: ServiceCategory
     ) -> Dict[str, Any]:
         """Generate buyer profile from household list"""
-        if not households:
+        return self.buyer_profile_from_counts(self.buyer_profile_counts(households))
+    
+    def buyer_profile_counts(self, households: Iterable[Household]) -> Dict[str, Any]:
+        """
+        Additive counts behind a buyer profile
+        Counts of disjoint household sets can be combined with merge_buyer_profile_counts
+        """
+        counts = {
+            "total": 0,
+            "owners": 0,
+            "renters": 0,
+            "property_types": {},
+            "income_distribution": {"low": 0, "medium": 0, "high": 0},
+            "age_sum": 0,
+            "age_count": 0,
+            "lot_sum": 0,
+            "lot_count": 0,
+        }
+        property_types = counts["property_types"]
+        income_dist = counts["income_distribution"]
+        for h in households:
+            counts["total"] += 1
+            if h.ownership_type == OwnershipType.OWNER:
+                counts["owners"] += 1
+            elif h.ownership_type == OwnershipType.RENTER:
+                counts["renters"] += 1
+            
+            prop_type = h.property_type.value if h.property_type else "unknown"
+            property_types[prop_type] = property_types.get(prop_type, 0) + 1
+            
+            # Income distribution (simplified)
+            if h.income_band_min and h.income_band_max:
+                avg = (h.income_band_min + h.income_band_max) / 2
+                if avg > HIGH_INCOME:
+                    income_dist["high"] += 1
+                elif avg > MIDDLE_INCOME:
+                    income_dist["medium"] += 1
+                else:
+                    income_dist["low"] += 1
+            
+            if h.property_age_years:
+                counts["age_sum"] += h.property_age_years
+                counts["age_count"] += 1
+            
+            if h.lot_size_sqft:
+                counts["lot_sum"] += h.lot_size_sqft
+                counts["lot_count"] += 1
+        
+        return counts
+    
+    def buyer_profile_counts_from_columns(self, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """buyer_profile_counts over household_columns() arrays"""
+        ownership = columns["ownership_type"]
+        owner_codes = ENUM_CODES["ownership_type"]
+        # bincount slot 0 counts missing property types
+        type_counts = np.bincount(columns["property_type"] + 1, minlength=len(ENUM_TYPES["property_type"]) + 1)
+        property_types = {}
+        for member, count in zip([None, *ENUM_TYPES["property_type"]], type_counts.tolist()):
+            if count:
+                name = member.value if member is not None else "unknown"
+                property_types[name] = property_types.get(name, 0) + count
+        
+        avg_income = columns["avg_income"]
+        has_income = avg_income != 0
+        high = has_income & (avg_income > HIGH_INCOME)
+        medium = has_income & ~high & (avg_income > MIDDLE_INCOME)
+        ages = columns["property_age_years"]
+        lots = columns["lot_size_sqft"]
+        return {
+            "total": len(ownership),
+            "owners": int((ownership == owner_codes[OwnershipType.OWNER]).sum()),
+            "renters": int((ownership == owner_codes[OwnershipType.RENTER]).sum()),
+            "property_types": property_types,
+            "income_distribution": {
+                "low": int((has_income & ~high & ~medium).sum()),
+                "medium": int(medium.sum()),
+                "high": int(high.sum()),
+            },
+            "age_sum": int(ages.sum()),
+            "age_count": int((ages != 0).sum()),
+            "lot_sum": int(lots.sum()),
+            "lot_count": int((lots != 0).sum()),
+        }
+    
+    @staticmethod
+    def merge_buyer_profile_counts(partials: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sum buyer_profile_counts results"""
+        merged = {
+            "total": 0,
+            "owners": 0,
+            "renters": 0,
+            "property_types": {},
+            "income_distribution": {"low": 0, "medium": 0, "high": 0},
+            "age_sum": 0,
+            "age_count": 0,
+            "lot_sum": 0,
+            "lot_count": 0,
+        }
+        for partial in partials:
+            for key in ("property_types", "income_distribution"):
+                for name, count in partial[key].items():
+                    merged[key][name] = merged[key].get(name, 0) + count
+            for key in ("total", "owners", "renters", "age_sum", "age_count", "lot_sum", "lot_count"):
+                merged[key] += partial[key]
+        return merged
+    
+    def buyer_profile_from_counts(self, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """BuyerProfileResponse fields from buyer_profile_counts"""
+        total = counts["total"]
+        if not total:
             return {
                 "total_households": 0,
                 "target_households": 0,
@@ -229,55 +555,270 @@ class IntelligenceEngine:
                 "average_lot_size": 0.0,
             }
         
-        total = len(households)
-        owners = sum(1 for h in households if h.ownership_type == OwnershipType.OWNER)
-        renters = sum(1 for h in households if h.ownership_type == OwnershipType.RENTER)
+        return {
+            "total_households": total,
+            "target_households": total,  # Could filter by score if needed
+            "homeowner_percentage": counts["owners"] / total * 100,
+            "renter_percentage": counts["renters"] / total * 100,
+            "property_types": counts["property_types"],
+            "income_distribution": counts["income_distribution"],
+            "average_property_age": counts["age_sum"] / counts["age_count"] if counts["age_count"] else 0.0,
+            "average_lot_size": counts["lot_sum"] / counts["lot_count"] if counts["lot_count"] else 0.0,
+        }
+    
+    def aggregate_buyer_profile(
+        self,
+        client_id: uuid.UUID,
+        geography_id: Optional[int] = None,
+        zip_code_ids: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Same result as generate_buyer_profile over every matching household,
+        computed by one grouped query instead of loading Household objects
+        (no demand-score filtering, so all households are targets)
+        """
+        # Mirrors generate_buyer_profile's truthiness checks: zero values are skipped
+        has_income = and_(Household.income_band_min != 0, Household.income_band_max != 0)
+        income_sum = Household.income_band_min + Household.income_band_max  # avg > X <=> sum > 2X
+        has_age = Household.property_age_years != 0
+        has_lot = Household.lot_size_sqft != 0
         
-        property_types = {}
-        for h in households:
-            prop_type = h.property_type.value if h.property_type else "unknown"
-            property_types[prop_type] = property_types.get(prop_type, 0) + 1
+        def count_where(*conditions):
+            return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
         
-        # Income distribution (simplified)
-        income_dist = {"low": 0, "medium": 0, "high": 0}
-        for h in households:
-            if h.income_band_min and h.income_band_max:
-                avg = (h.income_band_min + h.income_band_max) / 2
-                if avg > 75000:
-                    income_dist["high"] += 1
-                elif avg > 50000:
-                    income_dist["medium"] += 1
-                else:
-                    income_dist["low"] += 1
+        query = self.db.query(
+            Household.property_type,
+            func.count(Household.id),
+            count_where(Household.ownership_type == OwnershipType.OWNER),
+            count_where(Household.ownership_type == OwnershipType.RENTER),
+            count_where(has_income, income_sum > 2 * HIGH_INCOME),
+            count_where(has_income, income_sum > 2 * MIDDLE_INCOME, income_sum <= 2 * HIGH_INCOME),
+            count_where(has_income, income_sum <= 2 * MIDDLE_INCOME),
+            func.sum(case((has_age, Household.property_age_years))),
+            func.count(case((has_age, Household.property_age_years))),
+            func.sum(case((has_lot, Household.lot_size_sqft))),
+            func.count(case((has_lot, Household.lot_size_sqft))),
+        ).filter(Household.client_id == client_id)
         
-        ages = [h.property_age_years for h in households if h.property_age_years]
-        avg_age = sum(ages) / len(ages) if ages else 0.0
+        if geography_id:
+            query = query.filter(Household.geography_id == geography_id)
         
-        lot_sizes = [h.lot_size_sqft for h in households if h.lot_size_sqft]
-        avg_lot = sum(lot_sizes) / len(lot_sizes) if lot_sizes else 0.0
+        if zip_code_ids:
+            query = query.filter(Household.zip_code_id.in_(zip_code_ids))
         
+        counts = self.buyer_profile_counts([])
+        for row in query.group_by(Household.property_type).all():
+            prop_type = row[0].value if row[0] else "unknown"
+            counts["property_types"][prop_type] = counts["property_types"].get(prop_type, 0) + row[1]
+            counts["total"] += row[1]
+            counts["owners"] += row[2]
+            counts["renters"] += row[3]
+            counts["income_distribution"]["high"] += row[4]
+            counts["income_distribution"]["medium"] += row[5]
+            counts["income_distribution"]["low"] += row[6]
+            counts["age_sum"] += row[7] or 0
+            counts["age_count"] += row[8]
+            counts["lot_sum"] += row[9] or 0
+            counts["lot_count"] += row[10]
+        
+        return self.buyer_profile_from_counts(counts)
+    
+    def summarize_zip_households(
+        self,
+        households: List[Household],
+        service_category: ServiceCategory,
+        scores: Optional[np.ndarray] = None
+    ) -> Dict[str, Any]:
+        """
+        Demand-score distribution and characteristics for one ZIP's households
+        Same fields as ZIPDemandRollup; pass scores if the households were already scored
+        """
+        if not households:
+            return self.zip_summary(np.empty(0), 0, 0)
+        if scores is None:
+            scores = self.score_household_matrix(households, [service_category])[:, 0]
+        owners = sum(1 for h in households if h.ownership_type == OwnershipType.OWNER)
+        large_lots = sum(1 for h in households if h.lot_size_sqft and h.lot_size_sqft > LARGE_LOT_SQFT)
+        return self.zip_summary(scores, owners, large_lots)
+    
+    @staticmethod
+    def zip_summary(scores: np.ndarray, owners: int, large_lots: int) -> Dict[str, Any]:
+        """summarize_zip_households fields from one ZIP's scores and owner / large-lot counts"""
+        total = len(scores)
+        if not total:
+            return {
+                "household_count": 0,
+                "avg_score": 0.0,
+                "score_p25": None,
+                "score_p50": None,
+                "score_p75": None,
+                "score_p90": None,
+                "owner_ratio": 0.0,
+                "large_lot_ratio": 0.0,
+            }
+        
+        p25, p50, p75, p90 = np.percentile(scores, [25, 50, 75, 90])
         return {
-            "total_households": total,
-            "target_households": total,  # Could filter by score if needed
-            "homeowner_percentage": (owners / total * 100) if total > 0 else 0.0,
-            "renter_percentage": (renters / total * 100) if total > 0 else 0.0,
-            "property_types": property_types,
-            "income_distribution": income_dist,
-            "average_property_age": avg_age,
-            "average_lot_size": avg_lot,
+            "household_count": total,
+            "avg_score": float(scores.sum() / total),
+            "score_p25": round(float(p25), 2),
+            "score_p50": round(float(p50), 2),
+            "score_p75": round(float(p75), 2),
+            "score_p90": round(float(p90), 2),
+            "owner_ratio": owners / total,
+            "large_lot_ratio": large_lots / total,
         }
     
-    def calculate_zip_demand_scores(
+    def get_zip_rollups(
         self,
         client_id: uuid.UUID,
         zip_code_ids: List[int],
         service_category: ServiceCategory
-    ) -> Dict[str, float]:
-        """Calculate demand scores by ZIP code"""
-        zip_codes = self.db.query(ZIPCode).filter(ZIPCode.id.in_(zip_code_ids)).all()
-        scores = {}
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Household score summaries by ZIP code ID, read from zip_demand_rollups
+        ZIPs not rolled up yet are summarized from their households
+        """
+        rollups = {}
+        rows = self.db.query(ZIPDemandRollup).filter(
+            ZIPDemandRollup.client_id == client_id,
+            ZIPDemandRollup.zip_code_id.in_(zip_code_ids),
+            ZIPDemandRollup.service_category == service_category.value
+        ).all()
+        for row in rows:
+            rollups[row.zip_code_id] = {
+                "household_count": row.household_count,
+                "avg_score": row.avg_score,
+                "score_p25": row.score_p25,
+                "score_p50": row.score_p50,
+                "score_p75": row.score_p75,
+                "score_p90": row.score_p90,
+                "owner_ratio": row.owner_ratio,
+                "large_lot_ratio": row.large_lot_ratio,
+            }
+        
+        missing = [zip_id for zip_id in zip_code_ids if zip_id not in rollups]
+        if missing:
+            scored = self.score_households(
+                self.scan_households(client_id, zip_code_ids=missing), missing, [service_category]
+            )
+            rollups.update(scored["rollups"][service_category])
+        
+        return rollups
+    
+    def score_distribution(
+        self,
+        client_id: uuid.UUID,
+        zip_code_ids: List[int],
+        service_category: ServiceCategory,
+        bucket_width: int = 10
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Household demand-score histogram and percentiles by ZIP code ID
+        PostgreSQL computes them in one grouped query scoring households in the
+        database; other databases (SQLite) score a household scan with NumPy.
+        Buckets are [lower, lower + bucket_width) with 100 in the last bucket;
+        percentiles interpolate like summarize_zip_households
+        """
+        bucket_count = 100 // bucket_width
+        if self.db.get_bind().dialect.name == "postgresql":
+            rows = self._score_distribution_rows(client_id, zip_code_ids, service_category, bucket_count)
+        else:
+            rows = self._score_distribution_rows_from_scan(client_id, zip_code_ids, service_category, bucket_width)
+        
+        def distribution(count=0, avg=None, percentiles=(None,) * 4, counts=(0,) * bucket_count):
+            return {
+                "household_count": count,
+                "average_score": round(float(avg), 2) if avg is not None else 0.0,
+                "percentiles": {
+                    name: round(float(value), 2) if value is not None else None
+                    for name, value in zip(("p25", "p50", "p75", "p90"), percentiles)
+                },
+                "buckets": [
+                    {"lower": b * bucket_width, "upper": (b + 1) * bucket_width, "count": n}
+                    for b, n in enumerate(counts)
+                ],
+            }
+        
+        distributions = {zip_id: distribution() for zip_id in zip_code_ids}
+        for row in rows:
+            distributions[row[0]] = distribution(row[1], row[2], row[3:7], row[7:])
+        return distributions
+    
+    def _score_distribution_rows(
+        self,
+        client_id: uuid.UUID,
+        zip_code_ids: List[int],
+        service_category: ServiceCategory,
+        bucket_count: int
+    ) -> list:
+        """(zip_code_id, count, avg, p25, p50, p75, p90, *bucket counts) rows from PostgreSQL"""
+        # Score and bucket each household once; the aggregates read the columns
+        score = self.demand_score_expression(service_category)
+        scored = self.db.query(
+            Household.zip_code_id.label("zip_code_id"),
+            score.label("score"),
+        ).filter(
+            Household.client_id == client_id,
+            Household.zip_code_id.in_(zip_code_ids)
+        ).subquery()
+        bucketed = self.db.query(
+            scored.c.zip_code_id,
+            scored.c.score,
+            func.least(func.width_bucket(scored.c.score, 0, 100, bucket_count), bucket_count).label("bucket"),
+        ).subquery()
         
-        # Get demographic signals for ZIP codes
+        return self.db.query(
+            bucketed.c.zip_code_id,
+            func.count(),
+            func.avg(bucketed.c.score),
+            *[func.percentile_cont(q).within_group(bucketed.c.score) for q in (0.25, 0.5, 0.75, 0.9)],
+            *[func.count().filter(bucketed.c.bucket == b) for b in range(1, bucket_count + 1)],
+        ).group_by(bucketed.c.zip_code_id).all()
+    
+    def _score_distribution_rows_from_scan(
+        self,
+        client_id: uuid.UUID,
+        zip_code_ids: List[int],
+        service_category: ServiceCategory,
+        bucket_width: int
+    ) -> list:
+        """_score_distribution_rows computed from a household scan"""
+        bucket_count = 100 // bucket_width
+        scores_by_zip = {}
+        batch = []
+        
+        def score_batch():
+            scores = self.score_household_matrix(batch, [service_category])[:, 0]
+            for household, score in zip(batch, scores):
+                scores_by_zip.setdefault(household.zip_code_id, []).append(score)
+            batch.clear()
+        
+        for household in self.scan_households(client_id, zip_code_ids=zip_code_ids):
+            batch.append(household)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                score_batch()
+        score_batch()
+        
+        rows = []
+        for zip_id, scores in scores_by_zip.items():
+            scores = np.array(scores)
+            buckets = np.minimum((scores // bucket_width).astype(int), bucket_count - 1)
+            rows.append((
+                zip_id,
+                len(scores),
+                float(scores.mean()),
+                *np.percentile(scores, [25, 50, 75, 90]),
+                *np.bincount(buckets, minlength=bucket_count).tolist(),
+            ))
+        return rows
+    
+    def demographic_signals_by_zip(
+        self,
+        client_id: uuid.UUID,
+        zip_code_ids: List[int]
+    ) -> Dict[int, list]:
+        """Demographic DemandSignals grouped by ZIP code ID"""
         from app.models.demand_signal import DemandSignal, SignalType
         signals_by_zip = {}
         signals = self.db.query(DemandSignal).filter(
@@ -289,37 +830,190 @@ class IntelligenceEngine:
             if signal.zip_code_id not in signals_by_zip:
                 signals_by_zip[signal.zip_code_id] = []
             signals_by_zip[signal.zip_code_id].append(signal)
-        
+        return signals_by_zip
+    
+    def score_zips(
+        self,
+        zip_codes: List[ZIPCode],
+        rollups: Dict[int, Dict[str, Any]],
+        signals_by_zip: Dict[int, list]
+    ) -> Dict[str, float]:
+        """ZIP demand scores from household score summaries plus demographic signal boosts"""
+        scores = {}
         for zip_code in zip_codes:
-            households = self.db.query(Household).filter(
-                Household.client_id == client_id,
-                Household.zip_code_id == zip_code.id
-            ).all()
-            
-            if not households:
+            rollup = rollups[zip_code.id]
+            if not rollup["household_count"]:
                 scores[zip_code.zip_code] = 0.0
                 continue
             
-            total_score = sum(
-                self.calculate_household_demand_score(h, service_category)
-                for h in households
-            )
-            avg_score = total_score / len(households) if households else 0.0
+            avg_score = rollup["avg_score"]
             
             # Boost based on demographic signals
             zip_signals = signals_by_zip.get(zip_code.id, [])
             for signal in zip_signals:
-                metadata_str = signal.signal_metadata or ""
-                if "income" in metadata_str.lower() and signal.value:
-                    if signal.value > 75000:
-                        avg_score += 5.0
-                    elif signal.value > 50000:
-                        avg_score += 2.0
+                avg_score += self.income_signal_boost(signal)
             
             scores[zip_code.zip_code] = round(min(100.0, max(0.0, avg_score)), 2)
         
         return scores
     
+    def calculate_zip_demand_scores(
+        self,
+        client_id: uuid.UUID,
+        zip_code_ids: List[int],
+        service_category: ServiceCategory
+    ) -> Dict[str, float]:
+        """Calculate demand scores by ZIP code (from the ZIP demand rollups)"""
+        zip_codes = self.db.query(ZIPCode).filter(ZIPCode.id.in_(zip_code_ids)).all()
+        rollups = self.get_zip_rollups(client_id, [z.id for z in zip_codes], service_category)
+        signals_by_zip = self.demographic_signals_by_zip(client_id, zip_code_ids)
+        return self.score_zips(zip_codes, rollups, signals_by_zip)
+    
+    def compare_zip_scenarios(
+        self,
+        client_id: uuid.UUID,
+        scenarios: Dict[str, List[ZIPCode]],
+        service_category: ServiceCategory,
+        top_n: int = 5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Summary metrics for named ZIP bundles
+        Rollups, signals and ZIP scores are fetched once for the union of all
+        bundles; each bundle is then combined in memory from its ZIP rows
+        """
+        zip_by_id = {z.id: z for zip_codes in scenarios.values() for z in zip_codes}
+        zip_code_ids = list(zip_by_id)
+        rollups = self.get_zip_rollups(client_id, zip_code_ids, service_category)
+        signals_by_zip = self.demographic_signals_by_zip(client_id, zip_code_ids)
+        zip_scores = self.score_zips(list(zip_by_id.values()), rollups, signals_by_zip)
+        
+        results = {}
+        for name, zip_codes in scenarios.items():
+            zip_codes = list({z.id: z for z in zip_codes}.values())
+            counts = [rollups[z.id]["household_count"] for z in zip_codes]
+            total = sum(counts)
+            score_sum = sum(rollups[z.id]["avg_score"] * n for z, n in zip(zip_codes, counts))
+            owners = sum(rollups[z.id]["owner_ratio"] * n for z, n in zip(zip_codes, counts))
+            results[name] = {
+                "total_households": total,
+                "average_demand_score": round(score_sum / total, 2) if total else 0.0,
+                "homeowner_percentage": round(owners / total * 100, 2) if total else 0.0,
+                "top_zip_codes": self.rank_zip_codes(
+                    zip_codes,
+                    {z.zip_code: zip_scores[z.zip_code] for z in zip_codes},
+                    rollups,
+                    signals_by_zip,
+                    top_n
+                ),
+            }
+        return results
+    
+    def feature_matrix(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        service_category: ServiceCategory
+    ) -> tuple:
+        """
+        (points, zip_code_ids) for a geography's households sorted by ZIP:
+        the factor_points_matrix of the category's rule and each row's ZIP id
+        Cached in process until the geography's households change
+        """
+        from app.services.household_cache import household_fingerprint
+        key = (client_id, geography.id, service_category, household_fingerprint(self.db, client_id, geography))
+        if key in _feature_matrices:
+            _feature_matrices.move_to_end(key)
+            return _feature_matrices[key]
+        
+        columns = self.load_household_columns(client_id, geography.id)
+        zip_code_ids = columns["zip_code_id"]
+        order = np.argsort(zip_code_ids, kind="stable")
+        points = factor_points_matrix(rule_for(service_category), columns)
+        entry = (points[order], zip_code_ids[order])
+        
+        _feature_matrices[key] = entry
+        while len(_feature_matrices) > FEATURE_MATRIX_CACHE_SIZE:
+            _feature_matrices.popitem(last=False)
+        return entry
+    
+    def simulate_weights(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        zip_codes: List[ZIPCode],
+        service_category: ServiceCategory,
+        weight_sets: Dict[str, Dict[str, float]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        ZIP scores under alternate rule weights, against the current rule
+        Weights multiply the points of the rule's factors (by feature name;
+        "base" scales the base score); omitted features keep weight 1.
+        Every setting is scored in one matrix product over the cached
+        feature matrix. Returns per setting the ZIPs ordered by new rank with
+        baseline/new score and rank.
+        """
+        rule = rule_for(service_category)
+        features = [factor.feature for factor in rule.factors]
+        points, household_zip_ids = self.feature_matrix(client_id, geography, service_category)
+        
+        # Column 0 is the current rule
+        names = list(weight_sets)
+        settings_weights = [{}] + [weight_sets[name] for name in names]
+        weights = np.array(
+            [[w.get(feature, 1.0) for w in settings_weights] for feature in features], dtype=float
+        ).reshape(len(features), len(settings_weights))
+        bases = np.array([rule.base * w.get("base", 1.0) for w in settings_weights], dtype=float)
+        
+        # Households of each ZIP are one contiguous run of rows
+        zip_ids = np.array([z.id for z in zip_codes], dtype=np.int64)
+        starts = np.searchsorted(household_zip_ids, zip_ids, side="left")
+        ends = np.searchsorted(household_zip_ids, zip_ids, side="right")
+        counts = ends - starts
+        
+        sums = np.zeros((len(zip_codes), len(settings_weights)), dtype=float)
+        chunk = max(1, SIMULATION_CHUNK_CELLS // max(1, len(points)))
+        for first in range(0, len(settings_weights), chunk):
+            columns = slice(first, first + chunk)
+            scores = np.clip(points @ weights[:, columns] + bases[columns], 0.0, 100.0)
+            cumulative = np.vstack([np.zeros((1, scores.shape[1])), np.cumsum(scores, axis=0)])
+            sums[:, columns] = cumulative[ends] - cumulative[starts]
+        
+        signals_by_zip = self.demographic_signals_by_zip(client_id, [z.id for z in zip_codes])
+        boosts = np.array(
+            [sum(self.income_signal_boost(s) for s in signals_by_zip.get(z.id, [])) for z in zip_codes],
+            dtype=float
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = sums / counts[:, None]
+        zip_scores = np.where(
+            counts[:, None] > 0, np.round(np.clip(averages + boosts[:, None], 0.0, 100.0), 2), 0.0
+        )
+        
+        # Rank 1 = highest score; ties ordered by ZIP code
+        tie_order = np.argsort(np.argsort([z.zip_code for z in zip_codes], kind="stable"))
+        ranks = np.empty_like(zip_scores, dtype=np.int64)
+        for column in range(zip_scores.shape[1]):
+            order = np.lexsort((tie_order, -zip_scores[:, column]))
+            ranks[order, column] = np.arange(1, len(zip_codes) + 1)
+        
+        results = {}
+        for column, name in enumerate(names, start=1):
+            impacts = [
+                {
+                    "zip_code": zip_code.zip_code,
+                    "household_count": int(counts[i]),
+                    "baseline_score": float(zip_scores[i, 0]),
+                    "score": float(zip_scores[i, column]),
+                    "delta": round(float(zip_scores[i, column] - zip_scores[i, 0]), 2),
+                    "baseline_rank": int(ranks[i, 0]),
+                    "rank": int(ranks[i, column]),
+                    "rank_change": int(ranks[i, 0] - ranks[i, column]),
+                }
+                for i, zip_code in enumerate(zip_codes)
+            ]
+            results[name] = sorted(impacts, key=lambda impact: impact["rank"])
+        return results
+    
     def get_top_zip_codes_with_rationale(
         self,
         client_id: uuid.UUID,
@@ -331,35 +1025,34 @@ class IntelligenceEngine:
         Get top ZIP codes by demand score with rationale (why they're top)
         Returns list of dicts with zip_code, score, and rationale
         """
-        zip_scores = self.calculate_zip_demand_scores(client_id, zip_code_ids, service_category)
+        zip_codes = self.db.query(ZIPCode).filter(ZIPCode.id.in_(zip_code_ids)).all()
+        rollups = self.get_zip_rollups(client_id, [z.id for z in zip_codes], service_category)
+        signals_by_zip = self.demographic_signals_by_zip(client_id, zip_code_ids)
+        zip_scores = self.score_zips(zip_codes, rollups, signals_by_zip)
+        return self.rank_zip_codes(zip_codes, zip_scores, rollups, signals_by_zip, top_n)
+    
+    def rank_zip_codes(
+        self,
+        zip_codes: List[ZIPCode],
+        zip_scores: Dict[str, float],
+        rollups: Dict[int, Dict[str, Any]],
+        signals_by_zip: Dict[int, list],
+        top_n: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Top ZIP codes by score with rationale, from already computed scores and summaries"""
+        zip_by_code = {z.zip_code: z for z in zip_codes}
         
         # Sort by score descending
         sorted_zips = sorted(zip_scores.items(), key=lambda x: x[1], reverse=True)
         
         top_zips = []
         for zip_code, score in sorted_zips[:top_n]:
-            # Get ZIP code object for additional context
-            zip_obj = self.db.query(ZIPCode).filter(ZIPCode.zip_code == zip_code).first()
-            if not zip_obj:
-                continue
+            zip_obj = zip_by_code[zip_code]
+            rollup = rollups[zip_obj.id]
             
             # Build rationale
             rationale_parts = []
             
-            # Get demographic signals for context
-            from app.models.demand_signal import DemandSignal, SignalType
-            signals = self.db.query(DemandSignal).filter(
-                DemandSignal.client_id == client_id,
-                DemandSignal.zip_code_id == zip_obj.id,
-                DemandSignal.signal_type == SignalType.DEMOGRAPHIC
-            ).all()
-            
-            # Get households for context
-            households = self.db.query(Household).filter(
-                Household.client_id == client_id,
-                Household.zip_code_id == zip_obj.id
-            ).all()
-            
             # Add rationale based on score
             if score >= 70:
                 rationale_parts.append("High demand score indicates strong potential")
@@ -369,12 +1062,12 @@ class IntelligenceEngine:
                 rationale_parts.append("Lower demand but still viable")
             
             # Add demographic context
-            for signal in signals:
+            for signal in signals_by_zip.get(zip_obj.id, []):
                 metadata_str = signal.signal_metadata or ""
                 if "income" in metadata_str.lower() and signal.value:
-                    if signal.value > 75000:
+                    if signal.value > HIGH_INCOME:
                         rationale_parts.append("High median household income")
-                    elif signal.value > 50000:
+                    elif signal.value > MIDDLE_INCOME:
                         rationale_parts.append("Moderate to high household income")
             
             if zip_obj.population:
@@ -384,14 +1077,11 @@ class IntelligenceEngine:
                     rationale_parts.append("Moderate population base")
             
             # Add household characteristics
-            if households:
-                owners = sum(1 for h in households if h.ownership_type == OwnershipType.OWNER)
-                owner_pct = (owners / len(households) * 100) if households else 0
-                if owner_pct > 60:
+            if rollup["household_count"]:
+                if rollup["owner_ratio"] > 0.6:
                     rationale_parts.append("High percentage of homeowners")
                 
-                large_lots = sum(1 for h in households if h.lot_size_sqft and h.lot_size_sqft > 5000)
-                if large_lots > len(households) * 0.3:
+                if rollup["large_lot_ratio"] > 0.3:
                     rationale_parts.append("Many properties with large lots")
             
             rationale = ". ".join(rationale_parts) if rationale_parts else "Standard market characteristics"
@@ -406,4 +1096,3 @@ class IntelligenceEngine:
             })
         
         return top_zips
-
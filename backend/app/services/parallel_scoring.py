@@ -0,0 +1,88 @@
+"""
+Process-Pool Household Scoring
+Scores one geography's households across worker processes
+
+Households are partitioned by ZIP code so every per-ZIP summary is computed
+whole inside one worker. Workers come from a billiard (Celery's
+multiprocessing fork) pool with the spawn start method: billiard lets
+daemonic processes such as Celery prefork children start a pool, and spawn
+never forks a parent that may be running threads. Each worker memory-maps
+the geography's household cache file by path (shared page cache, no row
+pickling), scores its partition's column slices and returns partial
+aggregates, which are merged here.
+"""
+from pathlib import Path
+from typing import Any, Dict, List
+import billiard
+import pyarrow as pa
+import pyarrow.compute as pc
+from app.models.demand_signal import ServiceCategory
+from app.services.household_cache import filter_zip_codes, read_table
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def partition_zip_codes(table: pa.Table, partitions: int) -> List[List[int]]:
+    """
+    Split the table's ZIP ids (0 = no ZIP) into at most `partitions` groups
+    with similar household counts (largest ZIPs placed first)
+    """
+    counts = pc.value_counts(pc.fill_null(table.column("zip_code_id"), 0)).to_pylist()
+    counts.sort(key=lambda c: c["counts"], reverse=True)
+
+    groups = [[] for _ in range(min(partitions, len(counts)))]
+    loads = [0] * len(groups)
+    for entry in counts:
+        target = loads.index(min(loads))
+        groups[target].append(entry["values"])
+        loads[target] += entry["counts"]
+    return groups
+
+
+def _score_partition(
+    path: str,
+    partition_zip_ids: List[int],
+    summary_zip_ids: List[int],
+    service_categories: List[ServiceCategory]
+) -> Dict[str, Any]:
+    """Worker: score one ZIP partition of the household file from its columns"""
+    table = filter_zip_codes(read_table(Path(path)), partition_zip_ids)
+    return IntelligenceEngine(None).score_table(table, summary_zip_ids, service_categories)
+
+
+def score_table_in_processes(
+    path: Path,
+    table: pa.Table,
+    zip_code_ids: List[int],
+    service_categories: List[ServiceCategory],
+    processes: int
+) -> Dict[str, Any]:
+    """
+    IntelligenceEngine.score_table over the household file at path (mapped
+    by the caller as table, which only guides partitioning) in `processes`
+    spawned workers
+    zip_code_ids names the ZIPs that get per-ZIP summaries. Raises
+    FileNotFoundError if a concurrent rebuild removed the file before the
+    workers opened it; the caller still holds its mapping and can score in-process.
+    """
+    summary_zip_ids = set(zip_code_ids)
+    partitions = partition_zip_codes(table, processes)
+
+    pool = billiard.get_context("spawn").Pool(len(partitions) or 1)
+    try:
+        results = [
+            pool.apply_async(_score_partition, (
+                str(path),
+                partition,
+                [zip_id for zip_id in partition if zip_id in summary_zip_ids],
+                service_categories,
+            ))
+            for partition in partitions
+        ]
+        partials = [result.get() for result in results]
+    finally:
+        # Let the remaining tasks finish: terminating workers that are still
+        # starting up can leave join() waiting on them
+        pool.close()
+        pool.join()
+
+    return IntelligenceEngine.merge_scored_households(partials, service_categories, zip_code_ids)
@@ -0,0 +1,135 @@
+"""
+Report Result Cache
+Stores computed report contents so identical report requests skip recomputation
+
+Entries are keyed on the report inputs (client, geography, sorted ZIP set,
+service category, plus a kind for non-report results) and validated
+against the geography's data freshness stamps. Any census/property/
+events/channels refresh changes the stamps, so cached results are never
+served across a data refresh.
+"""
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.geography import Geography
+from app.models.intelligence_report import ReportCacheEntry
+import uuid
+
+# Geography stamps that cover every input a report reads
+FRESHNESS_FIELDS = (
+    "census_last_refreshed_at",
+    "property_last_refreshed_at",
+    "events_last_refreshed_at",
+    "channels_last_refreshed_at",
+)
+
+# Payload kind of report contents; other kinds share the table under their own keys
+REPORT_KIND = "report"
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def normalize_zip_codes(zip_codes: Optional[str]) -> list:
+    """Comma-separated ZIP list -> sorted, de-duplicated list"""
+    return sorted({z.strip() for z in (zip_codes or "").split(",") if z.strip()})
+
+
+def report_inputs_key(
+    client_id: uuid.UUID,
+    geography_id: int,
+    zip_codes: Iterable[str],
+    service_category: str,
+    kind: str = REPORT_KIND
+) -> str:
+    """
+    Cache key for the report inputs (ZIP order and duplicates don't matter)
+    kind separates other cached results (e.g. score distributions) from reports
+    """
+    inputs = {
+        "client_id": str(client_id),
+        "geography_id": geography_id,
+        "zip_codes": sorted(set(zip_codes)),
+        "service_category": service_category,
+    }
+    if kind != REPORT_KIND:
+        inputs["kind"] = kind
+    return _digest(inputs)
+
+
+def geography_freshness_key(geography: Geography) -> str:
+    """Fingerprint of the geography's data refresh stamps"""
+    return _digest({
+        field: getattr(geography, field).isoformat() if getattr(geography, field) else None
+        for field in FRESHNESS_FIELDS
+    })
+
+
+class ReportCache:
+    """Table-backed cache of computed report payloads"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _key(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        zip_codes: str,
+        service_category: str,
+        kind: str
+    ) -> str:
+        return report_inputs_key(client_id, geography.id, normalize_zip_codes(zip_codes), service_category, kind)
+
+    def get(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        zip_codes: str,
+        service_category: str,
+        kind: str = REPORT_KIND
+    ) -> Optional[Dict[str, Any]]:
+        """Cached payload, or None if missing or computed before the latest refresh"""
+        entry = self.db.query(ReportCacheEntry).filter(
+            ReportCacheEntry.inputs_key == self._key(client_id, geography, zip_codes, service_category, kind),
+            ReportCacheEntry.client_id == client_id
+        ).first()
+        if entry is None or entry.freshness_key != geography_freshness_key(geography):
+            return None
+        return entry.payload
+
+    def put(
+        self,
+        client_id: uuid.UUID,
+        geography: Geography,
+        zip_codes: str,
+        service_category: str,
+        payload: Dict[str, Any],
+        kind: str = REPORT_KIND
+    ) -> None:
+        """
+        Store (or replace a stale) payload for these inputs
+        Runs in a savepoint so a concurrent writer for the same inputs
+        doesn't fail the caller's transaction
+        """
+        inputs_key = self._key(client_id, geography, zip_codes, service_category, kind)
+        freshness_key = geography_freshness_key(geography)
+        try:
+            with self.db.begin_nested():
+                entry = self.db.query(ReportCacheEntry).filter(
+                    ReportCacheEntry.inputs_key == inputs_key
+                ).first()
+                if entry is None:
+                    entry = ReportCacheEntry(
+                        client_id=client_id,
+                        geography_id=geography.id,
+                        inputs_key=inputs_key,
+                    )
+                    self.db.add(entry)
+                entry.freshness_key = freshness_key
+                entry.payload = payload
+        except IntegrityError:
+            pass
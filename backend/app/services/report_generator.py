@@ -0,0 +1,388 @@
+"""
+Report Generator Service
+Computes the contents of an IntelligenceReport
+
+Reports are created in PENDING state by the API and filled in by
+generate_report_task, which records progress on the report as each
+stage finishes. Computed contents are stored in the report cache, so a
+repeat request for the same inputs is answered without recomputing until
+the geography's data is refreshed.
+
+ReportPipeline loads the household columns once and scores each household
+once per category; the buyer profile, ZIP score, top ZIP and timing stages
+all share the resulting per-ZIP summaries and profile counts. Batch requests
+for several categories over the same geography go through one pipeline run.
+Large geographies can be scored in worker processes (SCORING_PROCESSES).
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+import time
+from app.models.intelligence_report import IntelligenceReport, ReportStatus
+from app.models.demand_signal import ServiceCategory
+from app.models.geography import Geography, ZIPCode
+from app.services.intelligence_engine import IntelligenceEngine
+from app.services.report_cache import ReportCache
+import uuid
+
+# IntelligenceReport columns filled in by the pipeline (and stored in the cache)
+REPORT_FIELDS = (
+    "total_households",
+    "target_households",
+    "average_demand_score",
+    "buyer_profile",
+    "zip_demand_scores",
+    "channel_recommendations",
+    "timing_recommendations",
+    "report_data",
+)
+
+# Report progress (percent) once each pipeline stage finishes
+STAGE_PROGRESS = {
+    "score_households": 20,
+    "buyer_profile": 35,
+    "zip_scores": 55,
+    "top_zip_codes": 75,
+    "timing": 85,
+}
+
+
+class ReportPipeline:
+    """
+    Computes report contents for one or more service categories in a single
+    pass: households and signals are loaded once and scored for every
+    category into aggregates shared by every stage
+    Per-stage wall-clock timings (ms) are returned in report_data["stage_timings_ms"]
+    """
+    
+    def __init__(
+        self,
+        db: Session,
+        client_id: uuid.UUID,
+        geography_id: int,
+        zip_codes: List[ZIPCode],
+        service_categories: List[ServiceCategory],
+        on_stage: Optional[Callable[[str, Optional[ServiceCategory]], None]] = None
+    ):
+        """
+        Args:
+            db: Session for reads
+            zip_codes: ZIP codes the report covers (empty = whole geography)
+            on_stage: Called with (stage, category) as each stage finishes;
+                category is None for stages shared by all categories
+        """
+        self.db = db
+        self.engine = IntelligenceEngine(db)
+        self.client_id = client_id
+        self.geography_id = geography_id
+        self.zip_codes = zip_codes
+        self.service_categories = service_categories
+        self.on_stage = on_stage
+        self.timings: Dict[str, float] = {}
+        self.category_timings: Dict[ServiceCategory, Dict[str, float]] = {
+            category: {} for category in service_categories
+        }
+    
+    @contextmanager
+    def _stage(self, name: str, category: Optional[ServiceCategory] = None):
+        start = time.perf_counter()
+        yield
+        timings = self.timings if category is None else self.category_timings[category]
+        timings[name] = round((time.perf_counter() - start) * 1000, 3)
+        if self.on_stage:
+            self.on_stage(name, category)
+    
+    def run(self) -> Dict[ServiceCategory, Dict[str, Any]]:
+        """Run every stage and return the REPORT_FIELDS values for each category"""
+        engine = self.engine
+        zip_code_ids = [z.id for z in self.zip_codes]
+        
+        # Households are scored once for every category (in worker processes
+        # for large geographies, see IntelligenceEngine.score_geography)
+        with self._stage("score_households"):
+            signals_by_zip = engine.demographic_signals_by_zip(self.client_id, zip_code_ids)
+            scored = engine.score_geography(
+                self.client_id, self.geography_id, zip_code_ids, self.service_categories
+            )
+        
+        # The profile doesn't depend on the category
+        with self._stage("buyer_profile"):
+            buyer_profile = engine.buyer_profile_from_counts(scored["profile_counts"])
+        
+        return {
+            category: self._run_category(category, scored, signals_by_zip, buyer_profile)
+            for category in self.service_categories
+        }
+    
+    def _run_category(
+        self,
+        category: ServiceCategory,
+        scored: Dict[str, Any],
+        signals_by_zip: Dict[int, list],
+        buyer_profile: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        engine = self.engine
+        
+        with self._stage("zip_scores", category):
+            rollups = scored["rollups"][category]
+            zip_demand_scores = engine.score_zips(self.zip_codes, rollups, signals_by_zip)
+        
+        with self._stage("top_zip_codes", category):
+            top_zips = engine.rank_zip_codes(
+                self.zip_codes, zip_demand_scores, rollups, signals_by_zip, top_n=5
+            )
+        
+        with self._stage("timing", category):
+            avg_demand_score = scored["score_sums"][category] / scored["count"] if scored["count"] else 0.0
+            timing_recommendations = generate_timing_recommendations(category, avg_demand_score)
+        
+        with self._stage("channels", category):
+            channel_recommendations = generate_channel_recommendations(
+                buyer_profile, category, self.db, self.client_id, self.geography_id
+            )
+        
+        report_data = {
+            "buyer_profile": buyer_profile,
+            "zip_demand_scores": zip_demand_scores,
+            "top_zip_codes": top_zips,  # Top ZIPs with rationale (per spec section 8)
+            "channel_recommendations": channel_recommendations,
+            "timing_recommendations": timing_recommendations,
+            "stage_timings_ms": {**self.timings, **self.category_timings[category]},
+        }
+        return {
+            "total_households": buyer_profile["total_households"],
+            "target_households": buyer_profile["target_households"],
+            "average_demand_score": avg_demand_score,
+            "buyer_profile": buyer_profile,
+            "zip_demand_scores": zip_demand_scores,
+            "channel_recommendations": channel_recommendations,
+            "timing_recommendations": timing_recommendations,
+            "report_data": report_data,
+        }
+
+
+class ReportGenerator:
+    """Runs the report pipeline for IntelligenceReports"""
+    
+    def __init__(self, db: Session, read_db: Optional[Session] = None):
+        """
+        Args:
+            db: Session the report is written through (primary)
+            read_db: Session for engine reads (e.g. replica); defaults to db
+        """
+        self.db = db
+        self.read_db = read_db or db
+    
+    def _stage_finished(
+        self,
+        reports: Dict[ServiceCategory, IntelligenceReport],
+        stage: str,
+        category: Optional[ServiceCategory]
+    ) -> None:
+        if stage not in STAGE_PROGRESS:
+            return
+        for report in (reports.values() if category is None else [reports[category]]):
+            report.progress = STAGE_PROGRESS[stage]
+        self.db.commit()
+    
+    def _complete(self, report: IntelligenceReport, payload: Dict[str, Any]) -> IntelligenceReport:
+        for field in REPORT_FIELDS:
+            setattr(report, field, payload[field])
+        report.status = ReportStatus.COMPLETED.value
+        report.progress = 100
+        report.finished_at = datetime.utcnow()
+        self.db.commit()
+        return report
+    
+    def generate_from_cache(self, report: IntelligenceReport, geography: Geography) -> bool:
+        """
+        Complete the report from the cache if its inputs were already computed
+        since the geography's last data refresh
+        Returns True on a cache hit
+        """
+        payload = ReportCache(self.db).get(
+            report.client_id, geography, report.zip_codes, report.service_category
+        )
+        if payload is None:
+            return False
+        report.started_at = datetime.utcnow()
+        self._complete(report, payload)
+        return True
+    
+    def generate(self, report: IntelligenceReport) -> IntelligenceReport:
+        """
+        Compute and store the report contents, marking it COMPLETED
+        Raises ValueError for an invalid service category
+        """
+        return self.generate_batch([report])[0]
+    
+    def generate_batch(self, reports: List[IntelligenceReport]) -> List[IntelligenceReport]:
+        """
+        Compute reports that share a client, geography and ZIP set (one per
+        service category) from a single household load and scoring pass
+        Raises ValueError for an invalid service category
+        """
+        started_at = datetime.utcnow()
+        for report in reports:
+            report.status = ReportStatus.RUNNING.value
+            report.started_at = started_at
+            report.progress = 0
+        self.db.commit()
+        
+        first = reports[0]
+        
+        # Stamps are read with the data so a lagging replica never caches
+        # old results under newer freshness stamps
+        geography = self.read_db.query(Geography).filter(Geography.id == first.geography_id).first()
+        cache = ReportCache(self.db)
+        pending = {}
+        for report in reports:
+            payload = None
+            if geography is not None:
+                payload = cache.get(report.client_id, geography, report.zip_codes, report.service_category)
+            if payload is not None:
+                self._complete(report, payload)
+            else:
+                pending[ServiceCategory(report.service_category)] = report
+        
+        if not pending:
+            return reports
+        
+        # Parse ZIP codes
+        zip_code_list = [z.strip() for z in (first.zip_codes or "").split(",") if z.strip()]
+        zip_codes = self.read_db.query(ZIPCode).filter(ZIPCode.zip_code.in_(zip_code_list)).all()
+        
+        pipeline = ReportPipeline(
+            self.read_db,
+            first.client_id,
+            first.geography_id,
+            zip_codes,
+            list(pending),
+            on_stage=lambda stage, category: self._stage_finished(pending, stage, category)
+        )
+        payloads = pipeline.run()
+        
+        for category, report in pending.items():
+            if geography is not None:
+                cache.put(report.client_id, geography, report.zip_codes, report.service_category, payloads[category])
+            self._complete(report, payloads[category])
+        return reports
+
+
+def generate_channel_recommendations(
+    buyer_profile: dict,
+    service_category: ServiceCategory,
+    db: Session,
+    client_id: uuid.UUID,
+    geography_id: int
+) -> List[dict]:
+    """Generate channel recommendations based on buyer profile and available channels"""
+    from app.models.channel import Channel
+    
+    recommendations = []
+    
+    # Get channels from database for this geography
+    channels = db.query(Channel).filter(
+        Channel.client_id == client_id,
+        Channel.geography_id == geography_id
+    ).all()
+    
+    # Add institutional channels from database
+    for channel in channels:
+        recommendations.append({
+            "channel_type": channel.channel_type.value,
+            "name": channel.name,
+            "rationale": f"Institutional channel: {channel.name}",
+            "estimated_reach": channel.estimated_reach or "Unknown",
+            "website": channel.website,
+            "source_url": channel.source_url
+        })
+    
+    # Add generic recommendations if no channels found
+    if not channels:
+        # Direct mail for homeowners
+        if buyer_profile.get("homeowner_percentage", 0) > 60:
+            recommendations.append({
+                "channel_type": "direct_mail",
+                "rationale": "High percentage of homeowners who respond well to direct mail",
+                "estimated_reach": buyer_profile.get("target_households", 0),
+                "estimated_cost_range": "$0.50-$1.00 per household"
+            })
+        
+        # Digital ads for higher income areas
+        income_dist = buyer_profile.get("income_distribution", {})
+        if income_dist.get("high", 0) > income_dist.get("low", 0):
+            recommendations.append({
+                "channel_type": "digital_ads",
+                "rationale": "Higher income demographic active online",
+                "estimated_reach": buyer_profile.get("target_households", 0) * 3,
+                "estimated_cost_range": "$2-$5 per 1000 impressions"
+            })
+        
+        # Door hangers for local services
+        if service_category in [ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY]:
+            recommendations.append({
+                "channel_type": "door_hangers",
+                "rationale": "Effective for local service providers in residential areas",
+                "estimated_reach": buyer_profile.get("target_households", 0),
+                "estimated_cost_range": "$0.15-$0.30 per household"
+            })
+    
+    return recommendations
+
+
+def generate_timing_recommendations(
+    service_category: ServiceCategory,
+    demand_score: float
+) -> List[dict]:
+    """Generate timing recommendations based on service category"""
+    recommendations = []
+    
+    if service_category == ServiceCategory.LAWN_CARE:
+        recommendations.extend([
+            {
+                "time_period": "Spring (March-May)",
+                "rationale": "Peak season for lawn care services as grass begins growing",
+                "demand_score": min(100.0, demand_score * 1.3),
+                "recommended_actions": [
+                    "Launch campaigns in early March",
+                    "Focus on fertilization and aeration services",
+                    "Target new homeowners"
+                ]
+            },
+            {
+                "time_period": "Summer (June-August)",
+                "rationale": "Ongoing maintenance season with high demand",
+                "demand_score": demand_score,
+                "recommended_actions": [
+                    "Maintain consistent messaging",
+                    "Offer seasonal packages",
+                    "Target properties with larger lots"
+                ]
+            }
+        ])
+    elif service_category == ServiceCategory.FIREWORKS:
+        recommendations.append({
+            "time_period": "Late June - Early July",
+            "rationale": "Fourth of July holiday peak demand",
+            "demand_score": min(100.0, demand_score * 1.5),
+            "recommended_actions": [
+                "Begin marketing 2-3 weeks before holiday",
+                "Focus on neighborhoods with larger lots",
+                "Highlight safety and compliance"
+            ]
+        })
+    else:
+        recommendations.append({
+            "time_period": "Year-round",
+            "rationale": "Consistent demand throughout the year",
+            "demand_score": demand_score,
+            "recommended_actions": [
+                "Maintain consistent presence",
+                "Adjust messaging seasonally",
+                "Focus on property turnover events"
+            ]
+        })
+    
+    return recommendations
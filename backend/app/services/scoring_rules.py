@@ -0,0 +1,234 @@
+"""
+Demand Scoring Rules
+Declarative household demand-score rules per service category
+
+Each category's ScoringRule is a base score plus factors; a factor awards the
+points of its first matching case (like an if/elif chain) for one household
+feature. Rules are compiled once into a NumPy scorer for batch paths and a
+SQL CASE expression for database paths; score_household evaluates a rule for
+a single household. All three share this table, so they can't drift apart.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Tuple
+import numpy as np
+from sqlalchemy import and_, case, literal
+from sqlalchemy.sql.elements import ColumnElement
+from app.models.demand_signal import ServiceCategory
+from app.models.household import Household, OwnershipType, PropertyType
+
+# Average household income thresholds ($/year)
+UPPER_INCOME = 100000
+HIGH_INCOME = 75000
+MIDDLE_INCOME = 50000
+
+# Lot size thresholds (sq ft); LARGE_LOT_SQFT also defines "large lot" in rollups
+VERY_LARGE_LOT_SQFT = 10000
+LARGE_LOT_SQFT = 5000
+SMALL_LOT_SQFT = 2500
+
+# Living area above which a home likely has an office (sq ft)
+LARGE_HOME_SQFT = 2000
+
+# Features rules can test; avg_income is the mean of the household's income band
+ENUM_FEATURES = ("ownership_type", "property_type")
+NUMERIC_FEATURES = ("lot_size_sqft", "property_sqft_min", "property_age_years", "avg_income")
+
+# Batch paths carry enum features as integer codes (member position, MISSING_CODE when missing)
+ENUM_TYPES = {"ownership_type": OwnershipType, "property_type": PropertyType}
+ENUM_CODES = {
+    feature: {member: code for code, member in enumerate(enum_type)} for feature, enum_type in ENUM_TYPES.items()
+}
+MISSING_CODE = -1
+
+# Numeric household columns behind NUMERIC_FEATURES (0 when missing)
+NUMERIC_COLUMNS = ("lot_size_sqft", "property_sqft_min", "property_age_years", "income_band_min", "income_band_max")
+
+
+@dataclass(frozen=True)
+class Factor:
+    """
+    Points from one feature: cases are (op, value, points) tried in order
+    ops: "eq" (enum member), "gt" (number), "known" (feature present)
+    Missing features (None, or 0 for numbers) match no case
+    """
+    feature: str
+    cases: Tuple[Tuple[str, Any, float], ...]
+
+
+@dataclass(frozen=True)
+class ScoringRule:
+    """Household score = base + factor points, clamped to 0-100"""
+    factors: Tuple[Factor, ...]
+    base: float = 0.0
+
+
+OWNER = OwnershipType.OWNER
+RENTER = OwnershipType.RENTER
+SINGLE_FAMILY = PropertyType.SINGLE_FAMILY
+MULTI_FAMILY = PropertyType.MULTI_FAMILY
+
+GENERAL_RULE = ScoringRule(
+    base=50.0,
+    factors=(
+        Factor("ownership_type", (("eq", OWNER, 20.0),)),
+        Factor("avg_income", (("gt", HIGH_INCOME, 20.0), ("gt", MIDDLE_INCOME, 10.0))),
+    ),
+)
+
+SCORING_RULES: Dict[ServiceCategory, ScoringRule] = {
+    # Owners with large single-family lots who can afford to outsource
+    ServiceCategory.LAWN_CARE: ScoringRule(factors=(
+        Factor("ownership_type", (("eq", OWNER, 40.0), ("eq", RENTER, 10.0))),
+        Factor("lot_size_sqft", (
+            ("gt", VERY_LARGE_LOT_SQFT, 30.0), ("gt", LARGE_LOT_SQFT, 20.0), ("gt", SMALL_LOT_SQFT, 10.0),
+        )),
+        Factor("property_type", (("eq", SINGLE_FAMILY, 20.0), ("eq", MULTI_FAMILY, 10.0))),
+        Factor("avg_income", (("gt", HIGH_INCOME, 10.0), ("gt", MIDDLE_INCOME, 5.0))),
+    )),
+    # Owners invest in security; income is the property value proxy
+    ServiceCategory.SECURITY: ScoringRule(factors=(
+        Factor("ownership_type", (("eq", OWNER, 50.0), ("eq", RENTER, 5.0))),
+        Factor("avg_income", (("gt", UPPER_INCOME, 30.0), ("gt", MIDDLE_INCOME, 15.0))),
+        Factor("property_type", (("eq", SINGLE_FAMILY, 20.0),)),
+    )),
+    # Higher income = more tech; larger single-family homes = home offices
+    ServiceCategory.IT_SERVICES: ScoringRule(factors=(
+        Factor("avg_income", (("gt", HIGH_INCOME, 50.0), ("gt", MIDDLE_INCOME, 30.0), ("known", None, 10.0))),
+        Factor("property_type", (("eq", SINGLE_FAMILY, 30.0),)),
+        Factor("property_sqft_min", (("gt", LARGE_HOME_SQFT, 20.0),)),
+    )),
+    # Owners with room for events and discretionary income
+    ServiceCategory.FIREWORKS: ScoringRule(factors=(
+        Factor("ownership_type", (("eq", OWNER, 40.0),)),
+        Factor("lot_size_sqft", (("gt", LARGE_LOT_SQFT, 30.0),)),
+        Factor("avg_income", (("gt", MIDDLE_INCOME, 30.0),)),
+    )),
+}
+
+
+def rule_for(service_category: ServiceCategory) -> ScoringRule:
+    """Rule for a category (GENERAL_RULE for categories without their own)"""
+    return SCORING_RULES.get(service_category, GENERAL_RULE)
+
+
+# Single household
+
+def _feature_value(household: Any, feature: str) -> Any:
+    """Feature value of a household-like object, None when missing"""
+    if feature == "avg_income":
+        if household.income_band_min and household.income_band_max:
+            return (household.income_band_min + household.income_band_max) / 2
+        return None
+    return getattr(household, feature) or None
+
+
+def score_household(rule: ScoringRule, household: Any) -> float:
+    """Score one household (Household, scan row or cache record)"""
+    score = rule.base
+    for factor in rule.factors:
+        value = _feature_value(household, factor.feature)
+        if value is None:
+            continue
+        for op, threshold, points in factor.cases:
+            if op == "known" or (op == "eq" and value == threshold) or (op == "gt" and value > threshold):
+                score += points
+                break
+    return min(100.0, max(0.0, score))
+
+
+# NumPy
+
+def household_columns(households: Iterable[Any]) -> Dict[str, np.ndarray]:
+    """
+    Feature arrays for compiled NumPy rules: enum features as int codes
+    (ENUM_CODES, MISSING_CODE when missing), numbers as float arrays (0 when
+    missing), plus zip_code_id (0 when missing)
+    """
+    households = list(households)
+    columns = {
+        name: np.array(
+            [codes[v] if v is not None else MISSING_CODE for v in (getattr(h, name) for h in households)],
+            dtype=np.int16
+        )
+        for name, codes in ENUM_CODES.items()
+    }
+    for name in NUMERIC_COLUMNS:
+        columns[name] = np.array([getattr(h, name) or 0 for h in households], dtype=float)
+    columns["zip_code_id"] = np.array([h.zip_code_id or 0 for h in households], dtype=np.int64)
+    return with_avg_income(columns)
+
+
+def with_avg_income(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Add the avg_income feature (0 unless both income band ends are known)"""
+    has_income = (columns["income_band_min"] != 0) & (columns["income_band_max"] != 0)
+    columns["avg_income"] = np.where(has_income, (columns["income_band_min"] + columns["income_band_max"]) / 2, 0.0)
+    return columns
+
+
+def _numpy_condition(columns: Dict[str, np.ndarray], feature: str, op: str, value: Any) -> np.ndarray:
+    column = columns[feature]
+    if feature in ENUM_FEATURES:
+        return column == ENUM_CODES[feature][value] if op == "eq" else column != MISSING_CODE
+    present = column != 0
+    return present if op == "known" else present & (column > value)
+
+
+def _factor_points(factor: Factor, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    return np.select(
+        [_numpy_condition(columns, factor.feature, op, value) for op, value, _ in factor.cases],
+        [points for _, _, points in factor.cases],
+        default=0.0
+    )
+
+
+def compile_numpy(rule: ScoringRule) -> Callable[[Dict[str, np.ndarray]], np.ndarray]:
+    """Compile a rule into a function of household_columns() returning a score array"""
+    def score(columns: Dict[str, np.ndarray]) -> np.ndarray:
+        scores = np.full(len(columns["avg_income"]), rule.base, dtype=float)
+        for factor in rule.factors:
+            scores += _factor_points(factor, columns)
+        return np.clip(scores, 0.0, 100.0)
+
+    return score
+
+
+def factor_points_matrix(rule: ScoringRule, columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Households x factors matrix of the points each factor awards, so that
+    score = clip(base + points @ weights, 0, 100) with all weights 1
+    """
+    points = np.zeros((len(columns["avg_income"]), len(rule.factors)), dtype=float)
+    for column, factor in enumerate(rule.factors):
+        points[:, column] = _factor_points(factor, columns)
+    return points
+
+
+# SQL
+
+def _sql_condition(feature: str, op: str, value: Any) -> ColumnElement:
+    if feature == "avg_income":
+        present = and_(Household.income_band_min != 0, Household.income_band_max != 0)
+        # avg > X <=> min + max > 2X (stays in integer arithmetic)
+        income_sum = Household.income_band_min + Household.income_band_max
+        return present if op == "known" else and_(present, income_sum > 2 * value)
+    column = getattr(Household, feature)
+    if op == "eq":
+        return column == value
+    if feature in ENUM_FEATURES:
+        return column.isnot(None)
+    return column != 0 if op == "known" else column > value
+
+
+def compile_sql(rule: ScoringRule) -> ColumnElement:
+    """Compile a rule into a SQL expression over Household columns"""
+    score = literal(rule.base)
+    for factor in rule.factors:
+        score = score + case(
+            *[(_sql_condition(factor.feature, op, value), points) for op, value, points in factor.cases],
+            else_=0.0
+        )
+    return case((score > 100.0, 100.0), (score < 0.0, 0.0), else_=score)
+
+
+NUMPY_SCORERS = {category: compile_numpy(rule_for(category)) for category in ServiceCategory}
+SQL_SCORES = {category: compile_sql(rule_for(category)) for category in ServiceCategory}
@@ -3,11 +3,16 @@ Celery Tasks for Background Jobs
 """
 from celery import Task
 from app.core.celery_app import celery_app
-from app.core.database import SessionLocal
+from app.core.database import SessionLocal, ReadSessionLocal
 from app.collectors.census_collector import CensusCollector
 from app.services.csv_import import CSVImportService
+from app.services.columnar_import import ColumnarImportService
 from app.models.ingestion import IngestionRun, IngestionStatus
 from app.models.geography import Geography
+from app.models.intelligence_report import IntelligenceReport, ReportStatus
+from app.services.report_generator import ReportGenerator
+from app.services.demand_rollups import DemandRollupService
+from typing import List
 from datetime import datetime
 import uuid
 import traceback
@@ -82,6 +87,43 @@ def import_csv_property_task(self: Task, ingestion_run_id: str, file_ref: str, g
         db.close()
 
 
+@celery_app.task(bind=True)
+def import_columnar_property_task(self: Task, ingestion_run_id: str, file_ref: str, geography_id: int, client_id: str):
+    """Import property Parquet/Arrow file"""
+    db = SessionLocal()
+    try:
+        run_id = uuid.UUID(ingestion_run_id)
+        client_uuid = uuid.UUID(client_id)
+        
+        ingestion_run = db.query(IngestionRun).filter(IngestionRun.id == run_id).first()
+        if not ingestion_run:
+            return {"status": "error", "error": "Ingestion run not found"}
+        
+        ingestion_run.status = IngestionStatus.RUNNING
+        ingestion_run.started_at = datetime.utcnow()
+        db.commit()
+        
+        import_service = ColumnarImportService(db, client_uuid)
+        imported = import_service.import_property_file(file_ref, geography_id)
+        
+        ingestion_run.status = IngestionStatus.SUCCESS
+        ingestion_run.finished_at = datetime.utcnow()
+        ingestion_run.records_upserted = imported
+        db.commit()
+        
+        return {"status": "success", "records_imported": imported}
+    except Exception as e:
+        if 'ingestion_run' in locals() and ingestion_run:
+            ingestion_run.status = IngestionStatus.FAILED
+            ingestion_run.finished_at = datetime.utcnow()
+            ingestion_run.error_message = str(e)
+            db.commit()
+        
+        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+    finally:
+        db.close()
+
+
 @celery_app.task(bind=True)
 def import_csv_events_task(self: Task, ingestion_run_id: str, file_ref: str, geography_id: int, client_id: str):
     """Import events CSV file"""
@@ -180,21 +222,77 @@ def recompute_scores_task(self: Task, geography_id: int, service_category: str,
 def generate_report_task(self: Task, report_id: int, client_id: str):
     """Generate intelligence report in background"""
     db = SessionLocal()
+    read_db = ReadSessionLocal()
     try:
         client_uuid = uuid.UUID(client_id)
         
-        # This would generate the report
-        # Implementation depends on IntelligenceEngine
-        # For now, return success
+        report = db.query(IntelligenceReport).filter(
+            IntelligenceReport.id == report_id,
+            IntelligenceReport.client_id == client_uuid
+        ).first()
+        if not report:
+            return {"status": "error", "error": "Report not found"}
+        
+        ReportGenerator(db, read_db=read_db).generate(report)
         
         return {"status": "success", "report_id": report_id}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        db.rollback()
+        if 'report' in locals() and report:
+            report.status = ReportStatus.FAILED.value
+            report.finished_at = datetime.utcnow()
+            report.error_message = str(e)
+            db.commit()
+        
+        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
     finally:
+        read_db.close()
         db.close()
 
 
+@celery_app.task(bind=True)
+def generate_report_batch_task(self: Task, report_ids: List[int], client_id: str):
+    """Generate several reports for the same geography and ZIP set in one pass"""
+    db = SessionLocal()
+    read_db = ReadSessionLocal()
+    try:
+        client_uuid = uuid.UUID(client_id)
+        
+        reports = db.query(IntelligenceReport).filter(
+            IntelligenceReport.id.in_(report_ids),
+            IntelligenceReport.client_id == client_uuid
+        ).order_by(IntelligenceReport.id).all()
+        if not reports:
+            return {"status": "error", "error": "Reports not found"}
+        
+        ReportGenerator(db, read_db=read_db).generate_batch(reports)
+        
+        return {"status": "success", "report_ids": [r.id for r in reports]}
+    except Exception as e:
+        db.rollback()
+        if 'reports' in locals():
+            for report in reports:
+                if report.status != ReportStatus.COMPLETED.value:
+                    report.status = ReportStatus.FAILED.value
+                    report.finished_at = datetime.utcnow()
+                    report.error_message = str(e)
+            db.commit()
+        
+        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+    finally:
+        read_db.close()
+        db.close()
 
 
-
-
+@celery_app.task(bind=True)
+def refresh_zip_demand_rollups_task(self: Task, client_id: str, zip_code_ids: List[int]):
+    """Recompute ZIP demand rollups after household writes"""
+    db = SessionLocal()
+    try:
+        written = DemandRollupService(db, uuid.UUID(client_id)).refresh_zip_codes(zip_code_ids)
+        return {"status": "success", "rollups_refreshed": written}
+    except Exception as e:
+        db.rollback()
+        return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+    finally:
+        db.close()
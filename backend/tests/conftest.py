@@ -1,18 +1,26 @@
 import os
+import shutil
+import tempfile
 import pytest
 
+# A SQLite file rather than :memory:, so the sync engine and the async engine
+# (separate connections) see the same tables
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="lbi-tests-")
+
 # Set environment variables BEFORE any imports that use settings (CRITICAL: Phase 1.1)
 # Use setdefault to ensure deterministic initialization order
-os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+os.environ.setdefault("DATABASE_URL", f"sqlite+pysqlite:///{_TEST_DB_DIR}/test.db")
 os.environ.setdefault("SECRET_KEY", "test-secret")
 os.environ.setdefault("CELERY_TASK_ALWAYS_EAGER", "true")
 os.environ.setdefault("CELERY_TASK_EAGER_PROPAGATES", "true")
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
-from app.core.database import Base
+from app.core.database import Base, async_database_url
 # Note: Spec says app.db.base but we use app.core.database
 from app.core.config import settings
 from app.core.security import create_access_token
@@ -52,12 +60,13 @@ from app.core.database import SessionLocal
 @pytest.fixture(scope="session", autouse=True)
 def test_env():
     # Environment already set above
-    pass
+    yield
+    shutil.rmtree(_TEST_DB_DIR, ignore_errors=True)
 
 @pytest.fixture(scope="session")
 def engine():
-    # Use in-memory SQLite for tests, or PostgreSQL if DATABASE_URL is set
-    test_db_url = os.environ.get("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+    # SQLite file database for tests, or PostgreSQL if DATABASE_URL is set
+    test_db_url = os.environ["DATABASE_URL"]
 
     # check_same_thread is only valid for SQLite
     if "sqlite" in test_db_url:
@@ -68,6 +77,16 @@ def engine():
     Base.metadata.create_all(engine)
     return engine
 
+@pytest.fixture(scope="session")
+def async_session_factory(engine):
+    # NullPool: each TestClient request runs on its own event loop, so
+    # async connections can't be pooled across requests
+    async_engine = create_async_engine(
+        async_database_url(engine.url.render_as_string(hide_password=False)),
+        poolclass=NullPool
+    )
+    return async_sessionmaker(async_engine, expire_on_commit=False)
+
 @pytest.fixture()
 def db(engine):
     SessionLocal = sessionmaker(bind=engine)
@@ -83,7 +102,7 @@ def db(engine):
         session.close()
 
 @pytest.fixture()
-def client(db):
+def client(db, async_session_factory):
     # Override get_db dependency
     def override_get_db():
         try:
@@ -91,9 +110,17 @@ def client(db):
         finally:
             pass
     
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+    
     app.dependency_overrides = {}
-    from app.core.database import get_db
+    from app.core.database import get_db, get_async_db, get_read_db, get_async_read_db
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Tests run against a single database, so reads use the same sessions
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
     
     return TestClient(app)
 
@@ -147,3 +174,38 @@ def client_token(client_user):
         token_data["client_id"] = str(client_user.client_id)
     return create_access_token(data=token_data)
 
+
+@pytest.fixture()
+def auth_headers(client_token):
+    return {"Authorization": f"Bearer {client_token}"}
+
+@pytest.fixture()
+def seed_geography(db, test_client_account):
+    """
+    Factory for a test-client geography with ZIP codes and households:
+    seed_geography(name, zip_codes, households) -> (geography, [ZIPCode])
+    households are Household field dicts; "zip" indexes zip_codes (default 0,
+    None for no ZIP code); client_id and geography_id are filled in
+    """
+    def seed(name, zip_codes=(), households=()):
+        geography = Geography(name=name, client_id=test_client_account.id, type="CITY", state_code="GA")
+        db.add(geography)
+        db.commit()
+        zips = [ZIPCode(zip_code=zip_code, geography_id=geography.id) for zip_code in zip_codes]
+        db.add_all(zips)
+        db.commit()
+
+        def household(fields):
+            zip_index = fields.get("zip", 0)
+            return Household(
+                client_id=test_client_account.id,
+                geography_id=geography.id,
+                zip_code_id=zips[zip_index].id if zips and zip_index is not None else None,
+                **{key: value for key, value in fields.items() if key != "zip"}
+            )
+
+        db.add_all([household(fields) for fields in households])
+        db.commit()
+        return geography, zips
+
+    return seed
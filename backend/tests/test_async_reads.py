@@ -0,0 +1,63 @@
+"""
+Tests for read endpoints served from the async session
+"""
+from app.core.database import async_database_url
+from app.models import IntelligenceReport
+from app.models.demand_signal import DemandSignal, ServiceCategory, SignalType
+
+
+def test_async_database_url_swaps_driver():
+    assert async_database_url("postgresql://u:p@db:5432/app") == "postgresql+asyncpg://u:p@db:5432/app"
+    assert async_database_url("postgresql+psycopg2://u@db/app") == "postgresql+asyncpg://u@db/app"
+    assert async_database_url("sqlite+pysqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+
+
+def test_geography_zip_codes_and_households_read_async(client, auth_headers, seed_geography):
+    geography, (zip_a, zip_b) = seed_geography("Async City", ("30101", "30102"), [{"zip": 0}, {"zip": 1}])
+
+    res = client.get(f"/api/v1/geography/{geography.id}/zip-codes", headers=auth_headers)
+    assert res.status_code == 200
+    assert sorted(z["zip_code"] for z in res.json()) == ["30101", "30102"]
+
+    res = client.get("/api/v1/geography/zip-codes/30101", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["id"] == zip_a.id
+
+    res = client.get(f"/api/v1/households/?zip_code_id={zip_b.id}", headers=auth_headers)
+    assert res.status_code == 200
+    assert [h["zip_code_id"] for h in res.json()] == [zip_b.id]
+
+
+def test_signals_and_reports_read_async(client, auth_headers, db, test_client_account, seed_geography):
+    geography, _ = seed_geography("Async City")
+    signal = DemandSignal(
+        client_id=test_client_account.id,
+        geography_id=geography.id,
+        signal_type=SignalType.EVENT,
+        service_category=ServiceCategory.LAWN_CARE,
+        title="Garden Show"
+    )
+    report = IntelligenceReport(
+        client_id=test_client_account.id,
+        geography_id=geography.id,
+        report_name="Async Report",
+        zip_codes="30101",
+        service_category="lawn_care",
+        total_households=10,
+        report_data={"top_zip_codes": [{"zip_code": "30101", "score": 80}]}
+    )
+    db.add_all([signal, report])
+    db.commit()
+
+    res = client.get(f"/api/v1/demand-signals/{signal.id}", headers=auth_headers)
+    assert res.status_code == 200
+    assert res.json()["title"] == "Garden Show"
+
+    res = client.get(f"/api/v1/intelligence/reports?geography_id={geography.id}", headers=auth_headers)
+    assert [r["id"] for r in res.json()] == [report.id]
+
+    res = client.get(f"/api/v1/intelligence/reports/{report.id}/export/json", headers=auth_headers)
+    assert res.json()["top_zip_codes"] == [{"zip_code": "30101", "score": 80}]
+
+    res = client.get(f"/api/v1/intelligence/reports/{report.id + 1}", headers=auth_headers)
+    assert res.status_code == 404
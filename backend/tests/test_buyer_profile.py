@@ -0,0 +1,60 @@
+"""
+Tests for the SQL-aggregated buyer profile
+"""
+from unittest.mock import patch
+from app.models import ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+HOUSEHOLDS = [
+    dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY,
+         income_band_min=80000, income_band_max=100000, property_age_years=20, lot_size_sqft=9000),
+    dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY,
+         income_band_min=50000, income_band_max=60000, property_age_years=0, lot_size_sqft=0),
+    dict(ownership_type=OwnershipType.RENTER, property_type=PropertyType.APARTMENT,
+         income_band_min=20000, income_band_max=40000, property_age_years=5),
+    dict(ownership_type=OwnershipType.RENTER, property_type=None,
+         income_band_min=0, income_band_max=90000),
+    dict(ownership_type=OwnershipType.UNKNOWN, property_type=PropertyType.UNKNOWN,
+         income_band_min=50000, income_band_max=50000, lot_size_sqft=3000),
+]
+
+
+def test_aggregate_matches_python_profile(db, test_client_account, seed_geography):
+    geography, (zip_obj,) = seed_geography("Profile City", ("30501",), HOUSEHOLDS)
+    engine = IntelligenceEngine(db)
+
+    households = engine.get_households_by_geography(test_client_account.id, geography.id)
+    expected = engine.generate_buyer_profile(households, ServiceCategory.GENERAL)
+
+    assert engine.aggregate_buyer_profile(test_client_account.id, geography.id) == expected
+    assert engine.aggregate_buyer_profile(test_client_account.id, zip_code_ids=[zip_obj.id]) == expected
+    assert expected["income_distribution"] == {"low": 2, "medium": 1, "high": 1}
+    assert expected["property_types"] == {"single_family": 2, "apartment": 1, "unknown": 2}
+
+
+def test_aggregate_empty_geography(db, test_client_account):
+    engine = IntelligenceEngine(db)
+    assert engine.aggregate_buyer_profile(test_client_account.id, geography_id=-1) == \
+        engine.generate_buyer_profile([], ServiceCategory.GENERAL)
+
+
+def test_endpoint_does_not_load_households(client, auth_headers, seed_geography):
+    geography, _ = seed_geography("Profile City", ("30501",), HOUSEHOLDS)
+
+    with patch.object(IntelligenceEngine, "get_households_by_geography", side_effect=AssertionError):
+        res = client.post(
+            f"/api/v1/intelligence/buyer-profile?geography_id={geography.id}&zip_codes=30501",
+            headers=auth_headers
+        )
+    assert res.status_code == 200
+    assert res.json()["total_households"] == 5
+    assert res.json()["homeowner_percentage"] == 40.0
+
+    # A score threshold still filters scored households
+    res = client.post(
+        f"/api/v1/intelligence/buyer-profile?geography_id={geography.id}&service_category=security&min_demand_score=60",
+        headers=auth_headers
+    )
+    assert res.json()["total_households"] == 2
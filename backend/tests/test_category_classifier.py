@@ -0,0 +1,62 @@
+"""
+Tests for the shared service category classifier
+"""
+from app.models.demand_signal import ServiceCategory
+from app.services.category_classifier import (
+    CategoryClassifier,
+    classify_categories,
+    classify_primary_category,
+    default_classifier,
+)
+
+
+def test_returns_every_matching_category_in_priority_order():
+    categories = classify_categories("July 4th Fireworks in the Park, safety briefing at 7")
+
+    assert categories == [
+        ServiceCategory.FIREWORKS,
+        ServiceCategory.LAWN_CARE,
+        ServiceCategory.SECURITY,
+    ]
+
+
+def test_primary_category_and_default():
+    assert classify_primary_category("Outdoor Movie Night") == ServiceCategory.LAWN_CARE
+    assert classify_primary_category("Independence Day Parade") == ServiceCategory.FIREWORKS
+    assert classify_primary_category("Library Book Sale") == ServiceCategory.GENERAL
+    assert classify_primary_category("") == ServiceCategory.GENERAL
+    assert classify_primary_category(None) == ServiceCategory.GENERAL
+
+
+def test_matching_is_case_insensitive_substring():
+    assert classify_primary_category("FIREWORKS SPECTACULAR") == ServiceCategory.FIREWORKS
+    assert classify_primary_category("Lawnmower Races") == ServiceCategory.LAWN_CARE
+
+
+def test_batch_matches_single_classification():
+    texts = [
+        "Summer Festival",
+        "Neighborhood Safety Meeting",
+        None,
+        "4th of July\nCelebration",
+        "Board Meeting",
+        "park",
+    ]
+
+    assert default_classifier.classify_many(texts) == [default_classifier.classify(t) for t in texts]
+    assert default_classifier.classify_many([]) == []
+
+
+def test_batch_matches_do_not_span_texts():
+    classifier = CategoryClassifier({ServiceCategory.SECURITY: ("ab",)})
+
+    assert classifier.classify_many_primary(["a", "b"]) == [ServiceCategory.GENERAL, ServiceCategory.GENERAL]
+
+
+def test_contained_keyword_categories_are_reported():
+    classifier = CategoryClassifier({
+        ServiceCategory.FIREWORKS: ("firework",),
+        ServiceCategory.SECURITY: ("work",),
+    })
+
+    assert classifier.classify("fireworks") == [ServiceCategory.FIREWORKS, ServiceCategory.SECURITY]
@@ -0,0 +1,135 @@
+"""
+Tests for Parquet/Arrow property imports
+"""
+import csv
+import io
+import json
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from app.core.file_storage import delete_file, save_uploaded_file
+from app.models.demand_signal import DemandSignal
+from app.models.geography import Geography
+from app.models.ingestion import IngestionRun, SourceType
+from app.services.columnar_import import ColumnarImportService
+from app.services.csv_import import CSVImportService
+
+
+PROPERTY_ROWS = {
+    "zip_code": ["30043", "30043", " 30043 ", "30044", "", "30044"],
+    "property_type": ["SINGLE_FAMILY", "single_family", "SINGLE_FAMILY", "CASTLE", "CONDO", None],
+    "ownership_type": ["OWNER_OCCUPIED", "OWNER", "OWNER_OCCUPIED", "RENTER_OCCUPIED", "OWNER", ""],
+    "lot_size_sqft": [8000, 12000, None, 3000, 5000, 4000],
+    "year_built": [1990, 2000, 2010, None, 1980, 1970],
+}
+
+
+def _geography(db, client_id) -> Geography:
+    geography = Geography(name="Columnar City", client_id=client_id, type="CITY", state_code="GA")
+    db.add(geography)
+    db.commit()
+    db.refresh(geography)
+    return geography
+
+
+def _parquet_bytes(data: dict) -> bytes:
+    sink = io.BytesIO()
+    pq.write_table(pa.table(data), sink)
+    return sink.getvalue()
+
+
+def _stored_aggregates(db, geography_id: int) -> list:
+    signals = db.query(DemandSignal).filter(DemandSignal.geography_id == geography_id).all()
+    aggregates = []
+    for signal in signals:
+        metadata = json.loads(signal.signal_metadata)
+        metadata.pop("source")
+        aggregates.append((signal.title, signal.value, json.dumps(metadata, sort_keys=True)))
+    return sorted(aggregates)
+
+
+def test_columnar_aggregates_match_csv_import(db, test_client_account):
+    csv_geography = _geography(db, test_client_account.id)
+    columnar_geography = _geography(db, test_client_account.id)
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(PROPERTY_ROWS.keys())
+    for row in zip(*PROPERTY_ROWS.values()):
+        writer.writerow(["" if value is None else value for value in row])
+
+    csv_ref = save_uploaded_file(out.getvalue().encode(), "props.csv")
+    parquet_ref = save_uploaded_file(_parquet_bytes(PROPERTY_ROWS), "props.parquet")
+    try:
+        csv_service = CSVImportService(db, test_client_account.id)
+        csv_service.import_property_csv(csv_service.parse_csv_file(csv_ref), csv_geography.id)
+        imported = ColumnarImportService(db, test_client_account.id).import_property_file(parquet_ref, columnar_geography.id)
+    finally:
+        delete_file(csv_ref)
+        delete_file(parquet_ref)
+
+    assert imported == 3
+    assert _stored_aggregates(db, columnar_geography.id) == _stored_aggregates(db, csv_geography.id)
+
+
+def test_feather_file_is_cast_to_declared_schema(db, test_client_account):
+    geography = _geography(db, test_client_account.id)
+    sink = io.BytesIO()
+    # Integer ZIP codes and missing optional columns
+    feather.write_feather(pa.table({"zip_code": [30043, 30043, 30044]}), sink)
+
+    file_ref = save_uploaded_file(sink.getvalue(), "props.feather")
+    try:
+        service = ColumnarImportService(db, test_client_account.id)
+        assert service.validate_property_file(file_ref) == 3
+        assert service.import_property_file(file_ref, geography.id) == 2
+    finally:
+        delete_file(file_ref)
+
+    counts = {signal.title: signal.value for signal in db.query(DemandSignal).filter(DemandSignal.geography_id == geography.id)}
+    assert counts == {"Property Aggregate: 30043": 2.0, "Property Aggregate: 30044": 1.0}
+
+
+def test_columnar_endpoint_rejects_pii_columns(client, client_token, db, test_client_account):
+    geography = _geography(db, test_client_account.id)
+    data = _parquet_bytes({"zip_code": ["30043"], "Email": ["a@b.com"]})
+
+    res = client.post(
+        f"/api/v1/import/property/columnar?geography_id={geography.id}",
+        files={"file": ("props.parquet", io.BytesIO(data), "application/octet-stream")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+
+    assert res.status_code == 400
+    assert "PII" in res.json()["detail"]
+
+
+def test_columnar_endpoint_imports_parquet(client, client_token, db, test_client_account):
+    geography = _geography(db, test_client_account.id)
+    data = _parquet_bytes(PROPERTY_ROWS)
+
+    res = client.post(
+        f"/api/v1/import/property/columnar?geography_id={geography.id}",
+        files={"file": ("props.parquet", io.BytesIO(data), "application/octet-stream")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+
+    assert res.status_code == 200
+    db.expire_all()
+    run = db.query(IngestionRun).filter(IngestionRun.geography_id == geography.id).one()
+    assert run.source_type == SourceType.COLUMNAR_PROPERTY
+    assert run.status.value == "success"
+    assert run.records_upserted == 3
+    delete_file(run.file_ref)
+
+
+def test_columnar_endpoint_rejects_csv(client, client_token, db, test_client_account):
+    geography = _geography(db, test_client_account.id)
+
+    res = client.post(
+        f"/api/v1/import/property/columnar?geography_id={geography.id}",
+        files={"file": ("props.csv", io.BytesIO(b"zip_code\n30043"), "text/csv")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+
+    assert res.status_code == 400
@@ -0,0 +1,64 @@
+"""
+Tests for connection pool configuration and pool metrics
+"""
+import os
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from app.core.config import settings
+from app.core.database import engine_options
+from app.core.db_metrics import TimedQueuePool, register_pool_gauges
+
+
+PG_URL = "postgresql://user:pass@db:5432/app"
+
+
+def test_engine_options_apply_pool_settings():
+    options = engine_options(PG_URL, "api", pool_size=7, max_overflow=3)
+
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["pool_recycle"] == settings.DB_POOL_RECYCLE
+    assert options["pool_timeout"] == settings.DB_POOL_TIMEOUT
+    assert options["pool_logging_name"] == "api"
+
+
+def test_sql_echo_is_off_by_default_and_sqlite_keeps_its_pool():
+    options = engine_options("sqlite+pysqlite:///:memory:", "api", pool_size=7, max_overflow=3)
+
+    assert options == {"pool_pre_ping": True, "echo": False}
+
+
+@pytest.mark.skipif(
+    "postgresql" not in os.environ.get("DATABASE_URL", ""),
+    reason="pool metrics need a server database"
+)
+def test_pool_checkout_wait_and_usage_are_exported():
+    url = os.environ["DATABASE_URL"]
+    test_engine = create_engine(url, **engine_options(url, "test_pool", pool_size=1, max_overflow=1))
+    register_pool_gauges({"test_pool": test_engine})
+
+    def sample(name):
+        return REGISTRY.get_sample_value(name, {"pool": "test_pool"}) or 0
+
+    before = sample("db_pool_checkout_wait_seconds_count")
+    try:
+        with test_engine.connect() as first, test_engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            assert sample("db_pool_connections_in_use") == 2
+            assert sample("db_pool_overflow_connections") == 1
+        assert sample("db_pool_connections_in_use") == 0
+        assert sample("db_pool_checkout_wait_seconds_count") == before + 2
+        assert sample("db_pool_size") == 1
+    finally:
+        test_engine.dispose()
+
+
+def test_pool_metrics_are_exposed_next_to_http_metrics(client):
+    res = client.get("/metrics")
+
+    assert res.status_code == 200
+    assert "db_pool_checkout_wait_seconds" in res.text
+    assert "db_pool_connections_in_use" in res.text
@@ -0,0 +1,69 @@
+"""
+Tests for ZIP demand rollups
+"""
+from app.models import ServiceCategory, ZIPDemandRollup
+from app.models.household import OwnershipType, PropertyType
+from app.services.demand_rollups import DemandRollupService
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def test_household_batch_refreshes_rollups(client, auth_headers, db, seed_geography):
+    geography, (zip_a, _) = seed_geography("Rollup City", ("30401", "30402"))
+
+    res = client.post(
+        "/api/v1/households/batch",
+        json=[
+            {"geography_id": geography.id, "zip_code_id": zip_a.id, "ownership_type": "owner",
+             "property_type": "single_family", "lot_size_sqft": 12000},
+            {"geography_id": geography.id, "zip_code_id": zip_a.id, "ownership_type": "renter",
+             "property_type": "apartment"},
+        ],
+        headers=auth_headers
+    )
+    assert res.status_code == 200
+
+    rows = db.query(ZIPDemandRollup).filter(ZIPDemandRollup.zip_code_id == zip_a.id).all()
+    assert len(rows) == len(ServiceCategory)
+    lawn = next(r for r in rows if r.service_category == "lawn_care")
+    # Owner/large lot/single family = 90, renter = 10
+    assert lawn.household_count == 2
+    assert lawn.avg_score == 50.0
+    assert lawn.score_p50 == 50.0
+    assert lawn.score_p90 == 82.0
+    assert lawn.owner_ratio == 0.5
+    assert lawn.large_lot_ratio == 0.5
+
+
+def test_zip_scores_read_rollups(db, test_client_account, seed_geography):
+    geography, (zip_a, zip_b) = seed_geography("Rollup City", ("30401", "30402"), [
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+    ])
+    engine = IntelligenceEngine(db)
+
+    # Before the first refresh ZIPs are scored from households
+    before = engine.calculate_zip_demand_scores(
+        test_client_account.id, [zip_a.id, zip_b.id], ServiceCategory.SECURITY
+    )
+    assert before == {"30401": 70.0, "30402": 0.0}
+
+    assert DemandRollupService(db, test_client_account.id).refresh_geography(geography.id) == 2 * len(ServiceCategory)
+    assert engine.calculate_zip_demand_scores(
+        test_client_account.id, [zip_a.id, zip_b.id], ServiceCategory.SECURITY
+    ) == before
+
+    # Once rolled up, households aren't rescanned
+    rollup = db.query(ZIPDemandRollup).filter(
+        ZIPDemandRollup.zip_code_id == zip_a.id,
+        ZIPDemandRollup.service_category == "security"
+    ).one()
+    rollup.avg_score = 42.0
+    rollup.owner_ratio = 0.9
+    rollup.large_lot_ratio = 0.8
+    db.commit()
+
+    top = engine.get_top_zip_codes_with_rationale(
+        test_client_account.id, [zip_a.id, zip_b.id], ServiceCategory.SECURITY
+    )
+    assert [(z["zip_code"], z["score"]) for z in top] == [("30401", 42.0), ("30402", 0.0)]
+    assert "High percentage of homeowners" in top[0]["rationale"]
+    assert "Many properties with large lots" in top[0]["rationale"]
@@ -0,0 +1,40 @@
+"""
+Tests for event-to-category mapping in the event collector
+"""
+from unittest.mock import MagicMock
+from app.collectors.event_collector import EventCollector
+from app.models.demand_signal import ServiceCategory
+
+
+def test_events_map_to_shared_keyword_categories():
+    collector = EventCollector(MagicMock())
+
+    assert collector._map_event_to_service_category({"event_title": "Independence Day Fireworks in the Park"}) == [
+        ServiceCategory.FIREWORKS, ServiceCategory.LAWN_CARE,
+    ]
+    assert collector._map_event_to_service_category(
+        {"event_title": "Lawn Mower Clinic", "event_description": None}
+    ) == [ServiceCategory.LAWN_CARE]
+    assert collector._map_event_to_service_category(
+        {"event_title": "Neighborhood Watch", "event_description": "Home safety and security night"}
+    ) == [ServiceCategory.SECURITY]
+    assert collector._map_event_to_service_category({"event_title": "Library Book Sale"}) == [
+        ServiceCategory.GENERAL,
+    ]
+
+
+def test_store_creates_one_signal_per_matched_category():
+    db = MagicMock()
+    collector = EventCollector(db)
+
+    stored = collector.store([
+        {"event_title": "July 4th Festival", "event_description": "Safety briefing at 7", "event_start_date": "2024-07-04"},
+        {"event_title": "Board Meeting", "service_categories": ["hvac", "not_a_category"]},
+    ])
+
+    signals = [call.args[0] for call in db.add.call_args_list]
+    assert stored == 4
+    assert [s.service_category for s in signals] == [
+        ServiceCategory.FIREWORKS, ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY, ServiceCategory.HVAC,
+    ]
+    assert {s.title for s in signals[:3]} == {"July 4th Festival"}
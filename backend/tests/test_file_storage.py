@@ -0,0 +1,168 @@
+"""
+Tests for streaming upload storage
+"""
+import asyncio
+import gzip
+import hashlib
+import io
+import uuid
+import pytest
+import zstandard
+from unittest.mock import MagicMock, patch
+from app.core.file_storage import (
+    UPLOAD_DIR,
+    UploadTooLargeError,
+    delete_file,
+    get_file_path,
+    get_reference_count,
+    is_allowed_upload,
+    upload_extension,
+    save_upload_stream,
+    save_uploaded_file,
+)
+from app.core.config import settings
+from app.services.csv_import import CSVImportService
+
+
+class FakeUpload:
+    """Minimal async reader standing in for fastapi.UploadFile"""
+
+    def __init__(self, content: bytes):
+        self._buffer = io.BytesIO(content)
+        self.reads = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return self._buffer.read(size)
+
+
+def test_save_upload_stream_writes_in_chunks_and_hashes():
+    content = b"zip_code,property_type\n" + b"30043,SINGLE_FAMILY\n" * 1000
+    upload = FakeUpload(content)
+
+    stored = asyncio.run(save_upload_stream(upload, "data.csv", chunk_size=1024))
+
+    try:
+        assert stored["size"] == len(content)
+        assert stored["sha256"] == hashlib.sha256(content).hexdigest()
+        assert get_file_path(stored["file_ref"]).read_bytes() == content
+        assert upload.reads > len(content) // 1024
+    finally:
+        delete_file(stored["file_ref"])
+
+
+def test_save_upload_stream_enforces_size_limit():
+    before = set(UPLOAD_DIR.iterdir())
+
+    with pytest.raises(UploadTooLargeError):
+        asyncio.run(save_upload_stream(FakeUpload(b"x" * 5000), "big.csv", max_bytes=4096, chunk_size=1024))
+
+    # No partial or final file is left behind
+    assert set(UPLOAD_DIR.iterdir()) == before
+
+
+def test_identical_uploads_share_one_file_until_last_reference():
+    content = b"zip_code,lot_size_sqft\n30043,9000\n30044,4000\n"
+
+    first = asyncio.run(save_upload_stream(FakeUpload(content), "a.csv"))
+    second = asyncio.run(save_upload_stream(FakeUpload(content), "b.csv"))
+    third_ref = save_uploaded_file(content, "c.csv")
+
+    assert first["file_ref"] == second["file_ref"] == third_ref == hashlib.sha256(content).hexdigest()
+    assert first["deduplicated"] is False
+    assert second["deduplicated"] is True
+    assert get_reference_count(third_ref) == 3
+
+    assert delete_file(third_ref) is True
+    assert delete_file(third_ref) is True
+    assert get_file_path(third_ref) is not None
+    assert delete_file(third_ref) is True
+    assert get_file_path(third_ref) is None
+    assert get_reference_count(third_ref) == 0
+    assert delete_file(third_ref) is False
+
+
+def test_upload_endpoint_returns_checksum(client, client_token):
+    csv_data = b"zip_code,property_type\n30043,SINGLE_FAMILY"
+    res = client.post(
+        "/api/v1/uploads",
+        files={"file": ("test.csv", io.BytesIO(csv_data), "text/csv")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+
+    assert res.status_code == 200
+    assert res.json()["size"] == len(csv_data)
+    assert res.json()["sha256"] == hashlib.sha256(csv_data).hexdigest()
+    delete_file(res.json()["file_ref"])
+
+
+def test_oversized_upload_is_rejected_before_the_body_is_read(client, client_token, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_MB", 1)
+
+    with patch("app.api.v1.endpoints.uploads.save_upload_stream", side_effect=AssertionError):
+        res = client.post(
+            "/api/v1/uploads",
+            files={"file": ("big.csv", io.BytesIO(b"x" * (2 * 1024 * 1024)), "text/csv")},
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+
+    assert res.status_code == 413
+    assert "1 MB" in res.json()["detail"]
+
+
+def _csv_service():
+    return CSVImportService(MagicMock(), uuid.uuid4())
+
+
+@pytest.mark.parametrize("filename, compress", [
+    ("data.csv.gz", gzip.compress),
+    ("data.csv.zst", lambda data: zstandard.ZstdCompressor().compress(data)),
+])
+def test_compressed_upload_is_stored_compressed_and_parsed(filename, compress):
+    content = b"zip_code,property_type\n" + b"30043,SINGLE_FAMILY\n" * 500
+    compressed = compress(content)
+
+    file_ref = save_uploaded_file(compressed, filename)
+
+    try:
+        path = get_file_path(file_ref)
+        assert path.name.endswith(filename[len("data"):])
+        assert path.read_bytes() == compressed
+
+        rows = _csv_service().parse_csv_file(file_ref)
+        assert len(rows) == 500
+        assert rows[0] == {"zip_code": "30043", "property_type": "SINGLE_FAMILY"}
+    finally:
+        delete_file(file_ref)
+
+
+def test_corrupt_compressed_upload_fails_validation():
+    file_ref = save_uploaded_file(b"not gzip at all", "broken.csv.gz")
+
+    try:
+        with pytest.raises(ValueError, match="decompress"):
+            _csv_service().validate_csv_file(file_ref)
+    finally:
+        delete_file(file_ref)
+
+
+def test_allowed_upload_names():
+    assert upload_extension("Data.CSV.GZ") == ".csv.gz"
+    assert upload_extension("data.txt") == ".txt"
+    assert is_allowed_upload("data.csv.zst")
+    assert not is_allowed_upload("data.gz")
+    assert not is_allowed_upload("data.xlsx")
+    assert not is_allowed_upload(None)
+
+
+def test_upload_endpoint_accepts_gzip(client, client_token):
+    compressed = gzip.compress(b"zip_code,property_type\n30043,SINGLE_FAMILY")
+    res = client.post(
+        "/api/v1/uploads",
+        files={"file": ("test.csv.gz", io.BytesIO(compressed), "application/gzip")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+
+    assert res.status_code == 200
+    assert res.json()["size"] == len(compressed)
+    delete_file(res.json()["file_ref"])
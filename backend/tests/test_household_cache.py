@@ -0,0 +1,131 @@
+"""
+Tests for the columnar household cache
+"""
+from datetime import datetime
+from unittest.mock import patch
+import pytest
+from app.core.config import settings
+from app.models import Household, ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services import household_cache
+from app.services.household_cache import HouseholdCache, table_columns
+from app.services.intelligence_engine import IntelligenceEngine
+from app.services.scoring_rules import household_columns
+
+
+@pytest.fixture()
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "HOUSEHOLD_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _seed(seed_geography):
+    geography, (zip_a, _) = seed_geography("Cache City", ("30901", "30902"), [
+        dict(zip=0, ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY,
+             lot_size_sqft=8000, income_band_min=70000, income_band_max=90000, property_age_years=12),
+        dict(zip=1, ownership_type=OwnershipType.RENTER, property_type=None),
+        dict(zip=None, ownership_type=OwnershipType.OWNER, property_type=PropertyType.CONDO),
+    ])
+    return geography, zip_a
+
+
+def test_records_match_database_scan(db, test_client_account, cache_dir, seed_geography):
+    geography, zip_a = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+
+    scanned = list(engine.scan_households(test_client_account.id, geography.id))
+    cached = HouseholdCache(db).records(test_client_account.id, geography)
+
+    key = lambda h: h.id
+    for row, record in zip(sorted(scanned, key=key), sorted(cached, key=key)):
+        assert tuple(getattr(record, name) for name in row._fields) == tuple(row)
+    assert engine.generate_buyer_profile(cached, ServiceCategory.LAWN_CARE) == \
+        engine.generate_buyer_profile(scanned, ServiceCategory.LAWN_CARE)
+    assert [r.zip_code_id for r in HouseholdCache(db).records(test_client_account.id, geography, [zip_a.id])] == [zip_a.id]
+
+
+def test_columns_and_scores_come_from_arrow_without_records(db, test_client_account, cache_dir, seed_geography):
+    geography, _ = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+    categories = [ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY]
+    zip_ids = [z.id for z in geography.zip_codes] + [0]
+    scanned = sorted(engine.scan_households(test_client_account.id, geography.id), key=lambda h: h.id)
+
+    table = HouseholdCache(db).load_table(test_client_account.id, geography).sort_by("id")
+    expected = household_columns(scanned)
+    columns = table_columns(table)
+    assert columns.keys() == expected.keys()
+    for name in expected:
+        assert columns[name].tolist() == expected[name].tolist()
+
+    with patch.object(household_cache, "table_records", side_effect=AssertionError):
+        scored = engine.score_geography(test_client_account.id, geography.id, zip_ids, categories)
+    assert scored == engine.score_households(scanned, zip_ids, categories)
+
+    # Records are built only for households that pass the threshold
+    rows = engine.scan_households_by_geography(
+        test_client_account.id, geography.id, service_category=ServiceCategory.LAWN_CARE, min_demand_score=60
+    )
+    assert [r.id for r in rows] == [scanned[0].id]
+
+
+def test_cache_is_reused_until_households_change(db, test_client_account, cache_dir, monkeypatch, seed_geography):
+    geography, _ = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+
+    assert len(engine.load_households(test_client_account.id, geography.id)) == 3
+    files = list(cache_dir.rglob("*.arrow"))
+    assert len(files) == 1
+
+    with patch.object(IntelligenceEngine, "scan_households", side_effect=AssertionError):
+        assert len(engine.load_households(test_client_account.id, geography.id)) == 3
+
+    db.add(Household(client_id=test_client_account.id, geography_id=geography.id))
+    db.commit()
+    assert len(engine.load_households(test_client_account.id, geography.id)) == 4
+
+    # Superseded files stay during the grace period, then rebuilds remove them
+    assert len(list(cache_dir.rglob("*.arrow"))) == 2
+    monkeypatch.setattr(household_cache, "STALE_FILE_GRACE_SECONDS", 0)
+    geography.property_last_refreshed_at = datetime(2030, 1, 1)
+    db.commit()
+    engine.load_households(test_client_account.id, geography.id)
+
+    remaining = list(cache_dir.rglob("*.arrow"))
+    assert len(remaining) == 1
+    assert remaining[0] not in files
+
+
+def test_file_removed_before_mapping_is_rebuilt(db, test_client_account, cache_dir, seed_geography):
+    geography, _ = _seed(seed_geography)
+    cache = HouseholdCache(db)
+    path = cache.ensure_file(test_client_account.id, geography)
+    original = household_cache.read_table
+    calls = []
+
+    def removed_once(file_path):
+        # Simulates another process's cleanup between ensure_file and the map
+        if not calls:
+            calls.append(file_path)
+            file_path.unlink()
+        return original(file_path)
+
+    with patch.object(household_cache, "read_table", removed_once):
+        assert cache.load_table(test_client_account.id, geography).num_rows == 3
+    assert path.exists()
+
+
+def test_report_uses_cache(client, auth_headers, db, cache_dir, seed_geography):
+    geography, _ = _seed(seed_geography)
+
+    res = client.post(
+        "/api/v1/intelligence/reports",
+        json={"geography_id": geography.id, "zip_codes": "30901,30902", "service_category": "lawn_care"},
+        headers=auth_headers
+    )
+
+    assert res.status_code == 202
+    assert list(cache_dir.rglob("*.arrow"))
+    db.expire_all()
+    res = client.get(f"/api/v1/intelligence/reports/{res.json()['id']}", headers=auth_headers)
+    assert res.json()["total_households"] == 2
@@ -0,0 +1,84 @@
+"""
+Tests for faceted household counts
+"""
+from unittest.mock import patch
+from app.models import Geography
+from app.models.household import OwnershipType, PropertyType
+from app.services.household_facets import HouseholdFacets
+
+
+def _seed(seed_geography) -> Geography:
+    def household(zip_index, ownership, property_type, lot=None, income=(None, None)):
+        return dict(zip=zip_index, ownership_type=ownership, property_type=property_type, lot_size_sqft=lot,
+                    income_band_min=income[0], income_band_max=income[1])
+
+    geography, _ = seed_geography("Facet City", ("31501", "31502"), [
+        household(0, OwnershipType.OWNER, PropertyType.SINGLE_FAMILY, 12000, (80000, 100000)),
+        household(0, OwnershipType.OWNER, PropertyType.SINGLE_FAMILY, 6000, (50000, 70000)),
+        household(0, OwnershipType.RENTER, PropertyType.CONDO, 2000, (20000, 40000)),
+        household(1, OwnershipType.RENTER, None, 0, (0, 40000)),
+        household(1, OwnershipType.UNKNOWN, PropertyType.UNKNOWN, 4000),
+    ])
+    return geography
+
+
+def _get(client, auth_headers, geography_id, headers=None, **params):
+    return client.get(
+        f"/api/v1/households/geography/{geography_id}/facets",
+        params=params,
+        headers={**auth_headers, **(headers or {})}
+    )
+
+
+def test_facet_counts(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = _get(client, auth_headers, geography.id)
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["total"] == 5
+    assert body["facets"] == {
+        "property_type": {"single_family": 2, "condo": 1, "unknown": 2},
+        "ownership_type": {"owner": 2, "renter": 2, "unknown": 1},
+        "income_band": {"low": 1, "medium": 1, "high": 1, "unknown": 2},
+        "lot_size_band": {"small": 1, "medium": 1, "large": 1, "very_large": 1, "unknown": 1},
+    }
+
+    res = _get(client, auth_headers, geography.id, ownership_type="owner", lot_size_band="large")
+    assert res.json()["total"] == 1
+    assert res.json()["facets"]["income_band"]["medium"] == 1
+
+    res = _get(client, auth_headers, geography.id, property_type="unknown", zip_code_id=geography.zip_codes[1].id)
+    assert res.json()["total"] == 2
+
+
+def test_python_pass_matches_grouping_sets(db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    facets = HouseholdFacets(db, test_client_account.id, geography.id)
+
+    for filters in ({}, {"income_band": "unknown"}, {"lot_size_band": "small", "ownership_type": "renter"}):
+        assert facets.python_counts(filters) == facets.counts(filters)
+
+
+def test_facets_cached_with_etag(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+    first = _get(client, auth_headers, geography.id)
+    etag = first.headers["etag"]
+
+    with patch.object(HouseholdFacets, "counts", side_effect=AssertionError):
+        assert _get(client, auth_headers, geography.id).json() == first.json()
+        assert _get(client, auth_headers, geography.id, headers={"If-None-Match": etag}).status_code == 304
+    assert _get(client, auth_headers, geography.id, income_band="high").headers["etag"] != etag
+
+    res = client.post(
+        "/api/v1/households/",
+        json={"geography_id": geography.id, "ownership_type": "owner"},
+        headers=auth_headers
+    )
+    assert res.status_code in (200, 201)
+    res = _get(client, auth_headers, geography.id, headers={"If-None-Match": etag})
+    assert res.status_code == 200
+    assert res.json()["total"] == 6
+
+    assert _get(client, auth_headers, geography.id, income_band="rich").status_code == 400
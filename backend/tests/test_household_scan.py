@@ -0,0 +1,75 @@
+"""
+Tests for column-projected household scans
+"""
+from app.models import Household, ServiceCategory, ZIPCode
+from app.models.household import OwnershipType, PropertyType
+from app.services import intelligence_engine
+from app.services.intelligence_engine import HOUSEHOLD_SCORING_COLUMNS, IntelligenceEngine
+
+
+def _seed(seed_geography):
+    geography, (zip_a, _) = seed_geography("Scan City", ("30801", "30802"), [
+        dict(
+            zip=0 if i % 2 else 1,
+            ownership_type=OwnershipType.OWNER if i % 3 else OwnershipType.RENTER,
+            property_type=PropertyType.SINGLE_FAMILY,
+            lot_size_sqft=1000 * i,
+            income_band_min=10000 * i,
+            income_band_max=10000 * i + 20000,
+            property_age_years=i,
+        )
+        for i in range(1, 11)
+    ])
+    return geography, zip_a
+
+
+def test_scan_yields_scoring_columns_only(db, test_client_account, seed_geography):
+    geography, zip_a = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+
+    rows = list(engine.scan_households(test_client_account.id, geography.id, batch_size=3))
+
+    assert len(rows) == 10
+    assert not isinstance(rows[0], Household)
+    assert rows[0]._fields == tuple(c.key for c in HOUSEHOLD_SCORING_COLUMNS)
+    assert len(list(engine.scan_households(test_client_account.id, zip_code_ids=[zip_a.id]))) == 5
+
+
+def test_rows_score_and_profile_like_households(db, test_client_account, seed_geography):
+    geography, _ = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+
+    for category in (ServiceCategory.LAWN_CARE, ServiceCategory.IT_SERVICES):
+        households = engine.get_households_by_geography(
+            test_client_account.id, geography.id, service_category=category, min_demand_score=60
+        )
+        rows = engine.scan_households_by_geography(
+            test_client_account.id, geography.id, service_category=category, min_demand_score=60
+        )
+        assert sorted(r.id for r in rows) == sorted(h.id for h in households)
+        assert rows
+        assert engine.generate_buyer_profile(rows, category) == engine.generate_buyer_profile(households, category)
+
+
+def test_scored_scan_matches_scored_list(db, test_client_account, monkeypatch, seed_geography):
+    geography, _ = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+    zip_ids = [z.id for z in db.query(ZIPCode).filter(ZIPCode.geography_id == geography.id)]
+    categories = [ServiceCategory.LAWN_CARE, ServiceCategory.HVAC]
+    households = list(engine.scan_households(test_client_account.id, geography.id))
+    expected = engine.score_households(households, zip_ids, categories)
+
+    # Consumed as a stream in batches smaller than a ZIP's households
+    monkeypatch.setattr(intelligence_engine, "SCAN_BATCH_SIZE", 3)
+    scored = engine.score_households(
+        engine.scan_households(test_client_account.id, geography.id), zip_ids, categories
+    )
+
+    assert scored["count"] == 10
+    assert scored["rollups"] == expected["rollups"]
+    assert scored["profile_counts"] == expected["profile_counts"]
+    assert scored["score_sums"] == expected["score_sums"]
+    for category in categories:
+        for zip_id in zip_ids:
+            members = [h for h in households if h.zip_code_id == zip_id]
+            assert scored["rollups"][category][zip_id] == engine.summarize_zip_households(members, category)
@@ -0,0 +1,136 @@
+"""
+Tests for ICS Calendar Collector recurrence expansion
+"""
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from app.collectors.ics_calendar_collector import ICSCalendarCollector
+from app.models.client import Client
+from app.models.demand_signal import DemandSignal, SignalType
+from app.models.geography import Geography
+
+
+def _calendar(*events: str) -> bytes:
+    body = "\r\n".join(events)
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//test//EN\r\n{body}\r\nEND:VCALENDAR\r\n".encode()
+
+
+def _vevent(summary: str, dtstart: datetime, extra: str = "") -> str:
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uuid.uuid4()}",
+        f"SUMMARY:{summary}",
+        f"DTSTART:{dtstart.strftime('%Y%m%dT%H%M%S')}",
+        f"DTEND:{(dtstart + timedelta(hours=2)).strftime('%Y%m%dT%H%M%S')}",
+    ]
+    if extra:
+        lines.append(extra)
+    lines.append("END:VEVENT")
+    return "\r\n".join(lines)
+
+
+def _tomorrow() -> datetime:
+    return (datetime.utcnow() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+
+def test_weekly_rule_expands_within_horizon():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    start = _tomorrow()
+    ics = _calendar(_vevent("Farmers Market", start, "RRULE:FREQ=WEEKLY"))
+
+    events = collector.parse_calendar(ics, geography_id=1, horizon_days=28)
+
+    assert 4 <= len(events) <= 5
+    starts = [datetime.fromisoformat(e["event_start_date"]) for e in events]
+    assert starts[0] == start
+    assert all(b - a == timedelta(weeks=1) for a, b in zip(starts, starts[1:]))
+    assert all(
+        datetime.fromisoformat(e["event_end_date"]) - datetime.fromisoformat(e["event_start_date"]) == timedelta(hours=2)
+        for e in events
+    )
+
+
+def test_unbounded_daily_rule_is_capped_by_horizon():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    ics = _calendar(_vevent("Daily Yoga in the Park", datetime(2000, 1, 1, 7), "RRULE:FREQ=DAILY"))
+
+    events = collector.parse_calendar(ics, horizon_days=10)
+
+    assert 10 <= len(events) <= 11
+
+
+def test_exdate_and_rdate_are_applied():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    start = _tomorrow()
+    skipped = start + timedelta(days=1)
+    added = start + timedelta(days=20)
+    extra = "\r\n".join([
+        "RRULE:FREQ=DAILY;COUNT=3",
+        f"EXDATE:{skipped.strftime('%Y%m%dT%H%M%S')}",
+        f"RDATE:{added.strftime('%Y%m%dT%H%M%S')}",
+    ])
+    ics = _calendar(_vevent("Fireworks Show", start, extra))
+
+    starts = [datetime.fromisoformat(e["event_start_date"]) for e in collector.parse_calendar(ics, horizon_days=30)]
+
+    assert starts == [start, start + timedelta(days=2), added]
+
+
+def test_non_recurring_event_is_kept_once():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    ics = _calendar(_vevent("City Council", datetime(2020, 5, 1, 18)))
+
+    events = collector.parse_calendar(ics, horizon_days=30)
+
+    assert len(events) == 1
+    assert "recurring" not in events[0]
+
+
+def test_bad_rule_falls_back_to_single_occurrence():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    start = _tomorrow()
+    bad = "\r\n".join([
+        "BEGIN:VEVENT",
+        f"UID:{uuid.uuid4()}",
+        "SUMMARY:Garden Club",
+        f"DTSTART:{start.strftime('%Y%m%dT%H%M%SZ')}",
+        f"RRULE:FREQ=WEEKLY;UNTIL={(start + timedelta(days=60)).strftime('%Y%m%d')}",
+        "END:VEVENT",
+    ])
+    ics = _calendar(bad, _vevent("Farmers Market", start, "RRULE:FREQ=DAILY;COUNT=3"))
+
+    events = collector.parse_calendar(ics, horizon_days=30)
+
+    garden = [e for e in events if e["event_name"] == "Garden Club"]
+    assert len(garden) == 1
+    assert "recurring" not in garden[0]
+    assert len([e for e in events if e["event_name"] == "Farmers Market"]) == 3
+
+
+def test_contact_details_in_descriptions_are_redacted():
+    collector = ICSCalendarCollector(MagicMock(), uuid.uuid4())
+    ics = _calendar(_vevent("Spring Festival", _tomorrow(), "DESCRIPTION:RSVP to events@city.gov or 404-555-1234"))
+
+    events = collector.parse_calendar(ics, horizon_days=30)
+
+    assert events[0]["event_description"] == "RSVP to [REDACTED] or [REDACTED]"
+
+
+def test_store_deduplicates_expanded_instances(db):
+    client = Client(name="ICS Client")
+    db.add(client)
+    db.commit()
+    geography = Geography(name="Test City", client_id=client.id, type="CITY", state_code="GA")
+    db.add(geography)
+    db.commit()
+
+    collector = ICSCalendarCollector(db, client.id)
+    ics = _calendar(_vevent("Park Cleanup", _tomorrow(), "RRULE:FREQ=WEEKLY;COUNT=3"))
+    events = collector.parse_calendar(ics, geography_id=geography.id, horizon_days=30)
+
+    assert collector.store(events + events[:1], geography.id) == 3
+    assert collector.store(events, geography.id) == 0
+    assert db.query(DemandSignal).filter(
+        DemandSignal.geography_id == geography.id,
+        DemandSignal.signal_type == SignalType.EVENT
+    ).count() == 3
@@ -1,5 +1,8 @@
+import asyncio
 import io
+from unittest.mock import patch
 from app.models.geography import Geography
+from app.services.csv_import import CSVImportService
 
 def test_property_csv_import_rejects_pii(client, client_token, db, test_client_account):
     # Create a geography for the test
@@ -41,3 +44,87 @@ def test_property_csv_import_accepts_valid(client, client_token, db, test_client
     )
     assert res.status_code in (200, 202)
 
+def test_channels_csv_import_rejects_pii_values(client, client_token, db, test_client_account):
+    geography = Geography(
+        name="Test Geography",
+        client_id=test_client_account.id,
+        type="CITY",
+        state_code="GA"
+    )
+    db.add(geography)
+    db.commit()
+    db.refresh(geography)
+    
+    csv_data = "channel_type,name,notes\nHOA,Sunset HOA,Call the president at 404-555-1234"
+    res = client.post(
+        f"/api/v1/import/channels?geography_id={geography.id}",
+        files={"file": ("channels.csv", io.BytesIO(csv_data.encode()), "text/csv")},
+        headers={"Authorization": f"Bearer {client_token}"}
+    )
+    assert res.status_code == 400
+    assert "phone in column 'notes'" in res.json()["detail"]
+
+
+def test_duplicate_property_import_returns_previous_run(client, client_token, db, test_client_account):
+    from app.models.ingestion import IngestionRun
+    
+    geography = Geography(
+        name="Test Geography",
+        client_id=test_client_account.id,
+        type="CITY",
+        state_code="GA"
+    )
+    db.add(geography)
+    db.commit()
+    db.refresh(geography)
+    
+    csv_data = "zip_code,property_type,lot_size_sqft\n30097,SINGLE_FAMILY,12000"
+    
+    def upload():
+        return client.post(
+            f"/api/v1/import/property?geography_id={geography.id}",
+            files={"file": ("assessor.csv", io.BytesIO(csv_data.encode()), "text/csv")},
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+    
+    first = upload()
+    assert first.status_code == 200
+    db.expire_all()
+    assert db.query(IngestionRun).filter(IngestionRun.geography_id == geography.id).one().status.value == "success"
+    
+    second = upload()
+    assert second.status_code == 200
+    assert second.json()["duplicate"] is True
+    assert second.json()["ingestion_run_id"] == first.json()["ingestion_run_id"]
+    assert db.query(IngestionRun).filter(IngestionRun.geography_id == geography.id).count() == 1
+
+def test_pii_scan_runs_off_the_event_loop(client, client_token, db, test_client_account):
+    geography = Geography(
+        name="Test Geography",
+        client_id=test_client_account.id,
+        type="CITY",
+        state_code="GA"
+    )
+    db.add(geography)
+    db.commit()
+    db.refresh(geography)
+
+    original = CSVImportService.validate_csv_file
+    loops = []
+
+    def validate(self, file_ref):
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+        return original(self, file_ref)
+
+    csv_data = "zip_code,email\n30043,test@test.com"
+    with patch.object(CSVImportService, "validate_csv_file", validate):
+        res = client.post(
+            f"/api/v1/import/events?geography_id={geography.id}",
+            files={"file": ("bad.csv", io.BytesIO(csv_data.encode()), "text/csv")},
+            headers={"Authorization": f"Bearer {client_token}"}
+        )
+    assert res.status_code == 400
+    assert loops == [None]
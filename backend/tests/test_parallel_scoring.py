@@ -0,0 +1,120 @@
+"""
+Tests for process-pool household scoring
+"""
+import billiard
+from unittest.mock import patch
+import pytest
+from app.core.config import settings
+from app.models import ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services.household_cache import HouseholdCache, read_table
+from app.services.intelligence_engine import IntelligenceEngine
+from app.services import parallel_scoring
+from app.services.parallel_scoring import partition_zip_codes
+
+CATEGORIES = [ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY]
+
+
+@pytest.fixture()
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "HOUSEHOLD_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "SCORING_PARALLEL_MIN_HOUSEHOLDS", 1)
+    return tmp_path
+
+
+def _seed(seed_geography):
+    return seed_geography("Pool City", [f"3100{i}" for i in range(4)], [
+        dict(
+            zip=i % 3 if i % 7 else None,
+            ownership_type=OwnershipType.OWNER if i % 3 else OwnershipType.RENTER,
+            property_type=PropertyType.SINGLE_FAMILY if i % 2 else PropertyType.CONDO,
+            lot_size_sqft=900 * i,
+            income_band_min=8000 * i,
+            income_band_max=8000 * i + 25000,
+            property_age_years=i,
+        )
+        for i in range(1, 31)
+    ])
+
+
+def test_process_pool_matches_serial_scoring(db, test_client_account, cache_dir, seed_geography):
+    geography, zip_codes = _seed(seed_geography)
+    zip_code_ids = [z.id for z in zip_codes]
+
+    serial = IntelligenceEngine(db, processes=0).score_geography(
+        test_client_account.id, geography.id, zip_code_ids, CATEGORIES
+    )
+    parallel = IntelligenceEngine(db, processes=2).score_geography(
+        test_client_account.id, geography.id, zip_code_ids, CATEGORIES
+    )
+
+    assert parallel["count"] == serial["count"] == 30 - 4
+    assert parallel["profile_counts"] == serial["profile_counts"]
+    assert parallel["rollups"] == serial["rollups"]
+    for category in CATEGORIES:
+        assert parallel["score_sums"][category] == pytest.approx(serial["score_sums"][category])
+    # ZIP without households still gets an (empty) summary
+    assert parallel["rollups"][CATEGORIES[0]][zip_codes[3].id]["household_count"] == 0
+
+
+def test_partitions_keep_zips_whole_and_balanced(db, test_client_account, cache_dir, seed_geography):
+    geography, zip_codes = _seed(seed_geography)
+    table = HouseholdCache(db).load_table(test_client_account.id, geography)
+
+    partitions = partition_zip_codes(table, 2)
+
+    assert len(partitions) == 2
+    assert sorted(z for p in partitions for z in p) == sorted([0] + [z.id for z in zip_codes[:3]])
+    assert partition_zip_codes(table, 10) and len(partition_zip_codes(table, 10)) == 4
+
+
+def test_merged_profile_counts_match_whole_profile(db, test_client_account, seed_geography):
+    geography, _ = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+    households = engine.load_households(test_client_account.id, geography.id)
+
+    halves = [engine.buyer_profile_counts(households[:11]), engine.buyer_profile_counts(households[11:])]
+    merged = engine.buyer_profile_from_counts(engine.merge_buyer_profile_counts(halves))
+
+    assert merged == engine.generate_buyer_profile(households, ServiceCategory.LAWN_CARE)
+
+
+def test_removed_file_falls_back_to_the_parent_mapping(db, test_client_account, cache_dir, seed_geography):
+    geography, zip_codes = _seed(seed_geography)
+    zip_code_ids = [z.id for z in zip_codes]
+    serial = IntelligenceEngine(db, processes=0).score_geography(
+        test_client_account.id, geography.id, zip_code_ids, CATEGORIES
+    )
+    original = parallel_scoring.score_table_in_processes
+
+    def rebuilt_concurrently(*args):
+        # A concurrent rebuild removes the file after the parent mapped it
+        for path in cache_dir.rglob("*.arrow"):
+            path.unlink()
+        return original(*args)
+
+    with patch.object(parallel_scoring, "score_table_in_processes", rebuilt_concurrently):
+        parallel = IntelligenceEngine(db, processes=2).score_geography(
+            test_client_account.id, geography.id, zip_code_ids, CATEGORIES
+        )
+    assert parallel["rollups"] == serial["rollups"]
+
+
+def _score_in_daemon(path, zip_code_ids, results):
+    table = read_table(path)
+    results.put(parallel_scoring.score_table_in_processes(path, table, zip_code_ids, CATEGORIES, 2)["count"])
+
+
+def test_daemonic_process_can_run_the_pool(db, test_client_account, cache_dir, seed_geography):
+    # A daemonic billiard process, like a Celery prefork child
+    geography, zip_codes = _seed(seed_geography)
+    path = HouseholdCache(db).ensure_file(test_client_account.id, geography)
+    context = billiard.get_context("spawn")
+    results = context.Queue()
+
+    daemon = context.Process(target=_score_in_daemon, args=(path, [z.id for z in zip_codes], results), daemon=True)
+    daemon.start()
+    try:
+        assert results.get(timeout=60) == 30
+    finally:
+        daemon.join(timeout=10)
@@ -7,6 +7,13 @@ from app.core.pii_guard import (
     validate_csv_headers,
     check_key,
     normalize_key,
+    HeaderSchemaGuard,
+    DISALLOWED_PII_KEYS,
+    DISALLOWED_PII_KEYS_NORMALIZED,
+    find_pii_value,
+    iter_pii_values,
+    assert_no_pii_values,
+    redact_pii_values,
 )
 
 
@@ -178,7 +185,81 @@ def test_nested_personal_name_rejected():
         assert_no_pii_keys({"data": {"user": {"first_name": "John"}}})
 
 
+def test_normalized_key_set_covers_all_disallowed_keys():
+    """Test the precomputed set matches per-key normalization"""
+    assert DISALLOWED_PII_KEYS_NORMALIZED == {normalize_key(k) for k in DISALLOWED_PII_KEYS}
+    for key in DISALLOWED_PII_KEYS:
+        assert check_key(key) is True
 
 
+def test_header_schema_guard_rejects_pii_headers():
+    """Test the guard validates headers up front"""
+    with pytest.raises(ValueError, match="CSV contains disallowed PII columns"):
+        HeaderSchemaGuard(["zip_code", "Owner Name"])
+
+
+def test_header_schema_guard_fast_path():
+    """Test rows within the validated header set pass without per-key checks"""
+    guard = HeaderSchemaGuard(["zip_code", "property_type", "lot_size_sqft"])
+    
+    guard.check_row({"zip_code": "30043", "property_type": "condo", "lot_size_sqft": "5000"})
+    guard.check_row({"zip_code": "30043"})  # Empty cells dropped from the row
+
+
+def test_header_schema_guard_checks_unexpected_keys():
+    """Test rows with keys outside the header set still get checked"""
+    guard = HeaderSchemaGuard(["zip_code"])
+    
+    guard.check_row({"zip_code": "30043", "year_built": "1990"})
+    with pytest.raises(ValueError, match="Disallowed PII key detected"):
+        guard.check_row({"zip_code": "30043", "email": "test@example.com"})
+
+
+def test_find_pii_value_detects_embedded_pii():
+    """Test email, phone and SSN patterns in free text"""
+    assert find_pii_value("Contact jane.doe@example.com for details") == "email"
+    assert find_pii_value("Call (404) 555-1234 after 5pm") == "phone"
+    assert find_pii_value("Call 404-555-1234") == "phone"
+    assert find_pii_value("SSN 123-45-6789 on file") == "ssn"
+
+
+def test_find_pii_value_allows_safe_values():
+    """Test that dates, ZIPs and URLs are not flagged"""
+    for value in ["2024-07-04", "30043-1234", "30043", "360610001001", "40.7505",
+                  "https://example.com/events/summer-festival", "Active community association", None, 42]:
+        assert find_pii_value(value) is None, f"False positive on: {value}"
+
+
+def test_iter_pii_values_batch_matches_single_scan():
+    """Test the batch scanner reports the same rows as per-value checks"""
+    values = ["safe", None, "a@b.com and 404-555-1234", "safe\nline", "404-555-1234", ""] * 7
+    
+    hits = list(iter_pii_values(values, chunk_size=4))
+    
+    expected = [(i, find_pii_value(v)) for i, v in enumerate(values) if find_pii_value(v)]
+    assert hits == expected
+
+
+def test_iter_pii_values_does_not_match_across_values():
+    """Test that adjacent values can't combine into a match"""
+    assert list(iter_pii_values(["404-555", "1234"])) == []
+    assert list(iter_pii_values(["user", "@example.com"])) == []
+
+
+def test_assert_no_pii_values_rejects_notes_column():
+    """Test column scan rejects PII values without echoing them"""
+    rows = [
+        {"name": "Sunset HOA", "notes": "Active association"},
+        {"name": "ABC Management", "notes": "Ask for bob@abc.com"},
+    ]
+    with pytest.raises(ValueError, match=r"email in column 'notes' \(row 2\)") as exc_info:
+        assert_no_pii_values(rows)
+    assert "bob@abc.com" not in str(exc_info.value)
+    
+    assert_no_pii_values(rows, columns=["name"])  # Only scans requested columns
 
 
+def test_redact_pii_values():
+    """Test redaction of free text"""
+    assert redact_pii_values("Email a@b.com or call 404-555-1234") == "Email [REDACTED] or call [REDACTED]"
+    assert redact_pii_values(None) is None
@@ -0,0 +1,124 @@
+"""
+Tests for read replica routing
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from app.core import database
+from app.core.database import get_async_db, get_async_read_db, get_db, get_read_db
+from app.main import app
+from app.models import Geography
+
+
+@pytest.fixture()
+def dependency_calls(client):
+    """Wrap the DB dependency overrides to record which ones each request uses"""
+    calls = []
+    overrides = app.dependency_overrides
+
+    def record(dependency, name):
+        original = overrides[dependency]
+        if name.startswith("async"):
+            async def wrapper():
+                calls.append(name)
+                async for session in original():
+                    yield session
+        else:
+            def wrapper():
+                calls.append(name)
+                yield from original()
+        overrides[dependency] = wrapper
+
+    record(get_db, "primary")
+    record(get_read_db, "read")
+    record(get_async_db, "async_primary")
+    record(get_async_read_db, "async_read")
+    return calls
+
+
+def test_read_engine_defaults_to_primary():
+    assert database.read_engine is database.engine
+    assert database.async_read_engine is database.async_engine
+
+
+def test_lists_and_freshness_use_read_sessions(client, client_token, db, test_client_account, dependency_calls):
+    headers = {"Authorization": f"Bearer {client_token}"}
+    geography = Geography(name="Replica City", client_id=test_client_account.id, type="CITY", state_code="GA")
+    db.add(geography)
+    db.commit()
+
+    for path in [
+        "/api/v1/geography/",
+        "/api/v1/households/",
+        "/api/v1/intelligence/reports",
+        "/api/v1/channels/",
+        "/api/v1/ingestion-runs/",
+        f"/api/v1/freshness/geography/{geography.id}/freshness",
+    ]:
+        dependency_calls.clear()
+        assert client.get(path, headers=headers).status_code == 200
+        # The primary session is only used to authenticate the user
+        assert {"read", "async_read"} & set(dependency_calls), path
+        assert "async_primary" not in dependency_calls, path
+
+    dependency_calls.clear()
+    res = client.post(
+        f"/api/v1/intelligence/buyer-profile?geography_id={geography.id}",
+        headers=headers
+    )
+    assert res.status_code == 200
+    assert "read" in dependency_calls
+
+
+def test_writes_and_detail_reads_stay_on_primary(client, client_token, dependency_calls):
+    headers = {"Authorization": f"Bearer {client_token}"}
+
+    res = client.post(
+        "/api/v1/geography/",
+        json={"name": "Primary City", "type": "CITY", "state_code": "GA"},
+        headers=headers
+    )
+    assert res.status_code == 200
+    assert "read" not in dependency_calls
+
+    dependency_calls.clear()
+    assert client.get(f"/api/v1/geography/{res.json()['id']}", headers=headers).status_code == 200
+    assert dependency_calls.count("async_primary") == 1
+
+
+def test_read_url_creates_separate_engines(tmp_path: Path):
+    """Two SQLite files: DATABASE_URL for writes, DATABASE_READ_URL for reads"""
+    primary = tmp_path / "primary.db"
+    replica = tmp_path / "replica.db"
+    script = (
+        "import json\n"
+        "from app.core import database\n"
+        "print(json.dumps({\n"
+        "    'primary': database.engine.url.database,\n"
+        "    'read': database.read_engine.url.database,\n"
+        "    'async_read': database.async_read_engine.url.database,\n"
+        "    'async_driver': database.async_read_engine.url.drivername,\n"
+        "}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parent.parent,
+        env={
+            "PATH": "",
+            "DATABASE_URL": f"sqlite:///{primary}",
+            "DATABASE_READ_URL": f"sqlite:///{replica}",
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    urls = json.loads(result.stdout.strip().splitlines()[-1])
+    assert urls == {
+        "primary": str(primary),
+        "read": str(replica),
+        "async_read": str(replica),
+        "async_driver": "sqlite+aiosqlite",
+    }
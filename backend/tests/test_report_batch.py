@@ -0,0 +1,87 @@
+"""
+Tests for multi-category batch report generation
+"""
+from unittest.mock import patch
+from app.models import Geography, IntelligenceReport, ReportStatus, ServiceCategory, ZIPCode
+from app.models.household import OwnershipType, PropertyType
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def _seed(seed_geography) -> Geography:
+    geography, _ = seed_geography("Batch City", ("30601",), [
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY,
+             income_band_min=60000, income_band_max=90000),
+        dict(ownership_type=OwnershipType.RENTER, property_type=PropertyType.APARTMENT),
+    ])
+    return geography
+
+
+def test_all_categories_queue_one_task(client, auth_headers, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_batch_task") as task:
+        res = client.post(
+            "/api/v1/intelligence/reports/batch",
+            json={"geography_id": geography.id, "zip_codes": "30601", "service_categories": "all"},
+            headers=auth_headers
+        )
+
+    assert res.status_code == 202
+    assert sorted(r["service_category"] for r in res.json()) == sorted(c.value for c in ServiceCategory)
+    assert all(r["status"] == "pending" for r in res.json())
+    task.delay.assert_called_once_with([r["id"] for r in res.json()], str(test_client_account.id))
+
+
+def test_batch_scores_households_once_per_category(client, auth_headers, db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+    zip_id = db.query(ZIPCode).filter(ZIPCode.zip_code == "30601").one().id
+
+    calls = []
+    original = IntelligenceEngine.score_column_matrix
+
+    def counting(self, columns, service_categories):
+        calls.extend(category for _ in columns["zip_code_id"] for category in service_categories)
+        return original(self, columns, service_categories)
+
+    with patch.object(IntelligenceEngine, "score_column_matrix", counting):
+        res = client.post(
+            "/api/v1/intelligence/reports/batch",
+            json={
+                "geography_id": geography.id,
+                "zip_codes": "30601",
+                "service_categories": ["lawn_care", "security", "lawn_care"],
+                "report_name": "Q3",
+            },
+            headers=auth_headers
+        )
+
+    assert res.status_code == 202
+    assert [r["report_name"] for r in res.json()] == ["Q3 - lawn_care", "Q3 - security"]
+    # 2 households x 2 categories
+    assert len(calls) == 4
+
+    db.expire_all()
+    for category in (ServiceCategory.LAWN_CARE, ServiceCategory.SECURITY):
+        report = db.query(IntelligenceReport).filter(
+            IntelligenceReport.client_id == test_client_account.id,
+            IntelligenceReport.service_category == category.value
+        ).one()
+        assert report.status == ReportStatus.COMPLETED.value
+        assert report.total_households == 2
+        assert report.zip_demand_scores == engine.calculate_zip_demand_scores(
+            test_client_account.id, [zip_id], category
+        )
+
+
+def test_invalid_category_in_batch(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = client.post(
+        "/api/v1/intelligence/reports/batch",
+        json={"geography_id": geography.id, "zip_codes": "30601", "service_categories": ["lawn_care", "nope"]},
+        headers=auth_headers
+    )
+
+    assert res.status_code == 400
+    assert db.query(IntelligenceReport).count() == 0
@@ -0,0 +1,127 @@
+"""
+Tests for the report result cache
+"""
+from datetime import datetime
+from unittest.mock import patch
+from app.models import Geography, IntelligenceReport, ReportCacheEntry
+from app.models.household import OwnershipType, PropertyType
+from app.services.report_cache import report_inputs_key
+
+
+def _seed(seed_geography) -> Geography:
+    geography, _ = seed_geography("Cache City", ("30301", "30302"), [
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY)
+        for _ in range(2)
+    ])
+    return geography
+
+
+def _create(client, auth_headers, geography_id, zip_codes="30301,30302", category="lawn_care"):
+    return client.post(
+        "/api/v1/intelligence/reports",
+        json={"geography_id": geography_id, "zip_codes": zip_codes, "service_category": category},
+        headers=auth_headers
+    )
+
+
+def test_inputs_key_ignores_zip_order_and_duplicates():
+    key = report_inputs_key("c", 1, ["30302", "30301"], "lawn_care")
+    assert key == report_inputs_key("c", 1, ["30301", "30302", "30301"], "lawn_care")
+    assert key != report_inputs_key("c", 1, ["30301"], "lawn_care")
+    assert key != report_inputs_key("c", 1, ["30301", "30302"], "security")
+
+
+def test_repeat_report_is_served_from_cache(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+
+    first = _create(client, auth_headers, geography.id)
+    assert first.status_code == 202
+    assert db.query(ReportCacheEntry).count() == 1
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        second = _create(client, auth_headers, geography.id, zip_codes="30302, 30301")
+
+    task.delay.assert_not_called()
+    assert second.json()["status"] == "completed"
+    assert second.json()["progress"] == 100
+    assert second.json()["id"] != first.json()["id"]
+    cached = db.query(IntelligenceReport).filter(IntelligenceReport.id == second.json()["id"]).one()
+    computed = db.query(IntelligenceReport).filter(IntelligenceReport.id == first.json()["id"]).one()
+    assert cached.report_data == computed.report_data
+    assert cached.total_households == 2
+
+
+def test_other_category_is_not_a_hit(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+    _create(client, auth_headers, geography.id)
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        res = _create(client, auth_headers, geography.id, category="security")
+
+    assert res.json()["status"] == "pending"
+    task.delay.assert_called_once()
+
+
+def test_data_refresh_invalidates_cache(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+    _create(client, auth_headers, geography.id)
+
+    geography.census_last_refreshed_at = datetime(2030, 1, 1)
+    db.commit()
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        res = _create(client, auth_headers, geography.id)
+    assert res.json()["status"] == "pending"
+    task.delay.assert_called_once()
+
+    # Recomputing replaces the stale entry rather than adding another
+    _create(client, auth_headers, geography.id)
+    assert db.query(ReportCacheEntry).count() == 1
+
+
+def test_household_write_invalidates_cache(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+    _create(client, auth_headers, geography.id)
+
+    res = client.post(
+        "/api/v1/households/",
+        json={"geography_id": geography.id, "ownership_type": "owner"},
+        headers=auth_headers
+    )
+    assert res.status_code == 200
+
+    res = _create(client, auth_headers, geography.id, zip_codes="30301,30302")
+    db.expire_all()
+    report = db.query(IntelligenceReport).filter(IntelligenceReport.id == res.json()["id"]).one()
+    assert db.query(Geography).filter(Geography.id == geography.id).one().property_last_refreshed_at is not None
+    # Recomputed by the (eager) task rather than served from the stale entry
+    assert report.total_households == 2
+    assert res.json()["status"] == "pending"
+
+
+def test_demographic_signal_invalidates_cache(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+    _create(client, auth_headers, geography.id)
+
+    res = client.post(
+        "/api/v1/demand-signals/",
+        json={"geography_id": geography.id, "signal_type": "event", "service_category": "general"},
+        headers=auth_headers
+    )
+    assert res.status_code == 200
+    db.expire_all()
+    assert db.query(Geography).filter(Geography.id == geography.id).one().census_last_refreshed_at is None
+
+    res = client.post(
+        "/api/v1/demand-signals/",
+        json={"geography_id": geography.id, "signal_type": "demographic", "service_category": "general"},
+        headers=auth_headers
+    )
+    assert res.status_code == 200
+    db.expire_all()
+    assert db.query(Geography).filter(Geography.id == geography.id).one().census_last_refreshed_at is not None
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        res = _create(client, auth_headers, geography.id)
+    assert res.json()["status"] == "pending"
+    task.delay.assert_called_once()
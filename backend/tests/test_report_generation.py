@@ -0,0 +1,133 @@
+"""
+Tests for background intelligence report generation
+"""
+from unittest.mock import patch
+from app.models import Geography, IntelligenceReport, ReportStatus
+from app.models.household import OwnershipType, PropertyType
+from app.models.demand_signal import ServiceCategory
+from app.services.intelligence_engine import IntelligenceEngine
+from app.services.report_generator import ReportGenerator
+from app.tasks import generate_report_task
+
+
+def _seed(seed_geography) -> Geography:
+    geography, _ = seed_geography("Report City", ("30201",), [
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY, lot_size_sqft=12000)
+        for _ in range(3)
+    ])
+    return geography
+
+
+def test_create_report_returns_pending_and_task_completes_it(client, auth_headers, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        res = client.post(
+            "/api/v1/intelligence/reports",
+            json={"geography_id": geography.id, "zip_codes": "30201", "service_category": "lawn_care"},
+            headers=auth_headers
+        )
+
+    assert res.status_code == 202
+    assert res.json()["status"] == "pending"
+    assert res.json()["progress"] == 0
+    report_id = res.json()["id"]
+    task.delay.assert_called_once_with(report_id, str(test_client_account.id))
+
+    assert generate_report_task.delay(report_id, str(test_client_account.id)).result["status"] == "success"
+
+    res = client.get(f"/api/v1/intelligence/reports/{report_id}", headers=auth_headers)
+    assert res.json()["status"] == "completed"
+    assert res.json()["progress"] == 100
+    assert res.json()["total_households"] == 3
+    assert res.json()["finished_at"] is not None
+    assert res.json()["report_data"]["top_zip_codes"][0]["zip_code"] == "30201"
+    assert set(res.json()["report_data"]["stage_timings_ms"]) == {
+        "score_households", "buyer_profile", "zip_scores", "top_zip_codes", "timing", "channels"
+    }
+
+
+def test_report_is_computed_by_eager_task(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = client.post(
+        "/api/v1/intelligence/reports",
+        json={"geography_id": geography.id, "zip_codes": "30201", "service_category": "general"},
+        headers=auth_headers
+    )
+    assert res.status_code == 202
+
+    db.expire_all()
+    report = db.query(IntelligenceReport).filter(IntelligenceReport.id == res.json()["id"]).one()
+    assert report.status == ReportStatus.COMPLETED.value
+    assert report.average_demand_score is not None
+
+
+def test_failed_generation_is_recorded(db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    report = IntelligenceReport(
+        client_id=test_client_account.id,
+        geography_id=geography.id,
+        zip_codes="30201",
+        service_category="security",
+        report_name="Failing",
+    )
+    db.add(report)
+    db.commit()
+
+    with patch(
+        "app.services.intelligence_engine.IntelligenceEngine.score_zips",
+        side_effect=RuntimeError("scoring exploded")
+    ):
+        result = generate_report_task.delay(report.id, str(test_client_account.id)).result
+
+    assert result["status"] == "error"
+    db.expire_all()
+    assert report.status == ReportStatus.FAILED.value
+    assert report.error_message == "scoring exploded"
+    assert report.progress == 35
+
+
+def test_invalid_category_is_rejected_before_queuing(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+
+    with patch("app.api.v1.endpoints.intelligence.generate_report_task") as task:
+        res = client.post(
+            "/api/v1/intelligence/reports",
+            json={"geography_id": geography.id, "zip_codes": "30201", "service_category": "plumbing?"},
+            headers=auth_headers
+        )
+
+    assert res.status_code == 400
+    task.delay.assert_not_called()
+
+
+def test_pipeline_scores_each_household_once(db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    report = IntelligenceReport(
+        client_id=test_client_account.id,
+        geography_id=geography.id,
+        zip_codes="30201",
+        service_category="lawn_care",
+    )
+    db.add(report)
+    db.commit()
+
+    engine = IntelligenceEngine(db)
+    expected_zip_scores = engine.calculate_zip_demand_scores(
+        test_client_account.id, [report.geography.zip_codes[0].id], ServiceCategory.LAWN_CARE
+    )
+
+    calls = []
+    original = IntelligenceEngine.score_column_matrix
+
+    def counting(self, columns, service_categories):
+        calls.extend(columns["zip_code_id"])
+        return original(self, columns, service_categories)
+
+    with patch.object(IntelligenceEngine, "score_column_matrix", counting):
+        ReportGenerator(db).generate(report)
+
+    assert len(calls) == 3
+    assert report.zip_demand_scores == expected_zip_scores
+    assert report.average_demand_score == 90.0
@@ -0,0 +1,72 @@
+"""
+Tests for ZIP bundle scenario comparison
+"""
+from unittest.mock import patch
+from app.models import Geography
+from app.models.household import OwnershipType, PropertyType
+from app.services.demand_rollups import DemandRollupService
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def _seed(seed_geography, db) -> Geography:
+    # Security scores: owner + single family = 70, renter + single family = 25
+    geography, _ = seed_geography("Scenario City", ("30701", "30702", "30703"), [
+        dict(zip=0, ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+        dict(zip=0, ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+        dict(zip=1, ownership_type=OwnershipType.RENTER, property_type=PropertyType.SINGLE_FAMILY),
+    ])
+    DemandRollupService(db, geography.client_id).refresh_geography(geography.id)
+    return geography
+
+
+def test_scenarios_combine_zip_rollups(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography, db)
+
+    with patch.object(IntelligenceEngine, "calculate_household_demand_score", side_effect=AssertionError), \
+            patch.object(IntelligenceEngine, "score_column_matrix", side_effect=AssertionError):
+        res = client.post(
+            "/api/v1/intelligence/scenarios",
+            json={
+                "geography_id": geography.id,
+                "service_category": "security",
+                "scenarios": [
+                    {"name": "north", "zip_codes": "30701"},
+                    {"name": "north+south", "zip_codes": "30701, 30702,30701"},
+                    {"name": "empty", "zip_codes": "30703,99999"},
+                ],
+                "top_n": 1,
+            },
+            headers=auth_headers
+        )
+
+    assert res.status_code == 200
+    by_name = {s["name"]: s for s in res.json()}
+
+    assert by_name["north"]["total_households"] == 2
+    assert by_name["north"]["average_demand_score"] == 70.0
+    assert by_name["north"]["homeowner_percentage"] == 100.0
+
+    combined = by_name["north+south"]
+    assert combined["zip_codes"] == ["30701", "30702"]
+    assert combined["total_households"] == 3
+    assert combined["average_demand_score"] == 55.0
+    assert combined["homeowner_percentage"] == 66.67
+    assert [z["zip_code"] for z in combined["top_zip_codes"]] == ["30701"]
+
+    assert by_name["empty"]["total_households"] == 0
+    assert by_name["empty"]["unknown_zip_codes"] == ["99999"]
+
+
+def test_duplicate_scenario_names_rejected(client, auth_headers, db, seed_geography):
+    geography = _seed(seed_geography, db)
+
+    res = client.post(
+        "/api/v1/intelligence/scenarios",
+        json={
+            "geography_id": geography.id,
+            "service_category": "security",
+            "scenarios": [{"name": "a", "zip_codes": "30701"}, {"name": "a", "zip_codes": "30702"}],
+        },
+        headers=auth_headers
+    )
+    assert res.status_code == 400
@@ -0,0 +1,108 @@
+"""
+Tests for the household score distribution endpoint
+"""
+from unittest.mock import patch
+import numpy as np
+import pytest
+from app.models import Geography, ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def _seed(seed_geography) -> Geography:
+    # Lawn care: 100, 60, 50, 10
+    geography, _ = seed_geography("Histogram City", ("31401", "31402"), [
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY,
+             lot_size_sqft=12000, income_band_min=80000, income_band_max=90000),
+        dict(ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+        dict(ownership_type=OwnershipType.RENTER, property_type=PropertyType.SINGLE_FAMILY, lot_size_sqft=6000),
+        dict(ownership_type=OwnershipType.RENTER, property_type=PropertyType.CONDO),
+    ])
+    return geography
+
+
+def _get(client, auth_headers, geography_id, **params):
+    return client.get(
+        "/api/v1/intelligence/score-distribution",
+        params={"geography_id": geography_id, "service_category": "lawn_care", **params},
+        headers=auth_headers
+    )
+
+
+def test_histogram_and_percentiles_per_zip(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = _get(client, auth_headers, geography.id, bucket_width=20)
+
+    assert res.status_code == 200
+    first, empty = res.json()["zip_codes"]
+    assert first["zip_code"] == "31401"
+    assert first["household_count"] == 4
+    assert first["average_score"] == 55.0
+    assert [b["count"] for b in first["buckets"]] == [1, 0, 1, 1, 1]
+    assert first["buckets"][-1] == {"lower": 80, "upper": 100, "count": 1}
+    assert first["at_or_above"] == {"60": 2, "80": 1}
+
+    scores = [100, 60, 50, 10]
+    assert first["percentiles"] == {
+        f"p{q}": round(float(np.percentile(scores, q)), 2) for q in (25, 50, 75, 90)
+    }
+    assert empty["household_count"] == 0
+    assert empty["percentiles"]["p50"] is None
+    assert sum(b["count"] for b in empty["buckets"]) == 0
+
+
+def test_scan_fallback_rows(db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    zip_ids = [z.id for z in geography.zip_codes]
+
+    rows = IntelligenceEngine(db)._score_distribution_rows_from_scan(
+        test_client_account.id, zip_ids, ServiceCategory.LAWN_CARE, 20
+    )
+
+    scores = [100, 60, 50, 10]
+    assert [[float(v) for v in row] for row in rows] == [[
+        zip_ids[0], 4, 55.0, *np.percentile(scores, [25, 50, 75, 90]), 1, 0, 1, 1, 1,
+    ]]
+
+
+def test_scan_fallback_matches_database(db, test_client_account, seed_geography):
+    if db.bind.dialect.name != "postgresql":
+        pytest.skip("width_bucket/percentile_cont query is PostgreSQL-only")
+    geography = _seed(seed_geography)
+    engine = IntelligenceEngine(db)
+    zip_ids = [z.id for z in geography.zip_codes]
+
+    from_database = engine._score_distribution_rows(test_client_account.id, zip_ids, ServiceCategory.LAWN_CARE, 5)
+    from_scan = engine._score_distribution_rows_from_scan(test_client_account.id, zip_ids, ServiceCategory.LAWN_CARE, 20)
+
+    assert [[float(v) for v in row] for row in from_scan] == [[float(v) for v in row] for row in from_database]
+
+
+def test_distribution_cached_until_refresh(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+    assert _get(client, auth_headers, geography.id, zip_codes="31401").status_code == 200
+
+    with patch.object(IntelligenceEngine, "score_distribution", side_effect=AssertionError):
+        res = _get(client, auth_headers, geography.id, zip_codes="31401")
+    assert res.status_code == 200
+    assert res.json()["zip_codes"][0]["household_count"] == 4
+
+    # Household writes through the API mark the geography's property data refreshed
+    zip_id = geography.zip_codes[0].id
+    res = client.post(
+        "/api/v1/households/",
+        json={"geography_id": geography.id, "zip_code_id": zip_id, "ownership_type": "owner"},
+        headers=auth_headers
+    )
+    assert res.status_code in (200, 201)
+    res = _get(client, auth_headers, geography.id, zip_codes="31401")
+    assert res.json()["zip_codes"][0]["household_count"] == 5
+
+
+def test_invalid_distribution_parameters(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+
+    assert _get(client, auth_headers, geography.id, bucket_width=30).status_code == 400
+    assert _get(client, auth_headers, geography.id, thresholds="65").status_code == 400
+    assert _get(client, auth_headers, geography.id, service_category="nope").status_code == 400
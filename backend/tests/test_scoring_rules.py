@@ -0,0 +1,90 @@
+"""
+Tests for declarative scoring rules and their compiled forms
+"""
+import itertools
+import pytest
+from app.models import Household, ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services.intelligence_engine import IntelligenceEngine
+from app.services.scoring_rules import (
+    GENERAL_RULE, NUMPY_SCORERS, SCORING_RULES, SQL_SCORES, Factor, ScoringRule, compile_numpy, compile_sql, rule_for,
+)
+
+
+def _households():
+    grid = itertools.product(
+        [OwnershipType.OWNER, OwnershipType.RENTER, None],
+        [PropertyType.SINGLE_FAMILY, PropertyType.MULTI_FAMILY, None],
+        [None, 0, 3000, 6000, 12000],
+        [(None, None), (0, 90000), (40000, 70000), (90000, 120000)],
+        [None, 10, 20, 40],
+    )
+    return [
+        dict(
+            ownership_type=ownership,
+            property_type=property_type,
+            lot_size_sqft=lot,
+            income_band_min=income[0],
+            income_band_max=income[1],
+            property_sqft_min=2500 if i % 2 else 1500,
+            property_age_years=age,
+        )
+        for i, (ownership, property_type, lot, income, age) in enumerate(grid)
+    ]
+
+
+def test_numpy_and_sql_match_scalar_scores(db, test_client_account, seed_geography):
+    geography, _ = seed_geography("Rule City", ("31201",), _households())
+
+    engine = IntelligenceEngine(db)
+    households = db.query(Household).filter(Household.geography_id == geography.id).order_by(Household.id).all()
+    categories = list(ServiceCategory)
+    matrix = engine.score_household_matrix(households, categories)
+
+    for column, category in enumerate(categories):
+        scalar = [engine.calculate_household_demand_score(h, category) for h in households]
+        sql = [
+            float(score) for (score,) in db.query(engine.demand_score_expression(category)).filter(
+                Household.geography_id == geography.id
+            ).order_by(Household.id)
+        ]
+        assert matrix[:, column].tolist() == scalar
+        assert sql == pytest.approx(scalar)
+
+    # Database filtering agrees with in-memory filtering
+    for category in (ServiceCategory.LAWN_CARE, ServiceCategory.HVAC):
+        expected = engine.scan_households_by_geography(
+            test_client_account.id, geography.id, service_category=category, min_demand_score=60
+        )
+        filtered = engine.get_households_by_geography(
+            test_client_account.id, geography.id, service_category=category, min_demand_score=60
+        )
+        assert sorted(h.id for h in filtered) == sorted(h.id for h in expected)
+        assert 0 < len(filtered) < len(households)
+
+
+def test_registered_rule_is_used_by_every_path(db, seed_geography, monkeypatch):
+    assert rule_for(ServiceCategory.HVAC) is GENERAL_RULE
+
+    # Owners of older homes replace and service systems
+    rule = ScoringRule(factors=(
+        Factor("ownership_type", (("eq", OwnershipType.OWNER, 40.0),)),
+        Factor("property_age_years", (("gt", 15, 30.0), ("known", None, 10.0))),
+    ))
+    monkeypatch.setitem(SCORING_RULES, ServiceCategory.HVAC, rule)
+    monkeypatch.setitem(NUMPY_SCORERS, ServiceCategory.HVAC, compile_numpy(rule))
+    monkeypatch.setitem(SQL_SCORES, ServiceCategory.HVAC, compile_sql(rule))
+
+    geography, _ = seed_geography("Rule City", ("31201",), _households())
+    engine = IntelligenceEngine(db)
+    households = db.query(Household).filter(Household.geography_id == geography.id).order_by(Household.id).all()
+
+    scalar = [engine.calculate_household_demand_score(h, ServiceCategory.HVAC) for h in households]
+    sql = [
+        float(score) for (score,) in db.query(engine.demand_score_expression(ServiceCategory.HVAC)).filter(
+            Household.geography_id == geography.id
+        ).order_by(Household.id)
+    ]
+    assert engine.score_household_matrix(households, [ServiceCategory.HVAC])[:, 0].tolist() == scalar
+    assert sql == pytest.approx(scalar)
+    assert sorted(set(scalar)) == [0.0, 10.0, 30.0, 40.0, 50.0, 70.0]
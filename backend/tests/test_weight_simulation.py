@@ -0,0 +1,83 @@
+"""
+Tests for what-if scoring weight simulation
+"""
+from unittest.mock import patch
+from app.models import Geography, Household, ServiceCategory
+from app.models.household import OwnershipType, PropertyType
+from app.services.intelligence_engine import IntelligenceEngine
+
+
+def _seed(seed_geography) -> Geography:
+    # Lawn care: owner + single family = 60; renter + 6000 sq ft lot + single family = 50
+    geography, _ = seed_geography("Weight City", ("31301", "31302", "31303"), [
+        dict(zip=0, ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+        dict(zip=0, ownership_type=OwnershipType.OWNER, property_type=PropertyType.SINGLE_FAMILY),
+        dict(zip=1, ownership_type=OwnershipType.RENTER, property_type=PropertyType.SINGLE_FAMILY, lot_size_sqft=6000),
+    ])
+    return geography
+
+
+def _simulate(client, auth_headers, geography_id, settings, **extra):
+    return client.post(
+        "/api/v1/intelligence/weight-simulations",
+        json={"geography_id": geography_id, "service_category": "lawn_care", "weight_settings": settings, **extra},
+        headers=auth_headers
+    )
+
+
+def test_weights_change_scores_and_ranks(client, auth_headers, db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = _simulate(client, auth_headers, geography.id, [
+        {"name": "lots", "weights": {"lot_size_sqft": 3}},
+        {"name": "no_owners", "weights": {"ownership_type": 0, "base": 2}},
+    ])
+
+    assert res.status_code == 200
+    body = res.json()
+    assert body["features"] == ["ownership_type", "lot_size_sqft", "property_type", "avg_income", "base"]
+    lots, no_owners = body["results"]
+
+    assert [z["zip_code"] for z in lots["zip_codes"]] == ["31302", "31301", "31303"]
+    by_zip = {z["zip_code"]: z for z in lots["zip_codes"]}
+    assert by_zip["31302"] == {
+        "zip_code": "31302", "household_count": 1, "baseline_score": 50.0, "score": 90.0,
+        "delta": 40.0, "baseline_rank": 2, "rank": 1, "rank_change": 1,
+    }
+    assert by_zip["31301"]["rank_change"] == -1 and by_zip["31301"]["delta"] == 0.0
+    assert by_zip["31303"]["score"] == 0.0 and by_zip["31303"]["household_count"] == 0
+
+    assert {z["zip_code"]: z["score"] for z in no_owners["zip_codes"]} == {"31301": 20.0, "31302": 40.0, "31303": 0.0}
+
+    # Baseline matches the live ZIP scores
+    zip_ids = [z.id for z in geography.zip_codes]
+    expected = IntelligenceEngine(db).calculate_zip_demand_scores(test_client_account.id, zip_ids, ServiceCategory.LAWN_CARE)
+    assert {z["zip_code"]: z["baseline_score"] for z in lots["zip_codes"]} == expected
+
+
+def test_feature_matrix_is_cached_until_households_change(client, auth_headers, db, test_client_account, seed_geography):
+    geography = _seed(seed_geography)
+    settings = [{"name": "lots", "weights": {"lot_size_sqft": 3}}]
+    assert _simulate(client, auth_headers, geography.id, settings, zip_codes="31301").status_code == 200
+
+    with patch.object(IntelligenceEngine, "load_household_columns", side_effect=AssertionError):
+        res = _simulate(client, auth_headers, geography.id, settings, zip_codes="31301,31302")
+    assert res.status_code == 200
+    assert len(res.json()["results"][0]["zip_codes"]) == 2
+
+    db.add(Household(client_id=test_client_account.id, geography_id=geography.id,
+                     zip_code_id=geography.zip_codes[0].id, ownership_type=OwnershipType.RENTER))
+    db.commit()
+    res = _simulate(client, auth_headers, geography.id, settings, zip_codes="31301")
+    assert res.json()["results"][0]["zip_codes"][0]["household_count"] == 3
+
+
+def test_invalid_weight_settings(client, auth_headers, seed_geography):
+    geography = _seed(seed_geography)
+
+    res = _simulate(client, auth_headers, geography.id, [{"name": "x", "weights": {"pool": 2}}])
+    assert res.status_code == 400
+    assert "pool" in res.json()["detail"]
+
+    res = _simulate(client, auth_headers, geography.id, [{"name": "x", "weights": {}}, {"name": "x", "weights": {}}])
+    assert res.status_code == 400
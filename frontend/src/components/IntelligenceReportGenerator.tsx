@@ -14,6 +14,8 @@ interface Geography {
   state_code: string;
 }
 
+const REPORT_POLL_INTERVAL_MS = 1000;
+
 const SERVICE_CATEGORIES = [
   { value: 'lawn_care', label: 'Lawn Care' },
   { value: 'security', label: 'Security' },
@@ -65,9 +67,22 @@ export default function IntelligenceReportGenerator({
         report_name: reportName || undefined,
       });
 
-      setReport(response.data);
+      // Reports are computed in the background; poll until finished
+      let generated = response.data;
+      while (generated.status === 'pending' || generated.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, REPORT_POLL_INTERVAL_MS));
+        const poll = await api.get(`/api/v1/intelligence/reports/${generated.id}`);
+        generated = poll.data;
+      }
+
+      if (generated.status === 'failed') {
+        setError(generated.error_message || 'Failed to generate report');
+        return;
+      }
+
+      setReport(generated);
       if (onReportGenerated) {
-        onReportGenerated(response.data);
+        onReportGenerated(generated);
       }
     } catch (err: any) {
       setError(err.response?.data?.detail || 'Failed to generate report');
@@ -19,6 +19,8 @@ interface Report {
   service_category: string;
   report_name: string | null;
   generated_at: string;
+  status: 'pending' | 'running' | 'completed' | 'failed';
+  progress: number;
   total_households: number | null;
   target_households: number | null;
   average_demand_score: number | null;
@@ -76,7 +78,7 @@ export default function ReportsPage() {
         service_category: formData.service_category,
         report_name: formData.report_name || undefined,
       });
-      alert('Report generated successfully');
+      alert('Report queued - it will appear as completed when generation finishes');
       fetchReports();
       setFormData({
         geography_id: '',